@@ -2,7 +2,7 @@ from logging.config import fileConfig
 from src.core.db import models
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
-from src.core.db.config import SQLALCHEMY_DATABASE_URL
+from src.core.db.config import database_url
 from alembic import context
 
 
@@ -25,8 +25,11 @@ target_metadata = [models.Base.metadata]
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
-SQLALCHEMY_DATABASE_URL = str(SQLALCHEMY_DATABASE_URL).replace("%", "%%") # to avoid interpolation error (only in prod)
-config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
+SQLALCHEMY_DATABASE_URL = database_url().render_as_string(hide_password=False)
+# to avoid interpolation error (only in prod)
+config.set_main_option(
+    "sqlalchemy.url", SQLALCHEMY_DATABASE_URL.replace("%", "%%")
+)
 
 
 def run_migrations_offline():
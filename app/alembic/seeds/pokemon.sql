@@ -1,800 +0,0 @@
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bulbasaur','Grass','Poison',318,45,49,49,65,65,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ivysaur','Grass','Poison',405,60,62,63,80,80,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Venusaur','Grass','Poison',525,80,82,83,100,100,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('VenusaurMega Venusaur','Grass','Poison',625,80,100,123,122,120,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Charmander','Fire',NULL,309,39,52,43,60,50,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Charmeleon','Fire',NULL,405,58,64,58,80,65,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Charizard','Fire','Flying',534,78,84,78,109,85,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('CharizardMega Charizard X','Fire','Dragon',634,78,130,111,130,85,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('CharizardMega Charizard Y','Fire','Flying',634,78,104,78,159,115,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Squirtle','Water',NULL,314,44,48,65,50,64,43,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wartortle','Water',NULL,405,59,63,80,65,80,58,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Blastoise','Water',NULL,530,79,83,100,85,105,78,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('BlastoiseMega Blastoise','Water',NULL,630,79,103,120,135,115,78,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Caterpie','Bug',NULL,195,45,30,35,20,20,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Metapod','Bug',NULL,205,50,20,55,25,25,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Butterfree','Bug','Flying',395,60,45,50,90,80,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Weedle','Bug','Poison',195,40,35,30,20,20,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kakuna','Bug','Poison',205,45,25,50,25,25,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Beedrill','Bug','Poison',395,65,90,40,45,80,75,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('BeedrillMega Beedrill','Bug','Poison',495,65,150,40,15,80,145,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pidgey','Normal','Flying',251,40,45,40,35,35,56,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pidgeotto','Normal','Flying',349,63,60,55,50,50,71,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pidgeot','Normal','Flying',479,83,80,75,70,70,101,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PidgeotMega Pidgeot','Normal','Flying',579,83,80,80,135,80,121,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rattata','Normal',NULL,253,30,56,35,25,35,72,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Raticate','Normal',NULL,413,55,81,60,50,70,97,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spearow','Normal','Flying',262,40,60,30,31,31,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Fearow','Normal','Flying',442,65,90,65,61,61,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ekans','Poison',NULL,288,35,60,44,40,54,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Arbok','Poison',NULL,438,60,85,69,65,79,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pikachu','Electric',NULL,320,35,55,40,50,50,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Raichu','Electric',NULL,485,60,90,55,90,80,110,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sandshrew','Ground',NULL,300,50,75,85,20,30,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sandslash','Ground',NULL,450,75,100,110,45,55,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidoran♀','Poison',NULL,275,55,47,52,40,40,41,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidorina','Poison',NULL,365,70,62,67,55,55,56,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidoqueen','Poison','Ground',505,90,92,87,75,85,76,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidoran♂','Poison',NULL,273,46,57,40,40,40,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidorino','Poison',NULL,365,61,72,57,55,55,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nidoking','Poison','Ground',505,81,102,77,85,75,85,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Clefairy','Fairy',NULL,323,70,45,48,60,65,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Clefable','Fairy',NULL,483,95,70,73,95,90,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vulpix','Fire',NULL,299,38,41,40,50,65,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ninetales','Fire',NULL,505,73,76,75,81,100,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jigglypuff','Normal','Fairy',270,115,45,20,45,25,20,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wigglytuff','Normal','Fairy',435,140,70,45,85,50,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zubat','Poison','Flying',245,40,45,35,30,40,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Golbat','Poison','Flying',455,75,80,70,65,75,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Oddish','Grass','Poison',320,45,50,55,75,65,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gloom','Grass','Poison',395,60,65,70,85,75,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vileplume','Grass','Poison',490,75,80,85,110,90,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Paras','Bug','Grass',285,35,70,55,45,55,25,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Parasect','Bug','Grass',405,60,95,80,60,80,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Venonat','Bug','Poison',305,60,55,50,40,55,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Venomoth','Bug','Poison',450,70,65,60,90,75,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Diglett','Ground',NULL,265,10,55,25,35,45,95,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dugtrio','Ground',NULL,405,35,80,50,50,70,120,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Meowth','Normal',NULL,290,40,45,35,40,40,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Persian','Normal',NULL,440,65,70,60,65,65,115,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Psyduck','Water',NULL,320,50,52,48,65,50,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Golduck','Water',NULL,500,80,82,78,95,80,85,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mankey','Fighting',NULL,305,40,80,35,35,45,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Primeape','Fighting',NULL,455,65,105,60,60,70,95,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Growlithe','Fire',NULL,350,55,70,45,70,50,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Arcanine','Fire',NULL,555,90,110,80,100,80,95,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Poliwag','Water',NULL,300,40,50,40,40,40,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Poliwhirl','Water',NULL,385,65,65,65,50,50,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Poliwrath','Water','Fighting',510,90,95,95,70,90,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Abra','Psychic',NULL,310,25,20,15,105,55,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kadabra','Psychic',NULL,400,40,35,30,120,70,105,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Alakazam','Psychic',NULL,500,55,50,45,135,95,120,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AlakazamMega Alakazam','Psychic',NULL,590,55,50,65,175,95,150,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Machop','Fighting',NULL,305,70,80,50,35,35,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Machoke','Fighting',NULL,405,80,100,70,50,60,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Machamp','Fighting',NULL,505,90,130,80,65,85,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bellsprout','Grass','Poison',300,50,75,35,70,30,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Weepinbell','Grass','Poison',390,65,90,50,85,45,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Victreebel','Grass','Poison',490,80,105,65,100,70,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tentacool','Water','Poison',335,40,40,35,50,100,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tentacruel','Water','Poison',515,80,70,65,80,120,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Geodude','Rock','Ground',300,40,80,100,30,30,20,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Graveler','Rock','Ground',390,55,95,115,45,45,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Golem','Rock','Ground',495,80,120,130,55,65,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ponyta','Fire',NULL,410,50,85,55,65,65,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rapidash','Fire',NULL,500,65,100,70,80,80,105,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slowpoke','Water','Psychic',315,90,65,65,40,40,15,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slowbro','Water','Psychic',490,95,75,110,100,80,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SlowbroMega Slowbro','Water','Psychic',590,95,75,180,130,80,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magnemite','Electric','Steel',325,25,35,70,95,55,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magneton','Electric','Steel',465,50,60,95,120,70,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Farfetch''d','Normal','Flying',352,52,65,55,58,62,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Doduo','Normal','Flying',310,35,85,45,35,35,75,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dodrio','Normal','Flying',460,60,110,70,60,60,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seel','Water',NULL,325,65,45,55,45,70,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dewgong','Water','Ice',475,90,70,80,70,95,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Grimer','Poison',NULL,325,80,80,50,40,50,25,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Muk','Poison',NULL,500,105,105,75,65,100,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shellder','Water',NULL,305,30,65,100,45,25,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cloyster','Water','Ice',525,50,95,180,85,45,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gastly','Ghost','Poison',310,30,35,30,100,35,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Haunter','Ghost','Poison',405,45,50,45,115,55,95,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gengar','Ghost','Poison',500,60,65,60,130,75,110,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GengarMega Gengar','Ghost','Poison',600,60,65,80,170,95,130,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Onix','Rock','Ground',385,35,45,160,30,45,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Drowzee','Psychic',NULL,328,60,48,45,43,90,42,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hypno','Psychic',NULL,483,85,73,70,73,115,67,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Krabby','Water',NULL,325,30,105,90,25,25,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kingler','Water',NULL,475,55,130,115,50,50,75,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Voltorb','Electric',NULL,330,40,30,50,55,55,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Electrode','Electric',NULL,480,60,50,70,80,80,140,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Exeggcute','Grass','Psychic',325,60,40,80,60,45,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Exeggutor','Grass','Psychic',520,95,95,85,125,65,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cubone','Ground',NULL,320,50,50,95,40,50,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Marowak','Ground',NULL,425,60,80,110,50,80,45,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hitmonlee','Fighting',NULL,455,50,120,53,35,110,87,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hitmonchan','Fighting',NULL,455,50,105,79,35,110,76,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lickitung','Normal',NULL,385,90,55,75,60,75,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Koffing','Poison',NULL,340,40,65,95,60,45,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Weezing','Poison',NULL,490,65,90,120,85,70,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rhyhorn','Ground','Rock',345,80,85,95,30,30,25,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rhydon','Ground','Rock',485,105,130,120,45,45,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chansey','Normal',NULL,450,250,5,5,35,105,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tangela','Grass',NULL,435,65,55,115,100,40,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kangaskhan','Normal',NULL,490,105,95,80,40,80,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KangaskhanMega Kangaskhan','Normal',NULL,590,105,125,100,60,100,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Horsea','Water',NULL,295,30,40,70,70,25,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seadra','Water',NULL,440,55,65,95,95,45,85,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Goldeen','Water',NULL,320,45,67,60,35,50,63,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seaking','Water',NULL,450,80,92,65,65,80,68,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Staryu','Water',NULL,340,30,45,55,70,55,85,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Starmie','Water','Psychic',520,60,75,85,100,85,115,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mr. Mime','Psychic','Fairy',460,40,45,65,100,120,90,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scyther','Bug','Flying',500,70,110,80,55,80,105,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jynx','Ice','Psychic',455,65,50,35,115,95,95,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Electabuzz','Electric',NULL,490,65,83,57,95,85,105,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magmar','Fire',NULL,495,65,95,57,100,85,93,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pinsir','Bug',NULL,500,65,125,100,55,70,85,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PinsirMega Pinsir','Bug','Flying',600,65,155,120,65,90,105,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tauros','Normal',NULL,490,75,100,95,40,70,110,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magikarp','Water',NULL,200,20,10,55,15,20,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gyarados','Water','Flying',540,95,125,79,60,100,81,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GyaradosMega Gyarados','Water','Dark',640,95,155,109,70,130,81,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lapras','Water','Ice',535,130,85,80,85,95,60,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ditto','Normal',NULL,288,48,48,48,48,48,48,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Eevee','Normal',NULL,325,55,55,50,45,65,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vaporeon','Water',NULL,525,130,65,60,110,95,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jolteon','Electric',NULL,525,65,65,60,110,95,130,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Flareon','Fire',NULL,525,65,130,60,95,110,65,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Porygon','Normal',NULL,395,65,60,70,85,75,40,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Omanyte','Rock','Water',355,35,40,100,90,55,35,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Omastar','Rock','Water',495,70,60,125,115,70,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kabuto','Rock','Water',355,30,80,90,55,45,55,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kabutops','Rock','Water',495,60,115,105,65,70,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aerodactyl','Rock','Flying',515,80,105,65,60,75,130,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AerodactylMega Aerodactyl','Rock','Flying',615,80,135,85,70,95,150,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Snorlax','Normal',NULL,540,160,110,65,65,110,30,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Articuno','Ice','Flying',580,90,85,100,95,125,85,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zapdos','Electric','Flying',580,90,90,85,125,90,100,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Moltres','Fire','Flying',580,90,100,90,125,85,90,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dratini','Dragon',NULL,300,41,64,45,50,50,50,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dragonair','Dragon',NULL,420,61,84,65,70,70,70,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dragonite','Dragon','Flying',600,91,134,95,100,100,80,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mewtwo','Psychic',NULL,680,106,110,90,154,90,130,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MewtwoMega Mewtwo X','Psychic','Fighting',780,106,190,100,154,100,130,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MewtwoMega Mewtwo Y','Psychic',NULL,780,106,150,70,194,120,140,1,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mew','Psychic',NULL,600,100,100,100,100,100,100,1,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chikorita','Grass',NULL,318,45,49,65,49,65,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bayleef','Grass',NULL,405,60,62,80,63,80,60,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Meganium','Grass',NULL,525,80,82,100,83,100,80,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cyndaquil','Fire',NULL,309,39,52,43,60,50,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Quilava','Fire',NULL,405,58,64,58,80,65,80,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Typhlosion','Fire',NULL,534,78,84,78,109,85,100,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Totodile','Water',NULL,314,50,65,64,44,48,43,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Croconaw','Water',NULL,405,65,80,80,59,63,58,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Feraligatr','Water',NULL,530,85,105,100,79,83,78,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sentret','Normal',NULL,215,35,46,34,35,45,20,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Furret','Normal',NULL,415,85,76,64,45,55,90,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hoothoot','Normal','Flying',262,60,30,30,36,56,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Noctowl','Normal','Flying',442,100,50,50,76,96,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ledyba','Bug','Flying',265,40,20,30,40,80,55,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ledian','Bug','Flying',390,55,35,50,55,110,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spinarak','Bug','Poison',250,40,60,40,40,40,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ariados','Bug','Poison',390,70,90,70,60,60,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Crobat','Poison','Flying',535,85,90,80,70,80,130,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chinchou','Water','Electric',330,75,38,38,56,56,67,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lanturn','Water','Electric',460,125,58,58,76,76,67,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pichu','Electric',NULL,205,20,40,15,35,35,60,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cleffa','Fairy',NULL,218,50,25,28,45,55,15,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Igglybuff','Normal','Fairy',210,90,30,15,40,20,15,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Togepi','Fairy',NULL,245,35,20,65,40,65,20,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Togetic','Fairy','Flying',405,55,40,85,80,105,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Natu','Psychic','Flying',320,40,50,45,70,45,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Xatu','Psychic','Flying',470,65,75,70,95,70,95,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mareep','Electric',NULL,280,55,40,40,65,45,35,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Flaaffy','Electric',NULL,365,70,55,55,80,60,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ampharos','Electric',NULL,510,90,75,85,115,90,55,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AmpharosMega Ampharos','Electric','Dragon',610,90,95,105,165,110,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bellossom','Grass',NULL,490,75,80,95,90,100,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Marill','Water','Fairy',250,70,20,50,20,50,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Azumarill','Water','Fairy',420,100,50,80,60,80,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sudowoodo','Rock',NULL,410,70,100,115,30,65,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Politoed','Water',NULL,500,90,75,75,90,100,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hoppip','Grass','Flying',250,35,35,40,35,55,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skiploom','Grass','Flying',340,55,45,50,45,65,80,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jumpluff','Grass','Flying',460,75,55,70,55,95,110,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aipom','Normal',NULL,360,55,70,55,40,55,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sunkern','Grass',NULL,180,30,30,30,30,30,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sunflora','Grass',NULL,425,75,75,55,105,85,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Yanma','Bug','Flying',390,65,65,45,75,45,95,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wooper','Water','Ground',210,55,45,45,25,25,15,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Quagsire','Water','Ground',430,95,85,85,65,65,35,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Espeon','Psychic',NULL,525,65,65,60,130,95,110,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Umbreon','Dark',NULL,525,95,65,110,60,130,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Murkrow','Dark','Flying',405,60,85,42,85,42,91,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slowking','Water','Psychic',490,95,75,80,100,110,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Misdreavus','Ghost',NULL,435,60,60,60,85,85,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Unown','Psychic',NULL,336,48,72,48,72,48,48,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wobbuffet','Psychic',NULL,405,190,33,58,33,58,33,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Girafarig','Normal','Psychic',455,70,80,65,90,65,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pineco','Bug',NULL,290,50,65,90,35,35,15,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Forretress','Bug','Steel',465,75,90,140,60,60,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dunsparce','Normal',NULL,415,100,70,70,65,65,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gligar','Ground','Flying',430,65,75,105,35,65,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Steelix','Steel','Ground',510,75,85,200,55,65,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SteelixMega Steelix','Steel','Ground',610,75,125,230,55,95,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Snubbull','Fairy',NULL,300,60,80,50,40,40,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Granbull','Fairy',NULL,450,90,120,75,60,60,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Qwilfish','Water','Poison',430,65,95,75,55,55,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scizor','Bug','Steel',500,70,130,100,55,80,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ScizorMega Scizor','Bug','Steel',600,70,150,140,65,100,75,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shuckle','Bug','Rock',505,20,10,230,10,230,5,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Heracross','Bug','Fighting',500,80,125,75,40,95,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('HeracrossMega Heracross','Bug','Fighting',600,80,185,115,40,105,75,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sneasel','Dark','Ice',430,55,95,55,35,75,115,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Teddiursa','Normal',NULL,330,60,80,50,50,50,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ursaring','Normal',NULL,500,90,130,75,75,75,55,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slugma','Fire',NULL,250,40,40,40,70,40,20,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magcargo','Fire','Rock',410,50,50,120,80,80,30,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swinub','Ice','Ground',250,50,50,40,30,30,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Piloswine','Ice','Ground',450,100,100,80,60,60,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Corsola','Water','Rock',380,55,55,85,65,85,35,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Remoraid','Water',NULL,300,35,65,35,65,35,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Octillery','Water',NULL,480,75,105,75,105,75,45,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Delibird','Ice','Flying',330,45,55,45,65,45,75,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mantine','Water','Flying',465,65,40,70,80,140,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skarmory','Steel','Flying',465,65,80,140,40,70,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Houndour','Dark','Fire',330,45,60,30,80,50,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Houndoom','Dark','Fire',500,75,90,50,110,80,95,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('HoundoomMega Houndoom','Dark','Fire',600,75,90,90,140,90,115,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kingdra','Water','Dragon',540,75,95,95,95,95,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Phanpy','Ground',NULL,330,90,60,60,40,40,40,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Donphan','Ground',NULL,500,90,120,120,60,60,50,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Porygon2','Normal',NULL,515,85,80,90,105,95,60,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Stantler','Normal',NULL,465,73,95,62,85,65,85,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Smeargle','Normal',NULL,250,55,20,35,20,45,75,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tyrogue','Fighting',NULL,210,35,35,35,35,35,35,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hitmontop','Fighting',NULL,455,50,95,95,35,110,70,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Smoochum','Ice','Psychic',305,45,30,15,85,65,65,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Elekid','Electric',NULL,360,45,63,37,65,55,95,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magby','Fire',NULL,365,45,75,37,70,55,83,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Miltank','Normal',NULL,490,95,80,105,40,70,100,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Blissey','Normal',NULL,540,255,10,10,75,135,55,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Raikou','Electric',NULL,580,90,85,75,115,100,115,2,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Entei','Fire',NULL,580,115,115,85,90,75,100,2,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Suicune','Water',NULL,580,100,75,115,90,115,85,2,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Larvitar','Rock','Ground',300,50,64,50,45,50,41,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pupitar','Rock','Ground',410,70,84,70,65,70,51,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tyranitar','Rock','Dark',600,100,134,110,95,100,61,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('TyranitarMega Tyranitar','Rock','Dark',700,100,164,150,95,120,71,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lugia','Psychic','Flying',680,106,90,130,90,154,110,2,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ho-oh','Fire','Flying',680,106,130,90,110,154,90,2,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Celebi','Psychic','Grass',600,100,100,100,100,100,100,2,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Treecko','Grass',NULL,310,40,45,35,65,55,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Grovyle','Grass',NULL,405,50,65,45,85,65,95,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sceptile','Grass',NULL,530,70,85,65,105,85,120,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SceptileMega Sceptile','Grass','Dragon',630,70,110,75,145,85,145,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Torchic','Fire',NULL,310,45,60,40,70,50,45,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Combusken','Fire','Fighting',405,60,85,60,85,60,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Blaziken','Fire','Fighting',530,80,120,70,110,70,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('BlazikenMega Blaziken','Fire','Fighting',630,80,160,80,130,80,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mudkip','Water',NULL,310,50,70,50,50,50,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Marshtomp','Water','Ground',405,70,85,70,60,70,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swampert','Water','Ground',535,100,110,90,85,90,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SwampertMega Swampert','Water','Ground',635,100,150,110,95,110,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Poochyena','Dark',NULL,220,35,55,35,30,30,35,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mightyena','Dark',NULL,420,70,90,70,60,60,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zigzagoon','Normal',NULL,240,38,30,41,30,41,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Linoone','Normal',NULL,420,78,70,61,50,61,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wurmple','Bug',NULL,195,45,45,35,20,30,20,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Silcoon','Bug',NULL,205,50,35,55,25,25,15,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Beautifly','Bug','Flying',395,60,70,50,100,50,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cascoon','Bug',NULL,205,50,35,55,25,25,15,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dustox','Bug','Poison',385,60,50,70,50,90,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lotad','Water','Grass',220,40,30,30,40,50,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lombre','Water','Grass',340,60,50,50,60,70,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ludicolo','Water','Grass',480,80,70,70,90,100,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seedot','Grass',NULL,220,40,40,50,30,30,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nuzleaf','Grass','Dark',340,70,70,40,60,40,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shiftry','Grass','Dark',480,90,100,60,90,60,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Taillow','Normal','Flying',270,40,55,30,30,30,85,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swellow','Normal','Flying',430,60,85,60,50,50,125,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wingull','Water','Flying',270,40,30,30,55,30,85,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pelipper','Water','Flying',430,60,50,100,85,70,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ralts','Psychic','Fairy',198,28,25,25,45,35,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kirlia','Psychic','Fairy',278,38,35,35,65,55,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gardevoir','Psychic','Fairy',518,68,65,65,125,115,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GardevoirMega Gardevoir','Psychic','Fairy',618,68,85,65,165,135,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Surskit','Bug','Water',269,40,30,32,50,52,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Masquerain','Bug','Flying',414,70,60,62,80,82,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shroomish','Grass',NULL,295,60,40,60,40,60,35,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Breloom','Grass','Fighting',460,60,130,80,60,60,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slakoth','Normal',NULL,280,60,60,60,35,35,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vigoroth','Normal',NULL,440,80,80,80,55,55,90,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slaking','Normal',NULL,670,150,160,100,95,65,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nincada','Bug','Ground',266,31,45,90,30,30,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ninjask','Bug','Flying',456,61,90,45,50,50,160,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shedinja','Bug','Ghost',236,1,90,45,30,30,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Whismur','Normal',NULL,240,64,51,23,51,23,28,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Loudred','Normal',NULL,360,84,71,43,71,43,48,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Exploud','Normal',NULL,490,104,91,63,91,73,68,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Makuhita','Fighting',NULL,237,72,60,30,20,30,25,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hariyama','Fighting',NULL,474,144,120,60,40,60,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Azurill','Normal','Fairy',190,50,20,40,20,40,20,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Nosepass','Rock',NULL,375,30,45,135,45,90,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skitty','Normal',NULL,260,50,45,45,35,35,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Delcatty','Normal',NULL,380,70,65,65,55,55,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sableye','Dark','Ghost',380,50,75,75,65,65,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SableyeMega Sableye','Dark','Ghost',480,50,85,125,85,115,20,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mawile','Steel','Fairy',380,50,85,85,55,55,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MawileMega Mawile','Steel','Fairy',480,50,105,125,55,95,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aron','Steel','Rock',330,50,70,100,40,40,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lairon','Steel','Rock',430,60,90,140,50,50,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aggron','Steel','Rock',530,70,110,180,60,60,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AggronMega Aggron','Steel',NULL,630,70,140,230,60,80,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Meditite','Fighting','Psychic',280,30,40,55,40,55,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Medicham','Fighting','Psychic',410,60,60,75,60,75,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MedichamMega Medicham','Fighting','Psychic',510,60,100,85,80,85,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Electrike','Electric',NULL,295,40,45,40,65,40,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Manectric','Electric',NULL,475,70,75,60,105,60,105,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ManectricMega Manectric','Electric',NULL,575,70,75,80,135,80,135,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Plusle','Electric',NULL,405,60,50,40,85,75,95,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Minun','Electric',NULL,405,60,40,50,75,85,95,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Volbeat','Bug',NULL,400,65,73,55,47,75,85,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Illumise','Bug',NULL,400,65,47,55,73,75,85,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Roselia','Grass','Poison',400,50,60,45,100,80,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gulpin','Poison',NULL,302,70,43,53,43,53,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swalot','Poison',NULL,467,100,73,83,73,83,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Carvanha','Water','Dark',305,45,90,20,65,20,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sharpedo','Water','Dark',460,70,120,40,95,40,95,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SharpedoMega Sharpedo','Water','Dark',560,70,140,70,110,65,105,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wailmer','Water',NULL,400,130,70,35,70,35,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wailord','Water',NULL,500,170,90,45,90,45,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Numel','Fire','Ground',305,60,60,40,65,45,35,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Camerupt','Fire','Ground',460,70,100,70,105,75,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('CameruptMega Camerupt','Fire','Ground',560,70,120,100,145,105,20,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Torkoal','Fire',NULL,470,70,85,140,85,70,20,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spoink','Psychic',NULL,330,60,25,35,70,80,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Grumpig','Psychic',NULL,470,80,45,65,90,110,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spinda','Normal',NULL,360,60,60,60,60,60,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Trapinch','Ground',NULL,290,45,100,45,45,45,10,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vibrava','Ground','Dragon',340,50,70,50,50,50,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Flygon','Ground','Dragon',520,80,100,80,80,80,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cacnea','Grass',NULL,335,50,85,40,85,40,35,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cacturne','Grass','Dark',475,70,115,60,115,60,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swablu','Normal','Flying',310,45,40,60,40,75,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Altaria','Dragon','Flying',490,75,70,90,70,105,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AltariaMega Altaria','Dragon','Fairy',590,75,110,110,110,105,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zangoose','Normal',NULL,458,73,115,60,60,60,90,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seviper','Poison',NULL,458,73,100,60,100,60,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lunatone','Rock','Psychic',440,70,55,65,95,85,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Solrock','Rock','Psychic',440,70,95,85,55,65,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Barboach','Water','Ground',288,50,48,43,46,41,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Whiscash','Water','Ground',468,110,78,73,76,71,60,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Corphish','Water',NULL,308,43,80,65,50,35,35,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Crawdaunt','Water','Dark',468,63,120,85,90,55,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Baltoy','Ground','Psychic',300,40,40,55,40,70,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Claydol','Ground','Psychic',500,60,70,105,70,120,75,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lileep','Rock','Grass',355,66,41,77,61,87,23,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cradily','Rock','Grass',495,86,81,97,81,107,43,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Anorith','Rock','Bug',355,45,95,50,40,50,75,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Armaldo','Rock','Bug',495,75,125,100,70,80,45,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Feebas','Water',NULL,200,20,15,20,10,55,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Milotic','Water',NULL,540,95,60,79,100,125,81,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Castform','Normal',NULL,420,70,70,70,70,70,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kecleon','Normal',NULL,440,60,90,70,60,120,40,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shuppet','Ghost',NULL,295,44,75,35,63,33,45,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Banette','Ghost',NULL,455,64,115,65,83,63,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('BanetteMega Banette','Ghost',NULL,555,64,165,75,93,83,75,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Duskull','Ghost',NULL,295,20,40,90,30,90,25,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dusclops','Ghost',NULL,455,40,70,130,60,130,25,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tropius','Grass','Flying',460,99,68,83,72,87,51,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chimecho','Psychic',NULL,425,65,50,70,95,80,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Absol','Dark',NULL,465,65,130,60,75,60,75,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AbsolMega Absol','Dark',NULL,565,65,150,60,115,60,115,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Wynaut','Psychic',NULL,260,95,23,48,23,48,23,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Snorunt','Ice',NULL,300,50,50,50,50,50,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Glalie','Ice',NULL,480,80,80,80,80,80,80,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GlalieMega Glalie','Ice',NULL,580,80,120,80,120,80,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spheal','Ice','Water',290,70,40,50,55,50,25,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sealeo','Ice','Water',410,90,60,70,75,70,45,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Walrein','Ice','Water',530,110,80,90,95,90,65,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Clamperl','Water',NULL,345,35,64,85,74,55,32,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Huntail','Water',NULL,485,55,104,105,94,75,52,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gorebyss','Water',NULL,485,55,84,105,114,75,52,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Relicanth','Water','Rock',485,100,90,130,45,65,55,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Luvdisc','Water',NULL,330,43,30,55,40,65,97,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bagon','Dragon',NULL,300,45,75,60,40,30,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shelgon','Dragon',NULL,420,65,95,100,60,50,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Salamence','Dragon','Flying',600,95,135,80,110,80,100,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('SalamenceMega Salamence','Dragon','Flying',700,95,145,130,120,90,120,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Beldum','Steel','Psychic',300,40,55,80,35,60,30,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Metang','Steel','Psychic',420,60,75,100,55,80,50,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Metagross','Steel','Psychic',600,80,135,130,95,90,70,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MetagrossMega Metagross','Steel','Psychic',700,80,145,150,105,110,110,3,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Regirock','Rock',NULL,580,80,100,200,50,100,50,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Regice','Ice',NULL,580,80,50,100,100,200,50,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Registeel','Steel',NULL,580,80,75,150,75,150,50,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Latias','Dragon','Psychic',600,80,80,90,110,130,110,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LatiasMega Latias','Dragon','Psychic',700,80,100,120,140,150,110,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Latios','Dragon','Psychic',600,80,90,80,130,110,110,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LatiosMega Latios','Dragon','Psychic',700,80,130,100,160,120,110,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kyogre','Water',NULL,670,100,100,90,150,140,90,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KyogrePrimal Kyogre','Water',NULL,770,100,150,90,180,160,90,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Groudon','Ground',NULL,670,100,150,140,100,90,90,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GroudonPrimal Groudon','Ground','Fire',770,100,180,160,150,90,90,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rayquaza','Dragon','Flying',680,105,150,90,150,90,95,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RayquazaMega Rayquaza','Dragon','Flying',780,105,180,100,180,100,115,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jirachi','Steel','Psychic',600,100,100,100,100,100,100,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('DeoxysNormal Forme','Psychic',NULL,600,50,150,50,150,50,150,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Deoxysattack Forme','Psychic',NULL,600,50,180,20,180,20,150,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Deoxysdefense Forme','Psychic',NULL,600,50,70,160,70,160,90,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Deoxysspeed Forme','Psychic',NULL,600,50,95,90,95,90,180,3,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Turtwig','Grass',NULL,318,55,68,64,45,55,31,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Grotle','Grass',NULL,405,75,89,85,55,65,36,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Torterra','Grass','Ground',525,95,109,105,75,85,56,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chimchar','Fire',NULL,309,44,58,44,58,44,61,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Monferno','Fire','Fighting',405,64,78,52,78,52,81,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Infernape','Fire','Fighting',534,76,104,71,104,71,108,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Piplup','Water',NULL,314,53,51,53,61,56,40,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Prinplup','Water',NULL,405,64,66,68,81,76,50,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Empoleon','Water','Steel',530,84,86,88,111,101,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Starly','Normal','Flying',245,40,55,30,30,30,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Staravia','Normal','Flying',340,55,75,50,40,40,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Staraptor','Normal','Flying',485,85,120,70,50,60,100,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bidoof','Normal',NULL,250,59,45,40,35,40,31,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bibarel','Normal','Water',410,79,85,60,55,60,71,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kricketot','Bug',NULL,194,37,25,41,25,41,25,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kricketune','Bug',NULL,384,77,85,51,55,51,65,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shinx','Electric',NULL,263,45,65,34,40,34,45,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Luxio','Electric',NULL,363,60,85,49,60,49,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Luxray','Electric',NULL,523,80,120,79,95,79,70,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Budew','Grass','Poison',280,40,30,35,50,70,55,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Roserade','Grass','Poison',515,60,70,65,125,105,90,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cranidos','Rock',NULL,350,67,125,40,30,30,58,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rampardos','Rock',NULL,495,97,165,60,65,50,58,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shieldon','Rock','Steel',350,30,42,118,42,88,30,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bastiodon','Rock','Steel',495,60,52,168,47,138,30,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Burmy','Bug',NULL,224,40,29,45,29,45,36,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('WormadamPlant Cloak','Bug','Grass',424,60,59,85,79,105,36,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('WormadamSandy Cloak','Bug','Ground',424,60,79,105,59,85,36,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('WormadamTrash Cloak','Bug','Steel',424,60,69,95,69,95,36,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mothim','Bug','Flying',424,70,94,50,94,50,66,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Combee','Bug','Flying',244,30,30,42,30,42,70,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vespiquen','Bug','Flying',474,70,80,102,80,102,40,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pachirisu','Electric',NULL,405,60,45,70,45,90,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Buizel','Water',NULL,330,55,65,35,60,30,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Floatzel','Water',NULL,495,85,105,55,85,50,115,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cherubi','Grass',NULL,275,45,35,45,62,53,35,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cherrim','Grass',NULL,450,70,60,70,87,78,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shellos','Water',NULL,325,76,48,48,57,62,34,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gastrodon','Water','Ground',475,111,83,68,92,82,39,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ambipom','Normal',NULL,482,75,100,66,60,66,115,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Drifloon','Ghost','Flying',348,90,50,34,60,44,70,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Drifblim','Ghost','Flying',498,150,80,44,90,54,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Buneary','Normal',NULL,350,55,66,44,44,56,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lopunny','Normal',NULL,480,65,76,84,54,96,105,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LopunnyMega Lopunny','Normal','Fighting',580,65,136,94,54,96,135,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mismagius','Ghost',NULL,495,60,60,60,105,105,105,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Honchkrow','Dark','Flying',505,100,125,52,105,52,71,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Glameow','Normal',NULL,310,49,55,42,42,37,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Purugly','Normal',NULL,452,71,82,64,64,59,112,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chingling','Psychic',NULL,285,45,30,50,65,50,45,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Stunky','Poison','Dark',329,63,63,47,41,41,74,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skuntank','Poison','Dark',479,103,93,67,71,61,84,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bronzor','Steel','Psychic',300,57,24,86,24,86,23,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bronzong','Steel','Psychic',500,67,89,116,79,116,33,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bonsly','Rock',NULL,290,50,80,95,10,45,10,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mime Jr.','Psychic','Fairy',310,20,25,45,70,90,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Happiny','Normal',NULL,220,100,5,5,15,65,30,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chatot','Normal','Flying',411,76,65,45,92,42,91,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spiritomb','Ghost','Dark',485,50,92,108,92,108,35,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gible','Dragon','Ground',300,58,70,45,40,45,42,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gabite','Dragon','Ground',410,68,90,65,50,55,82,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Garchomp','Dragon','Ground',600,108,130,95,80,85,102,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GarchompMega Garchomp','Dragon','Ground',700,108,170,115,120,95,92,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Munchlax','Normal',NULL,390,135,85,40,40,85,5,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Riolu','Fighting',NULL,285,40,70,40,35,40,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lucario','Fighting','Steel',525,70,110,70,115,70,90,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LucarioMega Lucario','Fighting','Steel',625,70,145,88,140,70,112,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hippopotas','Ground',NULL,330,68,72,78,38,42,32,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hippowdon','Ground',NULL,525,108,112,118,68,72,47,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skorupi','Poison','Bug',330,40,50,90,30,55,65,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Drapion','Poison','Dark',500,70,90,110,60,75,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Croagunk','Poison','Fighting',300,48,61,40,61,40,50,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Toxicroak','Poison','Fighting',490,83,106,65,86,65,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Carnivine','Grass',NULL,454,74,100,72,90,72,46,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Finneon','Water',NULL,330,49,49,56,49,61,66,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lumineon','Water',NULL,460,69,69,76,69,86,91,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mantyke','Water','Flying',345,45,20,50,60,120,50,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Snover','Grass','Ice',334,60,62,50,62,60,40,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Abomasnow','Grass','Ice',494,90,92,75,92,85,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AbomasnowMega Abomasnow','Grass','Ice',594,90,132,105,132,105,30,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Weavile','Dark','Ice',510,70,120,65,45,85,125,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magnezone','Electric','Steel',535,70,70,115,130,90,60,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lickilicky','Normal',NULL,515,110,85,95,80,95,50,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rhyperior','Ground','Rock',535,115,140,130,55,55,40,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tangrowth','Grass',NULL,535,100,100,125,110,50,50,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Electivire','Electric',NULL,540,75,123,67,95,85,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Magmortar','Fire',NULL,540,75,95,67,125,95,83,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Togekiss','Fairy','Flying',545,85,50,95,120,115,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Yanmega','Bug','Flying',515,86,76,86,116,56,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Leafeon','Grass',NULL,525,65,110,130,60,65,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Glaceon','Ice',NULL,525,65,60,110,130,95,65,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gliscor','Ground','Flying',510,75,95,125,45,75,95,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mamoswine','Ice','Ground',530,110,130,80,70,60,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Porygon-Z','Normal',NULL,535,85,80,70,135,75,90,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gallade','Psychic','Fighting',518,68,125,65,65,115,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GalladeMega Gallade','Psychic','Fighting',618,68,165,95,65,115,110,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Probopass','Rock','Steel',525,60,55,145,75,150,40,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dusknoir','Ghost',NULL,525,45,100,135,65,135,45,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Froslass','Ice','Ghost',480,70,80,70,80,70,110,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rotom','Electric','Ghost',440,50,50,77,95,77,91,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RotomHeat Rotom','Electric','Fire',520,50,65,107,105,107,86,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RotomWash Rotom','Electric','Water',520,50,65,107,105,107,86,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RotomFrost Rotom','Electric','Ice',520,50,65,107,105,107,86,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RotomFan Rotom','Electric','Flying',520,50,65,107,105,107,86,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('RotomMow Rotom','Electric','Grass',520,50,65,107,105,107,86,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Uxie','Psychic',NULL,580,75,75,130,75,130,95,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mesprit','Psychic',NULL,580,80,105,105,105,105,80,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Azelf','Psychic',NULL,580,75,125,70,125,70,115,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dialga','Steel','Dragon',680,100,120,120,150,100,90,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Palkia','Water','Dragon',680,90,120,100,150,120,100,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Heatran','Fire','Steel',600,91,90,106,130,106,77,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Regigigas','Normal',NULL,670,110,160,110,80,110,100,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GiratinaAltered Forme','Ghost','Dragon',680,150,100,120,100,120,90,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GiratinaOrigin Forme','Ghost','Dragon',680,150,120,100,120,100,90,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cresselia','Psychic',NULL,600,120,70,120,75,130,85,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Phione','Water',NULL,480,80,80,80,80,80,80,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Manaphy','Water',NULL,600,100,100,100,100,100,100,4,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Darkrai','Dark',NULL,600,70,90,90,135,90,125,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ShayminLand Forme','Grass',NULL,600,100,100,100,100,100,100,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ShayminSky Forme','Grass','Flying',600,100,103,75,120,75,127,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Arceus','Normal',NULL,720,120,120,120,120,120,120,4,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Victini','Psychic','Fire',600,100,100,100,100,100,100,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Snivy','Grass',NULL,308,45,45,55,45,55,63,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Servine','Grass',NULL,413,60,60,75,60,75,83,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Serperior','Grass',NULL,528,75,75,95,75,95,113,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tepig','Fire',NULL,308,65,63,45,45,45,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pignite','Fire','Fighting',418,90,93,55,70,55,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Emboar','Fire','Fighting',528,110,123,65,100,65,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Oshawott','Water',NULL,308,55,55,45,63,45,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dewott','Water',NULL,413,75,75,60,83,60,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Samurott','Water',NULL,528,95,100,85,108,70,70,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Patrat','Normal',NULL,255,45,55,39,35,39,42,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Watchog','Normal',NULL,420,60,85,69,60,69,77,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lillipup','Normal',NULL,275,45,60,45,25,45,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Herdier','Normal',NULL,370,65,80,65,35,65,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Stoutland','Normal',NULL,500,85,110,90,45,90,80,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Purrloin','Dark',NULL,281,41,50,37,50,37,66,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Liepard','Dark',NULL,446,64,88,50,88,50,106,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pansage','Grass',NULL,316,50,53,48,53,48,64,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Simisage','Grass',NULL,498,75,98,63,98,63,101,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pansear','Fire',NULL,316,50,53,48,53,48,64,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Simisear','Fire',NULL,498,75,98,63,98,63,101,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Panpour','Water',NULL,316,50,53,48,53,48,64,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Simipour','Water',NULL,498,75,98,63,98,63,101,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Munna','Psychic',NULL,292,76,25,45,67,55,24,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Musharna','Psychic',NULL,487,116,55,85,107,95,29,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pidove','Normal','Flying',264,50,55,50,36,30,43,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tranquill','Normal','Flying',358,62,77,62,50,42,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Unfezant','Normal','Flying',488,80,115,80,65,55,93,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Blitzle','Electric',NULL,295,45,60,32,50,32,76,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zebstrika','Electric',NULL,497,75,100,63,80,63,116,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Roggenrola','Rock',NULL,280,55,75,85,25,25,15,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Boldore','Rock',NULL,390,70,105,105,50,40,20,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gigalith','Rock',NULL,515,85,135,130,60,80,25,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Woobat','Psychic','Flying',313,55,45,43,55,43,72,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swoobat','Psychic','Flying',425,67,57,55,77,55,114,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Drilbur','Ground',NULL,328,60,85,40,30,45,68,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Excadrill','Ground','Steel',508,110,135,60,50,65,88,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Audino','Normal',NULL,445,103,60,86,60,86,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AudinoMega Audino','Normal','Fairy',545,103,60,126,80,126,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Timburr','Fighting',NULL,305,75,80,55,25,35,35,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gurdurr','Fighting',NULL,405,85,105,85,40,50,40,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Conkeldurr','Fighting',NULL,505,105,140,95,55,65,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tympole','Water',NULL,294,50,50,40,50,40,64,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Palpitoad','Water','Ground',384,75,65,55,65,55,69,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Seismitoad','Water','Ground',509,105,95,75,85,75,74,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Throh','Fighting',NULL,465,120,100,85,30,85,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sawk','Fighting',NULL,465,75,125,75,30,75,85,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sewaddle','Bug','Grass',310,45,53,70,40,60,42,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swadloon','Bug','Grass',380,55,63,90,50,80,42,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Leavanny','Bug','Grass',500,75,103,80,70,80,92,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Venipede','Bug','Poison',260,30,45,59,30,39,57,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Whirlipede','Bug','Poison',360,40,55,99,40,79,47,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scolipede','Bug','Poison',485,60,100,89,55,69,112,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cottonee','Grass','Fairy',280,40,27,60,37,50,66,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Whimsicott','Grass','Fairy',480,60,67,85,77,75,116,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Petilil','Grass',NULL,280,45,35,50,70,50,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lilligant','Grass',NULL,480,70,60,75,110,75,90,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Basculin','Water',NULL,460,70,92,65,80,55,98,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sandile','Ground','Dark',292,50,72,35,35,35,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Krokorok','Ground','Dark',351,60,82,45,45,45,74,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Krookodile','Ground','Dark',519,95,117,80,65,70,92,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Darumaka','Fire',NULL,315,70,90,45,15,45,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('DarmanitanStandard Mode','Fire',NULL,480,105,140,55,30,55,95,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('DarmanitanZen Mode','Fire','Psychic',540,105,30,105,140,105,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Maractus','Grass',NULL,461,75,86,67,106,67,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dwebble','Bug','Rock',325,50,65,85,35,35,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Crustle','Bug','Rock',475,70,95,125,65,75,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scraggy','Dark','Fighting',348,50,75,70,35,70,48,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scrafty','Dark','Fighting',488,65,90,115,45,115,58,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sigilyph','Psychic','Flying',490,72,58,80,103,80,97,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Yamask','Ghost',NULL,303,38,30,85,55,65,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cofagrigus','Ghost',NULL,483,58,50,145,95,105,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tirtouga','Water','Rock',355,54,78,103,53,45,22,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Carracosta','Water','Rock',495,74,108,133,83,65,32,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Archen','Rock','Flying',401,55,112,45,74,45,70,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Archeops','Rock','Flying',567,75,140,65,112,65,110,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Trubbish','Poison',NULL,329,50,50,62,40,62,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Garbodor','Poison',NULL,474,80,95,82,60,82,75,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zorua','Dark',NULL,330,40,65,40,80,40,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zoroark','Dark',NULL,510,60,105,60,120,60,105,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Minccino','Normal',NULL,300,55,50,40,40,40,75,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cinccino','Normal',NULL,470,75,95,60,65,60,115,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gothita','Psychic',NULL,290,45,30,50,55,65,45,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gothorita','Psychic',NULL,390,60,45,70,75,85,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gothitelle','Psychic',NULL,490,70,55,95,95,110,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Solosis','Psychic',NULL,290,45,30,40,105,50,20,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Duosion','Psychic',NULL,370,65,40,50,125,60,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Reuniclus','Psychic',NULL,490,110,65,75,125,85,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ducklett','Water','Flying',305,62,44,50,44,50,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swanna','Water','Flying',473,75,87,63,87,63,98,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vanillite','Ice',NULL,305,36,50,50,65,60,44,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vanillish','Ice',NULL,395,51,65,65,80,75,59,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vanilluxe','Ice',NULL,535,71,95,85,110,95,79,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Deerling','Normal','Grass',335,60,60,50,40,50,75,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sawsbuck','Normal','Grass',475,80,100,70,60,70,95,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Emolga','Electric','Flying',428,55,75,60,75,60,103,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Karrablast','Bug',NULL,315,50,75,45,40,45,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Escavalier','Bug','Steel',495,70,135,105,60,105,20,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Foongus','Grass','Poison',294,69,55,45,55,55,15,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Amoonguss','Grass','Poison',464,114,85,70,85,80,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Frillish','Water','Ghost',335,55,40,50,65,85,40,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Jellicent','Water','Ghost',480,100,60,70,85,105,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Alomomola','Water',NULL,470,165,75,80,40,45,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Joltik','Bug','Electric',319,50,47,50,57,50,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Galvantula','Bug','Electric',472,70,77,60,97,60,108,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ferroseed','Grass','Steel',305,44,50,91,24,86,10,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Ferrothorn','Grass','Steel',489,74,94,131,54,116,20,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Klink','Steel',NULL,300,40,55,70,45,60,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Klang','Steel',NULL,440,60,80,95,70,85,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Klinklang','Steel',NULL,520,60,100,115,70,85,90,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tynamo','Electric',NULL,275,35,55,40,45,40,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Eelektrik','Electric',NULL,405,65,85,70,75,70,40,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Eelektross','Electric',NULL,515,85,115,80,105,80,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Elgyem','Psychic',NULL,335,55,55,55,85,55,30,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Beheeyem','Psychic',NULL,485,75,75,75,125,95,40,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Litwick','Ghost','Fire',275,50,30,55,65,55,20,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Lampent','Ghost','Fire',370,60,40,60,95,60,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chandelure','Ghost','Fire',520,60,55,90,145,90,80,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Axew','Dragon',NULL,320,46,87,60,30,40,57,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Fraxure','Dragon',NULL,410,66,117,70,40,50,67,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Haxorus','Dragon',NULL,540,76,147,90,60,70,97,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cubchoo','Ice',NULL,305,55,70,40,60,40,40,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Beartic','Ice',NULL,485,95,110,80,70,80,50,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cryogonal','Ice',NULL,485,70,50,30,95,135,105,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Shelmet','Bug',NULL,305,50,40,85,40,65,25,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Accelgor','Bug',NULL,495,80,70,40,100,60,145,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Stunfisk','Ground','Electric',471,109,66,84,81,99,32,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mienfoo','Fighting',NULL,350,45,85,50,55,50,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mienshao','Fighting',NULL,510,65,125,60,95,60,105,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Druddigon','Dragon',NULL,485,77,120,90,60,90,48,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Golett','Ground','Ghost',303,59,74,50,35,50,35,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Golurk','Ground','Ghost',483,89,124,80,55,80,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pawniard','Dark','Steel',340,45,85,70,40,40,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bisharp','Dark','Steel',490,65,125,100,60,70,70,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bouffalant','Normal',NULL,490,95,110,95,40,95,55,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Rufflet','Normal','Flying',350,70,83,50,37,50,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Braviary','Normal','Flying',510,100,123,75,57,75,80,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vullaby','Dark','Flying',370,70,55,75,45,65,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Mandibuzz','Dark','Flying',510,110,65,105,55,95,80,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Heatmor','Fire',NULL,484,85,97,66,105,66,65,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Durant','Bug','Steel',484,58,109,112,48,48,109,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Deino','Dark','Dragon',300,52,65,50,45,50,38,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zweilous','Dark','Dragon',420,72,85,70,65,70,58,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hydreigon','Dark','Dragon',600,92,105,90,125,90,98,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Larvesta','Bug','Fire',360,55,85,55,50,55,60,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Volcarona','Bug','Fire',550,85,60,65,135,105,100,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Cobalion','Steel','Fighting',580,91,90,129,90,72,108,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Terrakion','Rock','Fighting',580,91,129,90,72,90,108,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Virizion','Grass','Fighting',580,91,90,72,90,129,108,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('TornadusIncarnate Forme','Flying',NULL,580,79,115,70,125,80,111,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('TornadusTherian Forme','Flying',NULL,580,79,100,80,110,90,121,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ThundurusIncarnate Forme','Electric','Flying',580,79,115,70,125,80,111,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('ThundurusTherian Forme','Electric','Flying',580,79,105,70,145,80,101,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Reshiram','Dragon','Fire',680,100,120,100,150,120,90,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zekrom','Dragon','Electric',680,100,150,120,120,100,90,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LandorusIncarnate Forme','Ground','Flying',600,89,125,90,115,80,101,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('LandorusTherian Forme','Ground','Flying',600,89,145,90,105,80,91,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Kyurem','Dragon','Ice',660,125,130,90,130,90,95,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KyuremBlack Kyurem','Dragon','Ice',700,125,170,100,120,90,95,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KyuremWhite Kyurem','Dragon','Ice',700,125,120,90,170,100,95,5,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KeldeoOrdinary Forme','Water','Fighting',580,91,72,90,129,90,108,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('KeldeoResolute Forme','Water','Fighting',580,91,72,90,129,90,108,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MeloettaAria Forme','Normal','Psychic',600,100,77,77,128,128,90,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MeloettaPirouette Forme','Normal','Fighting',600,100,128,90,77,77,128,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Genesect','Bug','Steel',600,71,120,95,120,95,99,5,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chespin','Grass',NULL,313,56,61,65,48,45,38,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Quilladin','Grass',NULL,405,61,78,95,56,58,57,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Chesnaught','Grass','Fighting',530,88,107,122,74,75,64,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Fennekin','Fire',NULL,307,40,45,40,62,60,60,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Braixen','Fire',NULL,409,59,59,58,90,70,73,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Delphox','Fire','Psychic',534,75,69,72,114,100,104,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Froakie','Water',NULL,314,41,56,40,62,44,71,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Frogadier','Water',NULL,405,54,63,52,83,56,97,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Greninja','Water','Dark',530,72,95,67,103,71,122,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bunnelby','Normal',NULL,237,38,36,38,32,36,57,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Diggersby','Normal','Ground',423,85,56,77,50,77,78,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Fletchling','Normal','Flying',278,45,50,43,40,38,62,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Fletchinder','Fire','Flying',382,62,73,55,56,52,84,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Talonflame','Fire','Flying',499,78,81,71,74,69,126,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Scatterbug','Bug',NULL,200,38,35,40,27,25,35,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spewpa','Bug',NULL,213,45,22,60,27,30,29,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Vivillon','Bug','Flying',411,80,52,50,90,50,89,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Litleo','Fire','Normal',369,62,50,58,73,54,72,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pyroar','Fire','Normal',507,86,68,72,109,66,106,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Flabébé','Fairy',NULL,303,44,38,39,61,79,42,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Floette','Fairy',NULL,371,54,45,47,75,98,52,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Florges','Fairy',NULL,552,78,65,68,112,154,75,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skiddo','Grass',NULL,350,66,65,48,62,57,52,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Gogoat','Grass',NULL,531,123,100,62,97,81,68,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pancham','Fighting',NULL,348,67,82,62,46,48,43,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Pangoro','Fighting','Dark',495,95,124,78,69,71,58,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Furfrou','Normal',NULL,472,75,80,60,65,90,102,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Espurr','Psychic',NULL,355,62,48,54,63,60,68,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MeowsticMale','Psychic',NULL,466,74,48,76,83,81,104,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('MeowsticFemale','Psychic',NULL,466,74,48,76,83,81,104,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Honedge','Steel','Ghost',325,45,80,100,35,37,28,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Doublade','Steel','Ghost',448,59,110,150,45,49,35,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AegislashBlade Forme','Steel','Ghost',520,60,150,50,150,50,60,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('AegislashShield Forme','Steel','Ghost',520,60,50,150,50,150,60,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Spritzee','Fairy',NULL,341,78,52,60,63,65,23,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aromatisse','Fairy',NULL,462,101,72,72,99,89,29,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Swirlix','Fairy',NULL,341,62,48,66,59,57,49,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Slurpuff','Fairy',NULL,480,82,80,86,85,75,72,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Inkay','Dark','Psychic',288,53,54,53,37,46,45,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Malamar','Dark','Psychic',482,86,92,88,68,75,73,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Binacle','Rock','Water',306,42,52,67,39,56,50,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Barbaracle','Rock','Water',500,72,105,115,54,86,68,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Skrelp','Poison','Water',320,50,60,60,60,60,30,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dragalge','Poison','Dragon',494,65,75,90,97,123,44,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Clauncher','Water',NULL,330,50,53,62,58,63,44,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Clawitzer','Water',NULL,500,71,73,88,120,89,59,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Helioptile','Electric','Normal',289,44,38,33,61,43,70,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Heliolisk','Electric','Normal',481,62,55,52,109,94,109,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tyrunt','Rock','Dragon',362,58,89,77,45,45,48,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Tyrantrum','Rock','Dragon',521,82,121,119,69,59,71,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Amaura','Rock','Ice',362,77,59,50,67,63,46,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Aurorus','Rock','Ice',521,123,77,72,99,92,58,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sylveon','Fairy',NULL,525,95,65,65,110,130,60,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Hawlucha','Fighting','Flying',500,78,92,75,74,63,118,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Dedenne','Electric','Fairy',431,67,58,57,81,67,101,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Carbink','Rock','Fairy',500,50,50,150,50,150,50,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Goomy','Dragon',NULL,300,45,50,35,55,75,40,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Sliggoo','Dragon',NULL,452,68,75,53,83,113,60,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Goodra','Dragon',NULL,600,90,100,70,110,150,80,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Klefki','Steel','Fairy',470,57,80,91,80,87,75,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Phantump','Ghost','Grass',309,43,70,48,50,60,38,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Trevenant','Ghost','Grass',474,85,110,76,65,82,56,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PumpkabooAverage Size','Ghost','Grass',335,49,66,70,44,55,51,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PumpkabooSmall Size','Ghost','Grass',335,44,66,70,44,55,56,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PumpkabooLarge Size','Ghost','Grass',335,54,66,70,44,55,46,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('PumpkabooSuper Size','Ghost','Grass',335,59,66,70,44,55,41,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GourgeistAverage Size','Ghost','Grass',494,65,90,122,58,75,84,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GourgeistSmall Size','Ghost','Grass',494,55,85,122,58,75,99,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GourgeistLarge Size','Ghost','Grass',494,75,95,122,58,75,69,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('GourgeistSuper Size','Ghost','Grass',494,85,100,122,58,75,54,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Bergmite','Ice',NULL,304,55,69,85,32,35,28,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Avalugg','Ice',NULL,514,95,117,184,44,46,28,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Noibat','Flying','Dragon',245,40,30,35,45,40,55,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Noivern','Flying','Dragon',535,85,70,80,97,80,123,6,'False');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Xerneas','Fairy',NULL,680,126,131,95,131,98,99,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Yveltal','Dark','Flying',680,126,131,95,131,98,99,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Zygarde50% Forme','Dragon','Ground',600,108,100,121,81,95,95,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Diancie','Rock','Fairy',600,50,100,150,100,150,50,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('DiancieMega Diancie','Rock','Fairy',700,50,160,110,160,110,110,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('HoopaHoopa Confined','Psychic','Ghost',600,80,110,60,150,130,70,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('HoopaHoopa Unbound','Psychic','Dark',680,80,160,60,170,130,80,6,'True');
-INSERT INTO pokemon (name,type_1,type_2,total,hp,attack,defense,sp_atk,sp_def,speed,generation,legendary) VALUES ('Volcanion','Fire','Water',600,80,110,120,130,90,70,6,'True');
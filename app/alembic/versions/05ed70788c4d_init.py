@@ -5,13 +5,10 @@ Revises:
 Create Date: 2023-04-28 13:07:16.797750
 
 """
-import sqlalchemy
 from alembic import op
+import bcrypt
 import sqlalchemy as sa
-from sqlalchemy.orm import Session
 from src.core.config import settings
-from src.core.db import models
-from src.core.security import hash_password
 
 # revision identifiers, used by Alembic.
 revision = "05ed70788c4d"
@@ -19,6 +16,41 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Frozen with this revision; the seed must not follow later changes to the models.
+SEED_COLUMNS = [
+    "name",
+    "type_1",
+    "type_2",
+    "total",
+    "hp",
+    "attack",
+    "defense",
+    "sp_atk",
+    "sp_def",
+    "speed",
+    "generation",
+    "legendary",
+]
+
+users = sa.table(
+    "users",
+    sa.column("email", sa.String),
+    sa.column("first_name", sa.String),
+    sa.column("last_name", sa.String),
+    sa.column("password", sa.String),
+)
+
+
+def copy_seed(path: str):
+    # the file's header matches SEED_COLUMNS, empty fields are NULL
+    cursor = op.get_bind().connection.cursor()
+    with open(path, newline="") as file:
+        cursor.copy_expert(
+            f"COPY pokemon ({', '.join(SEED_COLUMNS)}) FROM STDIN "
+            "WITH (FORMAT csv, HEADER true)",
+            file,
+        )
+
 
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
@@ -49,27 +81,23 @@ def upgrade():
         sa.PrimaryKeyConstraint("id", name=op.f("pk_users")),
     )
 
-    session = Session(bind=op.get_bind())
     # do initial data migration
-    with open("alembic/seeds/pokemon.sql") as file:
-        escaped_sql = sqlalchemy.text(file.read())
-        session.execute(escaped_sql)
-
-    session.commit()
+    copy_seed("alembic/seeds/pokemon.csv")
 
     if settings().environment != "production":
         # create some users
-        users = [
-            models.User(
-                password=hash_password("12345"),
-                first_name="John",
-                last_name="Doe",
-                email="john.doe@petal.com",
-            )
-        ]
-
-        session.add_all(users)
-        session.flush()
+        password = bcrypt.hashpw(b"12345", bcrypt.gensalt()).decode("utf-8")
+        op.bulk_insert(
+            users,
+            [
+                {
+                    "password": password,
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "email": "john.doe@petal.com",
+                }
+            ],
+        )
     # ### end Alembic commands ###
 
 
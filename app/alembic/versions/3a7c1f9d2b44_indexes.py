@@ -0,0 +1,59 @@
+"""indexes for user lookup and pokemon sorting
+
+Revision ID: 3a7c1f9d2b44
+Revises: 05ed70788c4d
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3a7c1f9d2b44"
+down_revision = "05ed70788c4d"
+branch_labels = None
+depends_on = None
+
+POKEMON_SORT_COLUMNS = (
+    "name",
+    "type_1",
+    "type_2",
+    "total",
+    "hp",
+    "attack",
+    "defense",
+    "sp_atk",
+    "sp_def",
+    "speed",
+    "generation",
+)
+
+
+def upgrade():
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add a unique index on lower(users.email), resolve the duplicate "
+            f"users first: {', '.join(duplicates)}"
+        )
+
+    op.create_index(
+        "uq_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+    for column in POKEMON_SORT_COLUMNS:
+        op.create_index(f"ix_pokemon_{column}", "pokemon", [column, "id"])
+
+
+def downgrade():
+    for column in POKEMON_SORT_COLUMNS:
+        op.drop_index(f"ix_pokemon_{column}", table_name="pokemon")
+    op.drop_index("uq_users_email_lower", table_name="users")
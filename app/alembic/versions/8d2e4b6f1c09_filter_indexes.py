@@ -0,0 +1,36 @@
+"""indexes for filtered pokemon lists
+
+Revision ID: 8d2e4b6f1c09
+Revises: 3a7c1f9d2b44
+Create Date: 2026-10-18 11:02:17.904512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8d2e4b6f1c09"
+down_revision = "3a7c1f9d2b44"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_pokemon_type_1_name", "pokemon", ["type_1", "name", "id"])
+    op.create_index("ix_pokemon_type_2_name", "pokemon", ["type_2", "name", "id"])
+    op.create_index(
+        "ix_pokemon_generation_name", "pokemon", ["generation", "name", "id"]
+    )
+    op.create_index(
+        "ix_pokemon_legendary_name",
+        "pokemon",
+        ["name", "id"],
+        postgresql_where=sa.text("legendary"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_pokemon_legendary_name", table_name="pokemon")
+    op.drop_index("ix_pokemon_generation_name", table_name="pokemon")
+    op.drop_index("ix_pokemon_type_2_name", table_name="pokemon")
+    op.drop_index("ix_pokemon_type_1_name", table_name="pokemon")
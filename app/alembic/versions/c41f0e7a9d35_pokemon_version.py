@@ -0,0 +1,28 @@
+"""row version for pokemon
+
+Revision ID: c41f0e7a9d35
+Revises: 8d2e4b6f1c09
+Create Date: 2026-10-18 11:48:05.227931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c41f0e7a9d35"
+down_revision = "8d2e4b6f1c09"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "pokemon",
+        sa.Column(
+            "version", sa.Integer(), nullable=False, server_default=sa.text("1")
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("pokemon", "version")
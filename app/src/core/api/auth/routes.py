@@ -7,6 +7,7 @@ from src.core.auth import (
     create_access_token,
     create_refresh_token,
     authenticate_user,
+    user_scopes,
 )
 from src.core.db.schema import *
 
@@ -27,7 +28,9 @@ async def user_login(
     Used to authenticate user with a username and a password.
 
     """
-    user: models.User = authenticate_user(db, form_data.username, form_data.password)
+    user: models.User = await authenticate_user(
+        db, form_data.username, form_data.password
+    )
 
     if user is None:
         raise HTTPException(
@@ -38,7 +41,9 @@ async def user_login(
     # if the user has specific privileges, add scopes to token creation methods
 
     token = Token(
-        access_token=create_access_token(sub=form_data.username),
+        access_token=create_access_token(
+            sub=form_data.username, scopes=user_scopes(form_data.username)
+        ),
         refresh_token=create_refresh_token(sub=form_data.username),
         token_type="Bearer",
     )
@@ -56,5 +61,5 @@ async def refresh(access_token: AccessToken):
 
     payload = JWTBearer.verify_token(access_token.access_token)
     user = payload.get("sub")
-    access_token = create_access_token(sub=user)
+    access_token = create_access_token(sub=user, scopes=user_scopes(user))
     return AccessToken(access_token=access_token)
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, HTTPException, Response, Security
+
+from src.core.api.pokemon import similar as pokemon_similar
+from src.core.api.pokemon import snapshot as pokemon_snapshot
+from src.core.api.pokemon import stats as pokemon_stats
+from src.core.auth import get_current_user, token_cache_stats
+from src.core.db import crud, models
+from src.core.db.config import get_async_engine, get_engine
+from src.core.db.pool import pool_stats
+from src.core.db.queries import slow_queries
+from src.core.profiling import profiler
+
+internal_router = APIRouter(
+    prefix="/internal", tags=["internal"], include_in_schema=False
+)
+
+
+@internal_router.get("/db/pool", status_code=200, summary="Connection pool statistics")
+def db_pool(
+    current_user: models.User = Security(get_current_user, scopes=["admin"])
+):
+    """
+    Live statistics of the sync and async connection pools of this worker.
+    """
+    return {
+        "sync": pool_stats(get_engine().pool),
+        "async": pool_stats(get_async_engine().sync_engine.pool),
+    }
+
+
+@internal_router.get("/cache", status_code=200, summary="Cache statistics")
+def cache_stats(
+    current_user: models.User = Security(get_current_user, scopes=["admin"])
+):
+    """
+    Hit ratio, size and eviction counts of the in-process caches of this worker.
+    """
+    return {
+        "pokemon": crud.pokemon_cache.stats(),
+        "pokemon_counts": crud.pokemon_counts.stats(),
+        "pokemon_stats": pokemon_stats.summary.info(),
+        "pokemon_snapshot": pokemon_snapshot.engine.stats(),
+        "pokemon_similar": pokemon_similar.index.stats(),
+        "tokens": token_cache_stats(),
+    }
+
+
+@internal_router.get("/slow-queries", status_code=200, summary="Slow query log")
+def slow_query_log(
+    current_user: models.User = Security(get_current_user, scopes=["admin"])
+):
+    """
+    The most recent statements of this worker that took at least
+    `SLOW_QUERY_SECONDS`, newest first, with the route that ran them and the
+    types of their parameters.
+    """
+    return {
+        "threshold": slow_queries.threshold,
+        "count": slow_queries.count,
+        "queries": slow_queries.entries(),
+    }
+
+
+@internal_router.get("/profiles", status_code=200, summary="Request profiles")
+def profiles(
+    current_user: models.User = Security(get_current_user, scopes=["admin"])
+):
+    """
+    Profiles of this worker, newest first. They are taken for requests of admins
+    sending `X-Profile: 1` and for a `PROFILE_SAMPLE_RATE` fraction of all
+    requests.
+    """
+    return profiler.profiles()
+
+
+@internal_router.get("/profiles/{id}", status_code=200, summary="Request profile")
+def profile(
+    id: int,
+    current_user: models.User = Security(get_current_user, scopes=["admin"]),
+):
+    """
+    The profile as folded stacks, e.g. for flamegraph.pl or speedscope.
+    """
+    found = profiler.get(id)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(found.folded(), media_type="text/plain")
@@ -0,0 +1,55 @@
+import hashlib
+from typing import Iterable, Optional, Set
+
+from fastapi import HTTPException, Response
+
+
+def pokemon_etag(id: int, version: int) -> str:
+    return f'"{id}.{version}"'
+
+
+def list_etag(items: Iterable) -> str:
+    """
+    Strong ETag of a page, derived from the ids and versions of its rows in order.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        digest.update(f"{item.id}.{item.version};".encode("ascii"))
+    return f'"{digest.hexdigest()}"'
+
+
+def _parse(header: str) -> Set[str]:
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+def none_match(header: Optional[str], etag: str) -> bool:
+    """
+    True if an `If-None-Match` header matches ``etag`` (weak comparison).
+    """
+    if not header:
+        return False
+    tags = {tag[2:] if tag.startswith("W/") else tag for tag in _parse(header)}
+    return "*" in tags or etag in tags
+
+
+def expected_version(header: Optional[str], id: int) -> Optional[int]:
+    """
+    Version required by an `If-Match` header for pokemon ``id``; None when the
+    header is absent or `*`. Weak or foreign tags can never match and answer 412.
+    """
+    if not header or header.strip() == "*":
+        return None
+
+    for tag in _parse(header):
+        tag_id, _, version = tag.strip('"').partition(".")
+        if not tag.startswith("W/") and tag_id == str(id) and version.isdigit():
+            return int(version)
+
+    raise HTTPException(status_code=412, detail="ETag does not match")
+
+
+def not_modified(etag: str, cache_control: Optional[str], headers=None) -> Response:
+    headers = dict(headers or {}, ETag=etag)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,65 @@
+import csv
+import io
+from typing import Iterator
+
+import orjson
+from sqlalchemy import select
+
+from src.core.db import models
+from src.core.db.config import get_engine
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.pagination import with_tiebreaker
+from src.core.api.pokemon.sorting import SortSpec
+
+table = models.Pokemon.__table__
+
+EXPORT_COLUMNS = tuple(table.c)
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def export_statement(filters: PokemonFilter, sort_spec: SortSpec):
+    keys = with_tiebreaker(sort_spec.keys)
+    return (
+        select(*EXPORT_COLUMNS)
+        .where(*filters.clauses)
+        .order_by(*[c.desc() if d else c.asc() for c, d in keys])
+    )
+
+
+def _partitions(statement, batch_size: int) -> Iterator[list]:
+    # A dedicated connection, so the export neither holds the request session nor
+    # depends on when FastAPI closes it. One statement on a server-side cursor reads
+    # one snapshot; read-only repeatable read makes that explicit.
+    with get_engine().connect() as connection:
+        connection = connection.execution_options(
+            isolation_level="REPEATABLE READ",
+            stream_results=True,
+            max_row_buffer=batch_size,
+        )
+        with connection.begin():
+            connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+            result = connection.execute(statement)
+            yield from result.partitions(batch_size)
+
+
+def stream_ndjson(statement, batch_size: int) -> Iterator[bytes]:
+    for rows in _partitions(statement, batch_size):
+        yield b"".join(orjson.dumps(dict(row._mapping)) + b"\n" for row in rows)
+
+
+def stream_csv(statement, batch_size: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([c.name for c in EXPORT_COLUMNS])
+    for rows in _partitions(statement, batch_size):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # the header alone when there are no rows
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+STREAMS = {"ndjson": stream_ndjson, "csv": stream_csv}
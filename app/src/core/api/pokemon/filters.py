@@ -0,0 +1,153 @@
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+from src.core.db import models
+
+table = models.Pokemon.__table__
+
+
+class PokemonFilter(object):
+    """
+    Structured filters of the pokemon list. Conditions are combined with AND,
+    values of one list parameter with OR.
+    """
+
+    def __init__(
+        self,
+        type_1: Optional[List[str]] = None,
+        type_2: Optional[List[str]] = None,
+        generation: Optional[List[int]] = None,
+        legendary: Optional[bool] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[int], Optional[int]]]] = None,
+    ):
+        self.type_1 = type_1
+        self.type_2 = type_2
+        self.generation = generation
+        self.legendary = legendary
+        self.ranges = {k: v for k, v in (ranges or {}).items() if v != (None, None)}
+
+    @property
+    def clauses(self) -> list:
+        clauses = []
+        for column, values in (
+            (table.c.type_1, self.type_1),
+            (table.c.type_2, self.type_2),
+            (table.c.generation, self.generation),
+        ):
+            if values:
+                clauses.append(
+                    column == values[0] if len(values) == 1 else column.in_(values)
+                )
+        if self.legendary is not None:
+            clauses.append(table.c.legendary == self.legendary)
+        for name, (low, high) in sorted(self.ranges.items()):
+            if low is not None:
+                clauses.append(table.c[name] >= low)
+            if high is not None:
+                clauses.append(table.c[name] <= high)
+        return clauses
+
+    @property
+    def key(self) -> tuple:
+        """
+        Hashable identity of the filter, e.g. for caching counts per filter.
+        """
+        return (
+            tuple(sorted(self.type_1 or ())),
+            tuple(sorted(self.type_2 or ())),
+            tuple(sorted(self.generation or ())),
+            self.legendary,
+            tuple(sorted(self.ranges.items())),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.type_1
+            or self.type_2
+            or self.generation
+            or self.legendary is not None
+            or self.ranges
+        )
+
+    def apply(self, query):
+        clauses = self.clauses
+        return query.filter(*clauses) if clauses else query
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    if value is None:
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _split_ints(name: str, value: Optional[str]) -> Optional[List[int]]:
+    try:
+        return [int(v) for v in _split(value)] if value is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be a list of numbers")
+
+
+def pokemon_filter(
+    type_1: Optional[str] = Query(
+        None, alias="type1", description="Comma separated list of primary types."
+    ),
+    type_2: Optional[str] = Query(
+        None, alias="type2", description="Comma separated list of secondary types."
+    ),
+    generation: Optional[str] = Query(
+        None, description="Comma separated list of generations."
+    ),
+    legendary: Optional[bool] = Query(None),
+    total_min: Optional[int] = Query(None, alias="totalMin"),
+    total_max: Optional[int] = Query(None, alias="totalMax"),
+    hp_min: Optional[int] = Query(None, alias="hpMin"),
+    hp_max: Optional[int] = Query(None, alias="hpMax"),
+    attack_min: Optional[int] = Query(None, alias="attackMin"),
+    attack_max: Optional[int] = Query(None, alias="attackMax"),
+    defense_min: Optional[int] = Query(None, alias="defenseMin"),
+    defense_max: Optional[int] = Query(None, alias="defenseMax"),
+    sp_atk_min: Optional[int] = Query(None, alias="spAtkMin"),
+    sp_atk_max: Optional[int] = Query(None, alias="spAtkMax"),
+    sp_def_min: Optional[int] = Query(None, alias="spDefMin"),
+    sp_def_max: Optional[int] = Query(None, alias="spDefMax"),
+    speed_min: Optional[int] = Query(None, alias="speedMin"),
+    speed_max: Optional[int] = Query(None, alias="speedMax"),
+) -> PokemonFilter:
+    return PokemonFilter(
+        type_1=_split(type_1),
+        type_2=_split(type_2),
+        generation=_split_ints("generation", generation),
+        legendary=legendary,
+        ranges={
+            "total": (total_min, total_max),
+            "hp": (hp_min, hp_max),
+            "attack": (attack_min, attack_max),
+            "defense": (defense_min, defense_max),
+            "sp_atk": (sp_atk_min, sp_atk_max),
+            "sp_def": (sp_def_min, sp_def_max),
+            "speed": (speed_min, speed_max),
+        },
+    )
+
+
+def pokemon_type_filter(
+    type_1: Optional[str] = Query(
+        None, alias="type1", description="Comma separated list of primary types."
+    ),
+    type_2: Optional[str] = Query(
+        None, alias="type2", description="Comma separated list of secondary types."
+    ),
+    generation: Optional[str] = Query(
+        None, description="Comma separated list of generations."
+    ),
+) -> PokemonFilter:
+    """
+    The type and generation part of `pokemon_filter`, for endpoints that cannot
+    filter on stats.
+    """
+    return PokemonFilter(
+        type_1=_split(type_1),
+        type_2=_split(type_2),
+        generation=_split_ints("generation", generation),
+    )
@@ -0,0 +1,179 @@
+import base64
+import binascii
+import json
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, and_, false, or_
+
+from src.core.db import models
+
+# A sort key is a table column plus a flag telling whether it is sorted descending.
+SortKey = Tuple[Column, bool]
+
+
+class Page(object):
+    def __init__(self, items, page, page_size, has_next, total=None):
+        self.items = items
+        self.previous_page = None
+        self.next_page = None
+        self.has_previous = page > 0
+        if self.has_previous:
+            self.previous_page = page - 1
+        self.has_next = has_next
+        if self.has_next:
+            self.next_page = page + 1
+        self.total = total
+        self.pages = None
+        if total is not None:
+            self.pages = int(math.ceil(total / float(page_size)))
+
+
+class CursorPage(object):
+    def __init__(self, items, next_cursor: Optional[str], prev_cursor: Optional[str]):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def paginate(query, page, page_size, total=None):
+    """
+    Reads one page by offset. One extra row is fetched to tell whether a next page
+    exists, so no COUNT is needed; pass ``total`` when the caller has one.
+    """
+    if page_size <= 0:
+        raise AttributeError("page_size needs to be >= 1")
+
+    items: List[models.Pokemon] = (
+        query.limit(page_size + 1)
+        .offset((page if page > 0 else 1 - 1) * page_size)
+        .all()
+    )
+    has_next = len(items) > page_size
+    return Page(items[:page_size], page, page_size, has_next, total)
+
+
+def with_tiebreaker(keys: Sequence[SortKey]) -> List[SortKey]:
+    """
+    Appends the primary key so every row has a unique position in the ordering.
+
+    The key follows the direction of the last sort key, so a single-column sort can
+    be served by scanning a ``(column, id)`` index in either direction.
+    """
+    id_column = models.Pokemon.__table__.c.id
+    keys = list(keys)
+    if not any(column is id_column for column, _ in keys):
+        keys.append((id_column, keys[-1][1] if keys else False))
+    return keys
+
+
+def signature(keys: Sequence[SortKey]) -> str:
+    return ",".join(f"{c.name}:{'desc' if d else 'asc'}" for c, d in keys)
+
+
+def encode_cursor(keys: Sequence[SortKey], row: Any, backwards: bool) -> str:
+    state = {
+        "s": signature(keys),
+        "v": [getattr(row, column.key) for column, _ in keys],
+        "b": backwards,
+    }
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> Tuple[list, bool]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+        values, backwards = state["v"], bool(state["b"])
+        cursor_signature = state["s"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursor("Malformed cursor")
+
+    if cursor_signature != signature(keys) or len(values) != len(keys):
+        raise InvalidCursor("Cursor does not match the requested sort order")
+
+    for (column, _), value in zip(keys, values):
+        python_type = column.type.python_type
+        # bool is a subclass of int, so check it explicitly
+        if value is not None and (
+            not isinstance(value, python_type)
+            or isinstance(value, bool) != (python_type is bool)
+        ):
+            raise InvalidCursor(f"Invalid cursor value for {column.name}")
+
+    return values, backwards
+
+
+def _after(column: Column, desc: bool, value) -> Any:
+    # Postgres sorts NULLs last ascending and first descending, mirror that here
+    if not desc:
+        if value is None:
+            return false()
+        if column.nullable:
+            return or_(column > value, column.is_(None))
+        return column > value
+
+    if value is None:
+        return column.isnot(None)
+    return column < value
+
+
+def _equal(column: Column, value) -> Any:
+    if value is None:
+        return column.is_(None)
+    return column == value
+
+
+def seek(keys: Sequence[SortKey], values: Sequence) -> Any:
+    """
+    Builds the predicate for rows strictly after ``values`` in the given order,
+    i.e. the expanded form of ``(a, b, id) > (:a, :b, :id)`` with per-key directions.
+    """
+    clauses = []
+    for i, (column, desc) in enumerate(keys):
+        terms = [_equal(c, v) for (c, _), v in zip(keys[:i], values[:i])]
+        terms.append(_after(column, desc, values[i]))
+        clauses.append(and_(*terms))
+    return or_(*clauses)
+
+
+def keyset_paginate(
+    query, keys: Sequence[SortKey], cursor: Optional[str], page_size: int
+) -> CursorPage:
+    if page_size <= 0:
+        raise AttributeError("page_size needs to be >= 1")
+
+    keys = with_tiebreaker(keys)
+    backwards = False
+    if cursor:
+        values, backwards = decode_cursor(keys, cursor)
+
+    # a previous page is read by walking the reversed ordering and flipping the rows
+    order = [(column, desc != backwards) for column, desc in keys]
+    if cursor:
+        query = query.filter(seek(order, values))
+    query = query.order_by(*[c.desc() if d else c.asc() for c, d in order])
+
+    items = query.limit(page_size + 1).all()
+    has_more = len(items) > page_size
+    items = items[:page_size]
+
+    if backwards:
+        items.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, cursor is not None
+
+    next_cursor = None
+    prev_cursor = None
+    if items and has_next:
+        next_cursor = encode_cursor(keys, items[-1], backwards=False)
+    if items and has_previous:
+        prev_cursor = encode_cursor(keys, items[0], backwards=True)
+
+    return CursorPage(items, next_cursor, prev_cursor)
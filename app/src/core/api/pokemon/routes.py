@@ -1,49 +1,253 @@
+import io
 import logging
-import math
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Body, Depends, Path, Query
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Body,
+    Depends,
+    File,
+    Header,
+    Path,
+    Query,
+    Response,
+    Security,
+    UploadFile,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from src.core.auth import get_current_user
-from src.core.db import schema, crud, models
-from src.core.db.session import get_db
+from src.core.config import settings
+from src.core.db import schema, crud, async_crud, models, bulk_import
+from src.core.db.session import get_db, get_async_db
+from src.core.api.pokemon import export, serialize
+from src.core.api.pokemon import similar as pokemon_similar
+from src.core.api.pokemon import snapshot as pokemon_snapshot
+from src.core.api.pokemon import stats as pokemon_stats
+from src.core.api.pokemon.etags import (
+    expected_version,
+    list_etag,
+    none_match,
+    not_modified,
+    pokemon_etag,
+)
+from src.core.api.pokemon.pagination import (
+    InvalidCursor,
+    keyset_paginate,
+    paginate,
+    with_tiebreaker,
+)
+from src.core.api.pokemon.filters import (
+    PokemonFilter,
+    pokemon_filter,
+    pokemon_type_filter,
+)
+from src.core.api.pokemon.sorting import InvalidSort, compile_sort
 
 
 pokemon_route = APIRouter(prefix="/pokemon", tags=["pokemon"])
 
 
-def camel_to_snake(s):
-    return "".join(["_" + c.lower() if c.isupper() else c for c in s]).lstrip("_")
+def check_batch_size(items: list):
+    if not items:
+        raise HTTPException(status_code=400, detail="Empty batch")
+    if len(items) > settings().bulk_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings().bulk_max_items} items per batch",
+        )
 
 
-class Page(object):
-    def __init__(self, items, page, page_size, total):
-        self.items = items
-        self.previous_page = None
-        self.next_page = None
-        self.has_previous = page > 0
-        if self.has_previous:
-            self.previous_page = page - 1
-        previous_items = (page - 1) * page_size if page >= 1 else 0
-        self.has_next = previous_items + len(items) < total
-        if self.has_next:
-            self.next_page = page + 1
-        self.total = total
-        self.pages = int(math.ceil(total / float(page_size)))
+# The bulk routes are registered before the /{id} routes, which would otherwise
+# capture "bulk" as an id.
+@pokemon_route.post(
+    "/bulk",
+    status_code=200,
+    summary="Create many pokemon",
+    response_model=schema.BulkResult,
+)
+def create_pokemon_bulk(
+    db=Depends(get_db),
+    new_pokemon: List[schema.NewPokemon] = Body(...),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Creates all pokemon in one transaction. Invalid items are reported per index
+    with a 422 and nothing is created.
+    """
+    check_batch_size(new_pokemon)
+    rows = crud.create_pokemon_bulk(db, new_pokemon)
+    return schema.BulkResult(items=[schema.Pokemon.from_orm(r) for r in rows])
+
 
+@pokemon_route.put(
+    "/bulk",
+    status_code=200,
+    summary="Update many pokemon",
+    response_model=schema.BulkResult,
+)
+def update_pokemon_bulk(
+    db=Depends(get_db),
+    updated_pokemon: List[schema.BulkUpdatePokemon] = Body(...),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Updates all pokemon in one transaction. Ids that do not exist are reported in
+    `errors`, the other items are still applied.
+    """
+    check_batch_size(updated_pokemon)
+
+    first_index = {}
+    duplicates = []
+    for index, pokemon in enumerate(updated_pokemon):
+        if pokemon.id in first_index:
+            duplicates.append(
+                schema.BulkItemError(
+                    index=index,
+                    id=pokemon.id,
+                    detail=f"Duplicate of item {first_index[pokemon.id]}",
+                ).dict()
+            )
+        first_index.setdefault(pokemon.id, index)
+    if duplicates:
+        raise HTTPException(status_code=422, detail=duplicates)
+
+    rows = crud.update_pokemon_bulk(db, updated_pokemon)
+    updated = {row.id for row in rows}
+    return schema.BulkResult(
+        items=[schema.Pokemon.from_orm(r) for r in rows],
+        errors=[
+            schema.BulkItemError(index=index, id=p.id, detail="No pokemon found")
+            for index, p in enumerate(updated_pokemon)
+            if p.id not in updated
+        ],
+    )
 
-def paginate(query, page, page_size):
-    if page_size <= 0:
-        raise AttributeError("page_size needs to be >= 1")
 
-    items: List[models.Pokemon] = (
-        query.limit(page_size).offset((page if page > 0 else 1 - 1) * page_size).all()
+@pokemon_route.delete(
+    "/bulk",
+    status_code=200,
+    summary="Delete many pokemon",
+    response_model=schema.BulkDeleteResult,
+)
+def delete_pokemon_bulk(
+    db=Depends(get_db),
+    ids: List[int] = Body(...),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Deletes all pokemon with the given ids in one transaction. Ids that do not
+    exist are reported in `errors`.
+    """
+    check_batch_size(ids)
+    deleted = set(crud.delete_pokemon_bulk(db, list(dict.fromkeys(ids))))
+    return schema.BulkDeleteResult(
+        ids=sorted(deleted),
+        errors=[
+            schema.BulkItemError(index=index, id=id, detail="No pokemon found")
+            for index, id in enumerate(ids)
+            if id not in deleted
+        ],
+    )
+
+
+@pokemon_route.post(
+    "/import",
+    status_code=200,
+    summary="Import pokemon from a file",
+    response_model=schema.ImportResult,
+)
+def import_pokemon(
+    file: UploadFile = File(...),
+    format: str = Query("csv", regex="^(csv|parquet)$"),
+    current_user: models.User = Security(get_current_user, scopes=["admin"]),
+):
+    """
+    Loads a CSV or Parquet file with the fields of a new pokemon through COPY.
+    Rows with an `id` column value replace the pokemon with that id, other rows
+    are created. The import is all or nothing.
+    """
+    source = file.file
+    if format == "csv":
+        source = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+
+    try:
+        return bulk_import.import_pokemon(bulk_import.READERS[format](source))
+    except bulk_import.InvalidRow as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@pokemon_route.get(
+    "/stats",
+    status_code=200,
+    summary="Aggregate pokemon stats",
+    response_model=List[schema.PokemonStatsGroup],
+    response_class=ORJSONResponse,
+)
+def get_pokemon_stats(
+    db=Depends(get_db),
+    group_by: Optional[str] = Query(
+        None,
+        alias="groupBy",
+        description="Comma separated list of `type1`, `type2`, `generation` and "
+        "`legendary`. Omit it for a single group of all pokemon.",
+    ),
+    columns: Optional[str] = Query(
+        None, description="Comma separated list of stats to aggregate, all by default."
+    ),
+    stats: Optional[str] = Query(
+        None,
+        description="Comma separated list of `mean`, `min`, `max`, `std` and "
+        "percentiles such as `p50` or `p95`. Defaults to `mean,min,max`.",
+    ),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Count and aggregates of the pokemon stats, per group.
+
+    Served from an in-memory summary that follows writes, so dashboards do not
+    scan the table on every load.
+    """
+    try:
+        query = pokemon_stats.parse_query(group_by, columns, stats)
+    except pokemon_stats.InvalidStats as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ORJSONResponse(pokemon_stats.summary.stats(db, *query))
+
+
+@pokemon_route.get(
+    "/export",
+    status_code=200,
+    summary="Export pokemon",
+    response_class=StreamingResponse,
+    responses={200: {"content": {t: {} for t in export.MEDIA_TYPES.values()}}},
+)
+def export_pokemon(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$"),
+    sort: Optional[str] = Query(
+        None,
+        description="Sort data by field and sorting direction in the form of `field:direction`",
+    ),
+    filters: PokemonFilter = Depends(pokemon_filter),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Streams every pokemon matching the filters as NDJSON or CSV, read from one
+    consistent snapshot. Memory use does not depend on the size of the table.
+    """
+    try:
+        sort_spec = compile_sort(sort)
+    except InvalidSort as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    statement = export.export_statement(filters, sort_spec)
+    return StreamingResponse(
+        export.STREAMS[format](statement, settings().export_batch_size),
+        media_type=export.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="pokemon.{format}"'},
     )
-    # We remove the ordering of the query since it doesn't matter for getting a count and
-    # might have performance implications as discussed on this Flask-SqlAlchemy issue
-    # https://github.com/mitsuhiko/flask-sqlalchemy/issues/100
-    total = query.order_by(None).count()
-    return Page(items, page, page_size, total)
 
 
 @pokemon_route.get(
@@ -51,24 +255,120 @@ def paginate(query, page, page_size):
     status_code=200,
     summary="Get pokemon by ID",
     response_model=schema.Pokemon,
+    response_class=ORJSONResponse,
     responses={
         400: {"description": "Pokemon not found"},
         200: {"description": "Returns a pokemon object"},
     },
 )
-def get_pokemon_id(
-    id: int, db=Depends(get_db), current_user: models.User = Depends(get_current_user)
+async def get_pokemon_id(
+    id: int,
+    db=Depends(get_async_db),
+    fields: serialize.FieldSet = Depends(serialize.pokemon_fields),
+    if_none_match: Optional[str] = Header(None),
+    current_user: models.User = Depends(get_current_user),
 ):
     """
     Retrieve a pokemon by Pokemon ID.
+
+    Supports conditional requests: send the `ETag` of a previous response in
+    `If-None-Match` to get an empty 304 while the pokemon is unchanged.
+
+    `fields` limits the response to the listed fields.
     """
-    pokemon = crud.get_pokemon_by_id(db, id)
+    cache_control = settings().cache_control.get("pokemon_detail")
+
+    version = None
+    if if_none_match:
+        # the version comes from the table, as for If-Match on writes
+        version = await async_crud.get_pokemon_version(db, id)
+        if version is not None:
+            etag = pokemon_etag(id, version)
+            if none_match(if_none_match, etag):
+                return not_modified(etag, cache_control)
+
+    pokemon = await async_crud.get_pokemon_snapshot(db, id, version)
     if pokemon:
-        return pokemon
+        headers = {"ETag": pokemon_etag(pokemon.id, pokemon.version)}
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+        # the cache holds whole pokemon, so the projection happens here
+        content = pokemon.dict(include=None if fields.complete else fields.include)
+        return ORJSONResponse(content, headers=headers)
 
     raise HTTPException(status_code=404, detail=f"No pokemon found")
 
 
+def similar_response(db, results, fields: serialize.FieldSet) -> ORJSONResponse:
+    table = models.Pokemon.__table__
+    rows = []
+    if results:
+        ids = [id for id, _ in results]
+        query = db.query(*fields.select([table.c.id])).filter(table.c.id.in_(ids))
+        rows = query.all()
+    by_id = {row.id: fields.dict(row) for row in rows}
+    # a pokemon deleted since the index was refreshed is left out
+    return ORJSONResponse(
+        [
+            {"similarity": similarity, "pokemon": by_id[id]}
+            for id, similarity in results
+            if id in by_id
+        ]
+    )
+
+
+@pokemon_route.get(
+    "/{id}/similar",
+    status_code=200,
+    summary="Get pokemon with similar stats",
+    response_model=List[schema.SimilarPokemon],
+    response_class=ORJSONResponse,
+)
+def get_similar_pokemon(
+    id: int,
+    db=Depends(get_db),
+    k: int = Query(10, ge=1, le=100, description="Number of pokemon to return."),
+    filters: PokemonFilter = Depends(pokemon_type_filter),
+    fields: serialize.FieldSet = Depends(serialize.pokemon_fields),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    The `k` pokemon whose hp, attack, defense, sp_atk, sp_def and speed are closest
+    in proportion (cosine similarity) to those of the given pokemon, most similar
+    first, optionally limited by type and generation.
+    """
+    results = pokemon_similar.index.similar_to(db, id, k, filters or None)
+    if results is None:
+        raise HTTPException(status_code=404, detail=f"No pokemon found")
+    return similar_response(db, results, fields)
+
+
+@pokemon_route.post(
+    "/similar",
+    status_code=200,
+    summary="Get pokemon with stats similar to a vector",
+    response_model=List[schema.SimilarPokemon],
+    response_class=ORJSONResponse,
+)
+def search_similar_pokemon(
+    vector: schema.StatVector = Body(...),
+    db=Depends(get_db),
+    k: int = Query(10, ge=1, le=100, description="Number of pokemon to return."),
+    filters: PokemonFilter = Depends(pokemon_type_filter),
+    fields: serialize.FieldSet = Depends(serialize.pokemon_fields),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Like `/pokemon/{id}/similar`, for an arbitrary stat vector.
+    """
+    values = [getattr(vector, name) for name in pokemon_similar.STAT_COLUMNS]
+    try:
+        results = pokemon_similar.index.search(db, values, k, filters or None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return similar_response(db, results, fields)
+
+
 @pokemon_route.post(
     "/",
     status_code=200,
@@ -97,9 +397,7 @@ def delete_pokemon(
     """
     Deletes pokemon by ID
     """
-    pokemon = crud.get_pokemon_by_id(db, id)
-    if pokemon is not None:
-        crud.delete_pokemon(db, id)
+    if crud.delete_pokemon(db, id) is not None:
         return {}
 
     raise HTTPException(status_code=404, detail=f"No pokemon found to delete")
@@ -112,62 +410,183 @@ def delete_pokemon(
 )
 def update_pokemon(
     id: int,
+    response: Response,
     db=Depends(get_db),
     updated_pokemon: schema.UpdatePokemon = Body(...),
+    if_match: Optional[str] = Header(None),
     current_user: models.User = Depends(get_current_user),
 ):
     """
-    Update pokemon by ID
+    Update pokemon by ID.
+
+    Send the pokemon's `ETag` in `If-Match` to only apply the update if nobody
+    changed the pokemon in the meantime; otherwise the answer is 412.
     """
-    pokemon = crud.update_pokemon(db, id, updated_pokemon)
+    try:
+        pokemon = crud.update_pokemon(
+            db, id, updated_pokemon, expected_version(if_match, id)
+        )
+    except crud.StaleVersion:
+        raise HTTPException(status_code=412, detail="Pokemon was modified")
+
     if pokemon is not None:
-        crud.update_pokemon(db, id, updated_pokemon)
+        response.headers["ETag"] = pokemon_etag(id, pokemon.version)
         return {}
 
     raise HTTPException(status_code=404, detail=f"No pokemon found to delete")
 
 
+@pokemon_route.patch(
+    "/{id}",
+    status_code=200,
+    summary="Partially update pokemon",
+    response_model=schema.Pokemon,
+)
+def patch_pokemon(
+    id: int,
+    response: Response,
+    db=Depends(get_db),
+    changes: schema.PatchPokemon = Body(...),
+    if_match: Optional[str] = Header(None),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Update only the fields sent in the body and return the updated pokemon.
+
+    Honours `If-Match` like the full update.
+    """
+    values = changes.dict(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    try:
+        pokemon = crud.patch_pokemon(db, id, values, expected_version(if_match, id))
+    except crud.StaleVersion:
+        raise HTTPException(status_code=412, detail="Pokemon was modified")
+
+    if pokemon is not None:
+        response.headers["ETag"] = pokemon_etag(id, pokemon.version)
+        return pokemon
+
+    raise HTTPException(status_code=404, detail=f"No pokemon found to update")
+
+
 @pokemon_route.get(
     "/",
     summary="Get a list of pokemon",
     response_model=List[schema.Pokemon],
+    response_class=ORJSONResponse,
 )
 def get_pokemon(
     db=Depends(get_db),
-    current_page: int = Query(..., alias="page", description="Current page number."),
+    current_page: Optional[int] = Query(
+        None,
+        alias="page",
+        description="Current page number. Omit it to page with cursors instead.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor taken from the `X-Next-Cursor` or `X-Prev-Cursor` "
+        "header of a previous response. Only used when `page` is omitted.",
+    ),
     page_size: int = Query(10, alias="pageSize", description="Results per page."),
     sort: Optional[str] = Query(
         None,
         description="Sort data by field and sorting direction in the form of `field:direction`",
     ),
+    include_total: bool = Query(
+        False,
+        alias="includeTotal",
+        description="Return `X-Total-Count` and `X-Total-Pages` headers.",
+    ),
+    filters: PokemonFilter = Depends(pokemon_filter),
+    fields: serialize.FieldSet = Depends(serialize.pokemon_fields),
+    if_none_match: Optional[str] = Header(None),
     current_user: models.User = Depends(get_current_user),
 ):
     """
-    Retrieve a list of all pokemon in a paginated way
-    """
-
-    query = db.query(models.Pokemon)
+    Retrieve a list of all pokemon in a paginated way, optionally filtered by type,
+    generation, legendary status and stat ranges.
 
-    if sort is None:
-        query = query.order_by(models.Pokemon.name.asc())
-    else:
-        order_params = []
+    With `page` the list is paged by offset. Without it the list is paged by cursor:
+    the cursors for the neighbouring pages are returned in the `X-Next-Cursor` and
+    `X-Prev-Cursor` response headers, and stay stable under concurrent writes.
 
-        sort_alg = sort.split(",")
+    `X-Has-Next` is always set. Totals are only computed on request and may lag
+    writes from other workers by a few seconds.
 
-        sort = [
-            {"field": s[0], "direction": s[1]} for s in [s.split(":") for s in sort_alg]
-        ]
-
-        for search_results in sort:
-            field_name = camel_to_snake(search_results.get("field"))
-            direction = search_results.get("direction")
-            r = eval(f"models.Pokemon.{field_name}.{direction}()")
-            order_params.append(r)
+    Every page carries an `ETag`; with a matching `If-None-Match` the answer is an
+    empty 304 and only the ids and versions of the page are read.
 
-        if len(order_params) > 0:
-            query = query.order_by(*order_params)
-
-    data = paginate(query, current_page, page_size)
+    `fields` limits the response, and the columns read, to the listed fields.
+    """
 
-    return data.items
+    try:
+        sort_spec = compile_sort(sort)
+    except InvalidSort as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # ETags need id and version, cursors the sort columns, whatever `fields` says
+    table = models.Pokemon.__table__
+    required = [table.c.id, table.c.version]
+    for column, _ in with_tiebreaker(sort_spec.keys):
+        if not any(column is c for c in required):
+            required.append(column)
+    query = filters.apply(db.query(*fields.select(required)))
+    headers = {}
+
+    # with the snapshot enabled and fresh, the page is read from memory
+    snapshot = None
+    if settings().pokemon_snapshot:
+        snapshot = pokemon_snapshot.engine.current()
+
+    total = None
+    if include_total:
+        if snapshot is not None:
+            total = snapshot.count(filters)
+        else:
+            key = filters.key if filters else "*"
+            total = crud.count_pokemon(db, filters.clauses, key)
+        headers["X-Total-Count"] = str(total)
+        headers["X-Total-Pages"] = str(-(-total // max(page_size, 1)))
+
+    cache_control = settings().cache_control.get("pokemon_list")
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    def read_page(query):
+        try:
+            data = None
+            if snapshot is not None:
+                data = pokemon_snapshot.engine.read_page(
+                    snapshot, filters, sort_spec, current_page, cursor, page_size, total
+                )
+            if data is None and current_page is None:
+                data = keyset_paginate(query, sort_spec.keys, cursor, page_size)
+            elif data is None:
+                query = query.order_by(*sort_spec.order_by)
+                data = paginate(query, current_page, page_size, total)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if current_page is None:
+            headers["X-Has-Next"] = str(data.next_cursor is not None).lower()
+            if data.next_cursor:
+                headers["X-Next-Cursor"] = data.next_cursor
+            if data.prev_cursor:
+                headers["X-Prev-Cursor"] = data.prev_cursor
+        else:
+            headers["X-Has-Next"] = str(data.has_next).lower()
+        return data.items
+
+    if if_none_match and snapshot is None:
+        # read only what the ETag and the cursors need, the rows are loaded on a miss
+        etag = list_etag(read_page(query.with_entities(*required)))
+        if none_match(if_none_match, etag):
+            return not_modified(etag, cache_control, headers)
+
+    items = read_page(query)
+    headers["ETag"] = list_etag(items)
+    if snapshot is not None and none_match(if_none_match, headers["ETag"]):
+        return not_modified(headers.pop("ETag"), cache_control, headers)
+    return ORJSONResponse(fields.dicts(items), headers=headers)
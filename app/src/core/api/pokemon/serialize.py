@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Column
+
+from src.core.db import models
+from src.core.api.pokemon.sorting import snake_to_camel
+
+# Read endpoints select these columns as plain rows instead of ORM entities. The
+# rows come straight from the database, so they are turned into dicts and encoded
+# with orjson without validating them through schema.Pokemon again.
+COLUMNS = tuple(models.Pokemon.__table__.c)
+
+# `fields` accepts the snake_case column names and their camelCase spelling
+FIELD_NAMES: Dict[str, str] = {}
+for _column in COLUMNS:
+    FIELD_NAMES[_column.name] = _column.name
+    FIELD_NAMES[snake_to_camel(_column.name)] = _column.name
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+class FieldSet(object):
+    """
+    The columns a response is limited to, in table order.
+    """
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+        self.include = frozenset(names)
+        self.columns = tuple(c for c in COLUMNS if c.name in self.include)
+        self.complete = len(self.columns) == len(COLUMNS)
+
+    def select(self, required: Sequence[Column]) -> Tuple[Column, ...]:
+        """
+        Columns to query: the requested ones plus ``required`` (e.g. what ETags
+        and cursors are computed from), which are left out of the response.
+        """
+        return self.columns + tuple(c for c in required if c.name not in self.include)
+
+    def dict(self, row: Any) -> Dict[str, Any]:
+        mapping = row._mapping
+        data = {name: mapping[name] for name in self.names}
+        # schema.Pokemon defaults legendary to False, rows may hold NULL
+        if data.get("legendary", False) is None:
+            data["legendary"] = False
+        return data
+
+    def dicts(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        return [self.dict(row) for row in rows]
+
+
+ALL_FIELDS = FieldSet(tuple(c.name for c in COLUMNS))
+
+
+@lru_cache(maxsize=256)
+def compile_fields(fields: Optional[str]) -> FieldSet:
+    """
+    Parses a `fields` parameter such as ``"id,name,type1"``. Field sets are built
+    once per distinct parameter value.
+    """
+    if fields is None:
+        return ALL_FIELDS
+
+    requested = set()
+    for part in fields.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part not in FIELD_NAMES:
+            raise InvalidFields(f"Unknown field: {part!r}")
+        requested.add(FIELD_NAMES[part])
+    if not requested:
+        raise InvalidFields("No fields requested")
+
+    return FieldSet(tuple(c.name for c in COLUMNS if c.name in requested))
+
+
+def pokemon_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated list of the fields to return, all by default.",
+    )
+) -> FieldSet:
+    try:
+        return compile_fields(fields)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
@@ -0,0 +1,275 @@
+"""
+Nearest-neighbour search over pokemon stat vectors.
+
+Every worker keeps the stat vectors (hp, attack, defense, sp_atk, sp_def, speed)
+of all pokemon as rows of a float32 matrix scaled to unit length, so the cosine
+similarity to a query is one matrix-vector product. The best ``k`` are picked
+with ``argpartition`` and only those are sorted.
+
+Like the stats summary, writes mark ids dirty through ``crud.on_pokemon_change``
+and the next search patches just those rows in place. Deleted rows are masked
+out until the next full reload.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.db import crud, models
+from src.core.api.pokemon.filters import PokemonFilter
+
+table = models.Pokemon.__table__
+
+STAT_COLUMNS = ("hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+# the layout of the rows StatVectors is built from
+COLUMNS = ("id",) + STAT_COLUMNS + ("type_1", "type_2", "generation")
+
+ARRAYS = ("ids", "vectors", "valid", "type_1", "type_2", "generation")
+
+
+def normalize(vectors) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Scales rows to unit length. Returns them and a mask of the rows that can be
+    compared, i.e. without NULL stats and not all zero.
+    """
+    vectors = numpy.atleast_2d(numpy.asarray(vectors, dtype=numpy.float64))
+    norms = numpy.linalg.norm(vectors, axis=1)
+    valid = numpy.isfinite(norms) & (norms > 0)
+    scaled = numpy.zeros_like(vectors)
+    scaled[valid] = vectors[valid] / norms[valid, None]
+    return scaled.astype(numpy.float32), valid
+
+
+def _stats(row: Sequence) -> List[float]:
+    return [numpy.nan if v is None else v for v in row[1 : 1 + len(STAT_COLUMNS)]]
+
+
+class StatVectors(object):
+    """
+    The search structure itself: unit stat vectors plus the columns filters need,
+    stored in arrays that grow by doubling.
+    """
+
+    def __init__(self, rows: Sequence[Sequence] = ()):
+        count = len(rows)
+        self.types: Dict[str, int] = {}
+        self.size = count
+        self.ids = numpy.fromiter((r[0] for r in rows), numpy.int64, count)
+        stats = numpy.array([_stats(r) for r in rows], dtype=numpy.float64)
+        self.vectors, self.valid = normalize(stats.reshape(count, len(STAT_COLUMNS)))
+        self.type_1 = numpy.fromiter((self._code(r[7]) for r in rows), numpy.int32)
+        self.type_2 = numpy.fromiter((self._code(r[8]) for r in rows), numpy.int32)
+        self.generation = numpy.fromiter(
+            (-1 if r[9] is None else r[9] for r in rows), numpy.int32, count
+        )
+        self.positions: Dict[int, int] = {int(id): i for i, id in enumerate(self.ids)}
+
+    def _code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        return self.types.setdefault(value, len(self.types))
+
+    def _append(self) -> int:
+        # capacity doubles, so a stream of creates costs amortized O(1) each
+        if self.size == len(self.ids):
+            capacity = max(2 * len(self.ids), 16)
+            for name in ARRAYS:
+                old = getattr(self, name)
+                new = numpy.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                new[: self.size] = old[: self.size]
+                setattr(self, name, new)
+        self.size += 1
+        return self.size - 1
+
+    def upsert(self, row: Sequence):
+        position = self.positions.get(row[0])
+        if position is None:
+            position = self._append()
+        vector, valid = normalize(_stats(row))
+        self.ids[position] = row[0]
+        self.vectors[position] = vector[0]
+        self.valid[position] = valid[0]
+        self.type_1[position] = self._code(row[7])
+        self.type_2[position] = self._code(row[8])
+        self.generation[position] = -1 if row[9] is None else row[9]
+        self.positions[row[0]] = position
+
+    def remove(self, id: int):
+        position = self.positions.pop(id, None)
+        if position is not None:
+            self.valid[position] = False
+
+    def _mask(self, filters: Optional[PokemonFilter]) -> numpy.ndarray:
+        mask = self.valid[: self.size].copy()
+        if filters is None:
+            return mask
+        for name, values in (("type_1", filters.type_1), ("type_2", filters.type_2)):
+            if values:
+                codes = [self.types[v] for v in values if v in self.types]
+                mask &= numpy.isin(getattr(self, name)[: self.size], codes)
+        if filters.generation:
+            mask &= numpy.isin(self.generation[: self.size], filters.generation)
+        return mask
+
+    def top(
+        self,
+        query: numpy.ndarray,
+        k: int,
+        filters: Optional[PokemonFilter] = None,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        The ``k`` rows most similar to the unit vector ``query`` as
+        ``(id, similarity)``, most similar first.
+        """
+        scores = self.vectors[: self.size] @ query
+        mask = self._mask(filters)
+        if exclude is not None:
+            mask[exclude] = False
+        candidates = numpy.flatnonzero(mask)
+        if not len(candidates) or k <= 0:
+            return []
+
+        scores = scores[candidates]
+        if len(candidates) > k:
+            best = numpy.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[best], scores[best]
+        # ties by id
+        order = numpy.lexsort((self.ids[candidates], -scores))
+        return [(int(self.ids[candidates[i]]), float(scores[i])) for i in order[:k]]
+
+    def search(
+        self, vector: Sequence[float], k: int, filters: Optional[PokemonFilter] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Raises ValueError for a vector without direction.
+        """
+        query, valid = normalize(vector)
+        if not valid[0]:
+            raise ValueError("The stat vector must not be all zero")
+        return self.top(query[0], k, filters)
+
+    def similar_to(
+        self, id: int, k: int, filters: Optional[PokemonFilter] = None
+    ) -> Optional[List[Tuple[int, float]]]:
+        """
+        Excludes ``id`` itself. None if ``id`` is unknown.
+        """
+        position = self.positions.get(id)
+        if position is None:
+            return None
+        if not self.valid[position]:
+            return []
+        return self.top(self.vectors[position], k, filters, exclude=position)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in ARRAYS)
+
+
+class SimilarityIndex(object):
+    """
+    StatVectors of this worker, kept up to date with the pokemon table.
+    """
+
+    def __init__(self, max_age: float, clock=time.monotonic):
+        self.max_age = max_age
+        self._clock = clock
+        self.vectors = StatVectors()
+        self._loaded_at = 0.0
+        self._reload = True
+        self._dirty: Set[int] = set()
+        self._pending_lock = threading.Lock()
+        # one refresh reads the database at a time, without holding `_lock`
+        self._refresh_lock = threading.Lock()
+        # guards the arrays, held only to search and to swap in or patch rows
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.refreshes = 0
+
+    def changed(self, change: str, id: Optional[int]):
+        with self._pending_lock:
+            if id is None:
+                self._reload = True
+            else:
+                self._dirty.add(id)
+
+    @staticmethod
+    def _load(db: Session, ids: Optional[Set[int]] = None) -> list:
+        statement = select(*[table.c[name] for name in COLUMNS])
+        if ids is not None:
+            statement = statement.where(table.c.id.in_(sorted(ids)))
+        return db.execute(statement).all()
+
+    def _refresh(self, db: Session):
+        # Once loaded, searches do not wait for a refresh another request is
+        # running; they use the rows as they are until it is swapped in.
+        if not self._refresh_lock.acquire(blocking=not self.reloads):
+            return
+        try:
+            self._refresh_locked(db)
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh_locked(self, db: Session):
+        with self._pending_lock:
+            reload = self._reload or self._clock() - self._loaded_at > self.max_age
+            dirty, self._dirty, self._reload = self._dirty, set(), False
+        try:
+            if reload:
+                vectors = StatVectors(self._load(db))
+                with self._lock:
+                    self.vectors = vectors
+                self._loaded_at = self._clock()
+                self.reloads += 1
+            elif dirty:
+                rows = self._load(db, dirty)
+                with self._lock:
+                    for row in rows:
+                        self.vectors.upsert(row)
+                    for id in dirty - {row[0] for row in rows}:
+                        self.vectors.remove(id)
+                self.refreshes += 1
+        except Exception:
+            with self._pending_lock:
+                self._reload = self._reload or reload
+                self._dirty |= dirty
+            raise
+
+    def search(
+        self,
+        db: Session,
+        vector: Sequence[float],
+        k: int,
+        filters: Optional[PokemonFilter] = None,
+    ) -> List[Tuple[int, float]]:
+        self._refresh(db)
+        with self._lock:
+            return self.vectors.search(vector, k, filters)
+
+    def similar_to(
+        self,
+        db: Session,
+        id: int,
+        k: int,
+        filters: Optional[PokemonFilter] = None,
+    ) -> Optional[List[Tuple[int, float]]]:
+        self._refresh(db)
+        with self._lock:
+            return self.vectors.similar_to(id, k, filters)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rows": len(self.vectors.positions),
+            "bytes": self.vectors.nbytes,
+            "reloads": self.reloads,
+            "refreshes": self.refreshes,
+        }
+
+
+index = SimilarityIndex(max_age=settings().similar_max_age)
+crud.on_pokemon_change(index.changed)
@@ -0,0 +1,402 @@
+"""
+Optional in-memory columnar copy of the pokemon table for list requests.
+
+With ``POKEMON_SNAPSHOT`` on, every worker loads the table into one compact NumPy
+array per column, strings as codes into their distinct values, and answers the
+filtered, sorted and paged reads of GET /pokemon/ with vectorized operations.
+
+A snapshot remembers ``crud.pokemon_table_version`` from before it was loaded.
+Once a write moves the version, or ``pokemon_snapshot_max_age`` passes, requests
+go to SQL again while a background thread loads a fresh copy.
+
+String codes are the Postgres ``dense_rank`` of each value, so orderings, page
+boundaries and cursors are exactly those of the database collation. A cursor
+pointing at a string the snapshot does not know falls back to SQL.
+"""
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy
+from sqlalchemy import func, select
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.db import crud, models
+from src.core.db.config import get_engine
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.pagination import (
+    CursorPage,
+    Page,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    signature,
+    with_tiebreaker,
+)
+from src.core.api.pokemon.sorting import SortSpec
+
+logger = logging.getLogger(__name__)
+
+table = models.Pokemon.__table__
+
+NAMES = tuple(c.name for c in table.c)
+STRING_COLUMNS = ("name", "type_1", "type_2")
+# sort orders kept per snapshot; each is an index array as long as the table
+ORDER_CACHE_SIZE = 8
+
+
+class Unanswerable(Exception):
+    """
+    The snapshot cannot answer a request exactly, SQL has to.
+    """
+
+
+class Row(dict):
+    """
+    A snapshot row, readable like the SQL rows the list route otherwise gets.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    @property
+    def _mapping(self) -> "Row":
+        return self
+
+
+def _compact(values: List[int]) -> numpy.ndarray:
+    array = numpy.array(values, dtype=numpy.int64)
+    if not len(array):
+        return array
+    dtype = numpy.result_type(
+        numpy.min_scalar_type(int(array.min())), numpy.min_scalar_type(int(array.max()))
+    )
+    return array.astype(dtype)
+
+
+class Snapshot(object):
+    def __init__(self, rows: Sequence, version: int):
+        self.version = version
+        self.size = len(rows)
+        self.columns: Dict[str, numpy.ndarray] = {}
+        # rows holding NULL, None for columns without any
+        self.nulls: Dict[str, Optional[numpy.ndarray]] = {}
+        # column -> distinct values by code, and the reverse lookup
+        self.strings: Dict[str, List[str]] = {}
+        self.codes: Dict[str, Dict[str, int]] = {}
+        self._sort_keys: Dict[str, numpy.ndarray] = {}
+        # sort specs come from clients, so only the most recently used are kept
+        self._orders = TTLCache(
+            maxsize=ORDER_CACHE_SIZE, ttl=float("inf"), sizeof=lambda a: a.nbytes
+        )
+
+        rank_names = tuple(f"{name}_rank" for name in STRING_COLUMNS)
+        by_column = dict(zip(NAMES + rank_names, zip(*rows))) if rows else {}
+        for name in NAMES:
+            values = by_column.get(name, ())
+            nulls = [v is None for v in values]
+            self.nulls[name] = numpy.array(nulls, dtype=bool) if any(nulls) else None
+
+            if name in STRING_COLUMNS:
+                # ranks start at 1 and NULL ranks last, codes are ranks - 1
+                strings: Dict[int, str] = {}
+                codes = []
+                for value, rank in zip(values, by_column.get(f"{name}_rank", ())):
+                    if value is None:
+                        codes.append(0)
+                    else:
+                        strings[rank - 1] = value
+                        codes.append(rank - 1)
+                self.strings[name] = [strings[i] for i in range(len(strings))]
+                self.codes[name] = {v: i for i, v in enumerate(self.strings[name])}
+                self.columns[name] = _compact(codes)
+            elif name == "legendary":
+                self.columns[name] = numpy.array([bool(v) for v in values], dtype=bool)
+            else:
+                self.columns[name] = _compact([v or 0 for v in values])
+
+    @property
+    def nbytes(self) -> int:
+        size = sum(a.nbytes for a in self.columns.values())
+        size += sum(a.nbytes for a in self.nulls.values() if a is not None)
+        size += sum(sys.getsizeof(s) for v in self.strings.values() for s in v)
+        size += self._orders.bytes
+        size += sum(a.nbytes for a in self._sort_keys.values())
+        return size
+
+    def _not_null(self, name: str) -> Any:
+        nulls = self.nulls[name]
+        return True if nulls is None else ~nulls
+
+    def mask(self, filters: PokemonFilter) -> Optional[numpy.ndarray]:
+        """
+        Rows matching ``filters`` with SQL semantics, i.e. NULL never matches.
+        """
+        if not filters:
+            return None
+
+        mask = numpy.ones(self.size, dtype=bool)
+        for name, values in (("type_1", filters.type_1), ("type_2", filters.type_2)):
+            if values:
+                codes = [self.codes[name][v] for v in values if v in self.codes[name]]
+                mask &= numpy.isin(self.columns[name], codes) & self._not_null(name)
+        if filters.generation:
+            mask &= numpy.isin(self.columns["generation"], filters.generation)
+            mask &= self._not_null("generation")
+        if filters.legendary is not None:
+            mask &= self.columns["legendary"] == filters.legendary
+            mask &= self._not_null("legendary")
+        for name, (low, high) in filters.ranges.items():
+            if low is not None:
+                mask &= self.columns[name] >= float(low)
+            if high is not None:
+                mask &= self.columns[name] <= float(high)
+            mask &= self._not_null(name)
+        return mask
+
+    def count(self, filters: PokemonFilter) -> int:
+        mask = self.mask(filters)
+        return self.size if mask is None else int(mask.sum())
+
+    def _sort_key(self, name: str) -> numpy.ndarray:
+        # float keys with NULL as +inf sort NULLs last ascending and first descending
+        key = self._sort_keys.get(name)
+        if key is None:
+            key = self.columns[name].astype(numpy.float64)
+            if self.nulls[name] is not None:
+                key[self.nulls[name]] = numpy.inf
+            self._sort_keys[name] = key
+        return key
+
+    def _key_value(self, name: str, value: Any) -> float:
+        if value is None:
+            return numpy.inf
+        if name in STRING_COLUMNS:
+            if value not in self.codes[name]:
+                raise Unanswerable(f"unknown {name} {value!r}")
+            return float(self.codes[name][value])
+        return float(value)
+
+    def order(self, keys: Sequence[SortKey]) -> numpy.ndarray:
+        """
+        Row positions in the given order, kept for the ORDER_CACHE_SIZE most
+        recently used sorts of the snapshot.
+        """
+        name = signature(keys)
+        order = self._orders.get(name)
+        if order is None:
+            sort_keys = [
+                -self._sort_key(c.name) if desc else self._sort_key(c.name)
+                for c, desc in keys
+            ]
+            # lexsort treats the last key as the primary one
+            order = numpy.lexsort(sort_keys[::-1])
+            self._orders.set(name, order)
+        return order
+
+    def _after(self, keys: Sequence[SortKey], values: Sequence) -> numpy.ndarray:
+        # the vectorized form of pagination.seek
+        after = numpy.zeros(self.size, dtype=bool)
+        equal = numpy.ones(self.size, dtype=bool)
+        for (column, desc), value in zip(keys, values):
+            key = self._sort_key(column.name)
+            value = self._key_value(column.name, value)
+            if desc:
+                key, value = -key, -value
+            after |= equal & (key > value)
+            equal &= key == value
+        return after
+
+    def row(self, position: int) -> Row:
+        row = Row()
+        for name in NAMES:
+            nulls = self.nulls[name]
+            if nulls is not None and nulls[position]:
+                row[name] = None
+            elif name in STRING_COLUMNS:
+                row[name] = self.strings[name][self.columns[name][position]]
+            else:
+                row[name] = self.columns[name][position].item()
+        return row
+
+    def _select(self, order: numpy.ndarray, mask, start: int, stop: int) -> list:
+        if mask is not None:
+            order = order[mask[order]]
+        return [self.row(p) for p in order[start:stop]]
+
+    def paginate(
+        self,
+        filters: PokemonFilter,
+        sort_spec: SortSpec,
+        page: int,
+        page_size: int,
+        total: Optional[int] = None,
+    ) -> Page:
+        if page_size <= 0:
+            raise AttributeError("page_size needs to be >= 1")
+        order = self.order(with_tiebreaker(sort_spec.keys))
+        start = (page if page > 0 else 0) * page_size
+        items = self._select(order, self.mask(filters), start, start + page_size + 1)
+        return Page(items[:page_size], page, page_size, len(items) > page_size, total)
+
+    def keyset_paginate(
+        self,
+        filters: PokemonFilter,
+        sort_spec: SortSpec,
+        cursor: Optional[str],
+        page_size: int,
+    ) -> CursorPage:
+        """
+        Same pages and cursors as pagination.keyset_paginate.
+        """
+        if page_size <= 0:
+            raise AttributeError("page_size needs to be >= 1")
+
+        keys = with_tiebreaker(sort_spec.keys)
+        backwards = False
+        order = self.order(keys)
+        mask = self.mask(filters)
+        if cursor:
+            values, backwards = decode_cursor(keys, cursor)
+            directions = [(column, desc != backwards) for column, desc in keys]
+            after = self._after(directions, values)
+            mask = after if mask is None else mask & after
+            if backwards:
+                order = order[::-1]
+
+        items = self._select(order, mask, 0, page_size + 1)
+        has_more = len(items) > page_size
+        items = items[:page_size]
+
+        if backwards:
+            items.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, cursor is not None
+
+        next_cursor = None
+        prev_cursor = None
+        if items and has_next:
+            next_cursor = encode_cursor(keys, items[-1], backwards=False)
+        if items and has_previous:
+            prev_cursor = encode_cursor(keys, items[0], backwards=True)
+
+        return CursorPage(items, next_cursor, prev_cursor)
+
+
+def load(connection) -> Snapshot:
+    # read the version first, a write racing the load then marks the result stale
+    version = crud.pokemon_table_version
+    ranks = [
+        func.dense_rank().over(order_by=table.c[name]).label(f"{name}_rank")
+        for name in STRING_COLUMNS
+    ]
+    rows = connection.execute(select(*table.c, *ranks)).all()
+    return Snapshot(rows, version)
+
+
+class SnapshotEngine(object):
+    def __init__(self, max_age: float, clock=time.monotonic):
+        self.max_age = max_age
+        self._clock = clock
+        self.snapshot: Optional[Snapshot] = None
+        self.loaded_at = 0.0
+        self.load_seconds = 0.0
+        self.loads = 0
+        self.hits = 0
+        self.fallbacks = 0
+        self._counts_lock = threading.Lock()
+        self._loading = threading.Lock()
+
+    def _count(self, hit: bool):
+        with self._counts_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.fallbacks += 1
+
+    def current(self) -> Optional[Snapshot]:
+        """
+        The snapshot if it is fresh, otherwise None and a reload is started.
+        """
+        snapshot = self.snapshot
+        if (
+            snapshot is not None
+            and snapshot.version == crud.pokemon_table_version
+            and self._clock() - self.loaded_at <= self.max_age
+        ):
+            self._count(hit=True)
+            return snapshot
+
+        self._count(hit=False)
+        self.reload_in_background()
+        return None
+
+    def read_page(
+        self,
+        snapshot: Snapshot,
+        filters: PokemonFilter,
+        sort_spec: SortSpec,
+        page: Optional[int],
+        cursor: Optional[str],
+        page_size: int,
+        total: Optional[int] = None,
+    ):
+        """
+        A cursor page when ``page`` is None, an offset page otherwise; None when
+        SQL has to answer.
+        """
+        try:
+            if page is None:
+                return snapshot.keyset_paginate(filters, sort_spec, cursor, page_size)
+            return snapshot.paginate(filters, sort_spec, page, page_size, total)
+        except Unanswerable:
+            self._count(hit=False)
+            return None
+
+    def reload_in_background(self):
+        if self._loading.acquire(blocking=False):
+            thread = threading.Thread(
+                target=self._reload, name="pokemon-snapshot", daemon=True
+            )
+            thread.start()
+
+    def _reload(self):
+        try:
+            start = time.perf_counter()
+            with get_engine().connect() as connection:
+                snapshot = load(connection)
+            self.load_seconds = time.perf_counter() - start
+            self.loaded_at = self._clock()
+            self.snapshot = snapshot
+            self.loads += 1
+        except Exception:
+            logger.exception("Loading the pokemon snapshot failed")
+        finally:
+            self._loading.release()
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        return {
+            "enabled": settings().pokemon_snapshot,
+            "rows": snapshot.size if snapshot else 0,
+            "bytes": snapshot.nbytes if snapshot else 0,
+            "version": snapshot.version if snapshot else None,
+            "table_version": crud.pokemon_table_version,
+            "age": self._clock() - self.loaded_at if snapshot else None,
+            "load_seconds": self.load_seconds,
+            "loads": self.loads,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+        }
+
+
+engine = SnapshotEngine(max_age=settings().pokemon_snapshot_max_age)
@@ -0,0 +1,86 @@
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Column
+
+from src.core.db import models
+from src.core.api.pokemon.pagination import SortKey
+
+
+class InvalidSort(ValueError):
+    pass
+
+
+def snake_to_camel(s):
+    head, *tail = s.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
+SORTABLE_COLUMNS: Tuple[Column, ...] = tuple(
+    models.Pokemon.__table__.c[name]
+    for name in (
+        "id",
+        "name",
+        "type_1",
+        "type_2",
+        "total",
+        "hp",
+        "attack",
+        "defense",
+        "sp_atk",
+        "sp_def",
+        "speed",
+        "generation",
+        "legendary",
+    )
+)
+
+# Every accepted spelling of a sort field (`sp_atk`, `spAtk`, `type_1`, `type1`) and
+# the column it resolves to.
+SORT_FIELDS: Dict[str, Column] = {}
+for _column in SORTABLE_COLUMNS:
+    SORT_FIELDS[_column.name] = _column
+    SORT_FIELDS[snake_to_camel(_column.name)] = _column
+
+DIRECTIONS = {"asc": False, "desc": True}
+
+DEFAULT_SORT = "name:asc"
+
+
+class SortSpec(object):
+    """
+    A parsed `sort` parameter: the sort keys and their ready-made ORDER BY clauses.
+    Instances are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, keys: Tuple[SortKey, ...]):
+        self.keys = keys
+        self.order_by = tuple(c.desc() if d else c.asc() for c, d in keys)
+
+
+@lru_cache(maxsize=512)
+def compile_sort(sort: Optional[str]) -> SortSpec:
+    """
+    Parses `field:direction,...` against the whitelist. Repeated sort strings are
+    served from the LRU, and since the resulting clauses are the same objects every
+    time, SQLAlchemy's compiled-statement cache keys stay stable as well.
+    """
+    if sort is None:
+        sort = DEFAULT_SORT
+
+    keys = []
+    for term in sort.split(","):
+        field, _, direction = term.strip().partition(":")
+        column = SORT_FIELDS.get(field)
+        if column is None:
+            raise InvalidSort(
+                f"Cannot sort by {field!r}, expected one of: "
+                + ", ".join(c.name for c in SORTABLE_COLUMNS)
+            )
+        if direction not in DIRECTIONS:
+            raise InvalidSort(f"Invalid sort direction {direction!r} for {field!r}")
+        if any(column is c for c, _ in keys):
+            raise InvalidSort(f"Field {field!r} is sorted on more than once")
+        keys.append((column, DIRECTIONS[direction]))
+
+    return SortSpec(tuple(keys))
@@ -0,0 +1,225 @@
+"""
+Aggregates behind GET /pokemon/stats.
+
+Every worker keeps the group and stat columns of all pokemon in a pandas frame.
+Writes only mark rows dirty (through ``crud.on_pokemon_change``, which also covers
+notifications from other workers) and the next request re-reads just those rows.
+Results are computed vectorized per ``(group_by, columns, stats)`` and memoized
+until the next write.
+"""
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy
+import pandas
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.db import crud, models
+from src.core.api.pokemon.serialize import FIELD_NAMES
+
+table = models.Pokemon.__table__
+
+GROUP_COLUMNS = ("type_1", "type_2", "generation", "legendary")
+STAT_COLUMNS = ("total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+AGGREGATES = ("mean", "min", "max", "std")
+DEFAULT_STATS = ("mean", "min", "max")
+
+_PERCENTILE = re.compile(r"p([1-9][0-9]?)")
+
+
+class InvalidStats(ValueError):
+    pass
+
+
+def _names(value: Optional[str], allowed: Sequence[str], what: str) -> Tuple[str, ...]:
+    names = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name = FIELD_NAMES.get(part)
+        if name not in allowed:
+            raise InvalidStats(f"Unknown {what}: {part!r}")
+        if name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+def parse_query(
+    group_by: Optional[str], columns: Optional[str], stats: Optional[str]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Validates the parameters of GET /pokemon/stats, e.g. ``"type1"``,
+    ``"hp,speed"`` and ``"mean,p50,p90"``.
+    """
+    aggregates = []
+    for part in (stats or ",".join(DEFAULT_STATS)).split(","):
+        part = part.strip()
+        if part and part not in AGGREGATES and not _PERCENTILE.fullmatch(part):
+            raise InvalidStats(f"Unknown stat: {part!r}")
+        if part and part not in aggregates:
+            aggregates.append(part)
+
+    return (
+        _names(group_by, GROUP_COLUMNS, "group"),
+        _names(columns, STAT_COLUMNS, "column") or STAT_COLUMNS,
+        tuple(aggregates),
+    )
+
+
+def _value(value: Any) -> Any:
+    if value is None or (isinstance(value, float) and numpy.isnan(value)):
+        return None
+    return value.item() if isinstance(value, numpy.generic) else value
+
+
+def summarize(
+    frame: pandas.DataFrame,
+    group_by: Tuple[str, ...],
+    columns: Tuple[str, ...],
+    stats: Tuple[str, ...],
+) -> List[Dict[str, Any]]:
+    values = frame[list(columns)]
+    if group_by:
+        grouped = values.groupby([frame[c] for c in group_by], dropna=False, sort=True)
+        counts = grouped.size()
+    else:
+        # one group holding every row
+        grouped = values.groupby(numpy.zeros(len(frame), dtype=numpy.int8))
+        counts = grouped.size()
+
+    results = {}
+    simple = [s for s in stats if s in AGGREGATES]
+    if simple:
+        aggregated = grouped.agg(simple)
+        for column in columns:
+            for stat in simple:
+                results[column, stat] = aggregated[column, stat]
+    for stat in stats:
+        if stat not in AGGREGATES:
+            quantiles = grouped.quantile(int(stat[1:]) / 100)
+            for column in columns:
+                results[column, stat] = quantiles[column]
+
+    groups = []
+    for position, key in enumerate(counts.index):
+        group = {}
+        if group_by:
+            key = key if isinstance(key, tuple) else (key,)
+            group = {name: _value(v) for name, v in zip(group_by, key)}
+        groups.append(
+            {
+                "group": group,
+                "count": int(counts.iloc[position]),
+                "stats": {
+                    column: {
+                        stat: _value(results[column, stat].iloc[position])
+                        for stat in stats
+                    }
+                    for column in columns
+                },
+            }
+        )
+    return groups
+
+
+class PokemonSummary(object):
+    """
+    Per-worker copy of the group and stat columns, refreshed incrementally.
+    """
+
+    def __init__(self, max_age: float, clock=time.monotonic):
+        self.max_age = max_age
+        self._clock = clock
+        self._frame: Optional[pandas.DataFrame] = None
+        self._loaded_at = 0.0
+        self._reload = True
+        self._dirty: Set[int] = set()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self.results = TTLCache(maxsize=256, ttl=max_age)
+        self.refreshes = 0
+        self.reloads = 0
+
+    def changed(self, change: str, id: Optional[int]):
+        with self._lock:
+            if id is None:
+                self._reload = True
+            else:
+                self._dirty.add(id)
+        self.results.clear()
+
+    def stats(
+        self,
+        db: Session,
+        group_by: Tuple[str, ...],
+        columns: Tuple[str, ...],
+        stats: Tuple[str, ...],
+    ) -> List[Dict[str, Any]]:
+        key = (group_by, columns, stats)
+        result = self.results.get(key)
+        if result is None:
+            # a write between the refresh and `set` keeps the result out of the memo
+            generation = self.results.generation
+            result = summarize(self.frame(db), group_by, columns, stats)
+            self.results.set(key, result, generation=generation)
+        return result
+
+    def frame(self, db: Session) -> pandas.DataFrame:
+        with self._refresh_lock:
+            with self._lock:
+                reload = (
+                    self._reload
+                    or self._frame is None
+                    or self._clock() - self._loaded_at > self.max_age
+                )
+                dirty, self._dirty, self._reload = self._dirty, set(), False
+            try:
+                if reload:
+                    self._frame = self._load(db)
+                    self._loaded_at = self._clock()
+                    self.reloads += 1
+                elif dirty:
+                    rows = self._load(db, dirty)
+                    kept = self._frame.drop(index=list(dirty), errors="ignore")
+                    self._frame = pandas.concat([kept, rows])
+                    self.refreshes += 1
+            except Exception:
+                with self._lock:
+                    self._reload = self._reload or reload
+                    self._dirty |= dirty
+                raise
+            return self._frame
+
+    @staticmethod
+    def _load(db: Session, ids: Optional[Set[int]] = None) -> pandas.DataFrame:
+        names = ("id",) + GROUP_COLUMNS + STAT_COLUMNS
+        statement = select(*[table.c[name] for name in names])
+        if ids is not None:
+            statement = statement.where(table.c.id.in_(sorted(ids)))
+        frame = pandas.DataFrame.from_records(
+            db.execute(statement).all(), columns=names, index="id"
+        )
+        # the API reports NULL legendary as false
+        frame["legendary"] = frame["legendary"].fillna(False).astype(bool)
+        return frame
+
+    def info(self) -> Dict[str, Any]:
+        frame = self._frame
+        return {
+            "rows": 0 if frame is None else len(frame),
+            "bytes": 0 if frame is None else int(frame.memory_usage(deep=True).sum()),
+            "pending": len(self._dirty),
+            "refreshes": self.refreshes,
+            "reloads": self.reloads,
+            "results": self.results.stats(),
+        }
+
+
+summary = PokemonSummary(max_age=settings().stats_max_age)
+crud.on_pokemon_change(summary.changed)
@@ -2,8 +2,8 @@ import logging
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Body, Depends, Path
-from src.core.db import schema, crud, models
-from src.core.db.session import get_db
+from src.core.db import schema, async_crud, models
+from src.core.db.session import get_async_db
 from src.core.auth import get_current_user
 
 
@@ -20,11 +20,11 @@ user_router = APIRouter(prefix="/users", tags=["users"])
         200: {"description": "Returns a user object"},
     },
 )
-async def user_by_email(email: str, db=Depends(get_db)):
+async def user_by_email(email: str, db=Depends(get_async_db)):
     """
     Retrieve a user by e-mail.
     """
-    user = crud.get_user_by_email(db, email)
+    user = await async_crud.get_user_by_email(db, email)
     if user:
         return user
 
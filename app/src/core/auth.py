@@ -3,6 +3,7 @@ from typing import Optional, Dict, List
 import jwt
 from jwt import InvalidSignatureError, ExpiredSignatureError, DecodeError
 from fastapi import Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import (
     OAuth2PasswordBearer,
     HTTPBearer,
@@ -11,9 +12,12 @@ from fastapi.security import (
 )
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel
 
+from src.core.cache import TTLCache
+from src.core.config import settings
 from src.core.db import session, crud, models
 from src.core import security
 
@@ -28,6 +32,17 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 120
 REFRESH_EXPIRE = 30  # days
 
+# Both caches are keyed by the raw bearer token. An entry never outlives the
+# token's own `exp` claim, see `_token_ttl`.
+claims_cache = TTLCache(
+    maxsize=settings().token_cache_size, ttl=settings().token_cache_ttl
+)
+# Expiry is the only eviction: a user changed or deleted in the database stays
+# valid for a cached token for up to TOKEN_CACHE_TTL seconds.
+principal_cache = TTLCache(
+    maxsize=settings().token_cache_size, ttl=settings().token_cache_ttl
+)
+
 
 class AccessToken(BaseModel):
     access_token: str
@@ -58,6 +73,10 @@ class JWTBearer(HTTPBearer):
 
     @staticmethod
     def verify_token(encoded: str) -> Optional[Dict]:
+        payload = claims_cache.get(encoded)
+        if payload is not None:
+            return dict(payload)
+
         credentials_exception = HTTPException(
             status_code=401,
             detail="Could not validate client",
@@ -71,7 +90,8 @@ class JWTBearer(HTTPBearer):
                 options={"verify_aud": False},
             )
 
-            return payload
+            claims_cache.set(encoded, payload, ttl=_token_ttl(payload))
+            return dict(payload)
         except ExpiredSignatureError:
             logging.error("Token expired")
             raise credentials_exception
@@ -86,6 +106,19 @@ class JWTBearer(HTTPBearer):
             raise credentials_exception
 
 
+def header_scopes(authorization: Optional[str]) -> List[str]:
+    """
+    Scopes of a valid `Bearer` authorization header, none for anything else.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return []
+    try:
+        return JWTBearer.verify_token(token).get("scopes", [])
+    except HTTPException:
+        return []
+
+
 async def get_current_user(
     security_scopes: SecurityScopes,
     db=Depends(session.get_db),
@@ -104,11 +137,18 @@ async def get_current_user(
     payload = JWTBearer.verify_token(token)
     email: str = payload.get("sub")
     scopes: List[str] = payload.get("scopes", [])
-    user: models.User = crud.get_user_by_email(db, email)
+    user: models.User = principal_cache.get(token)
+
+    if user is None:
+        user = await run_in_threadpool(crud.get_user_by_email, db, email)
+
+        if not user:
+            logging.error(f"Could not find user: {email}")
+            raise credentials_exception
 
-    if not user:
-        logging.error(f"Could not find user: {email}")
-        raise credentials_exception
+        # detach the user so a commit in this request cannot expire the cached copy
+        db.expunge(user)
+        principal_cache.set(token, user, ttl=_token_ttl(payload))
 
     for scope in security_scopes.scopes:
         if scope not in scopes:
@@ -121,12 +161,41 @@ async def get_current_user(
     return user
 
 
-def authenticate_user(db, email: str, password: str) -> models.User:
-    user: models.User = crud.get_user_by_email(db, email)
-    if user and security.check_password(password, user.password):
+def _token_ttl(payload: Dict) -> float:
+    exp = payload.get("exp")
+    if exp is None:
+        return settings().token_cache_ttl
+    return float(exp) - time.time()
+
+
+def token_cache_stats() -> Dict[str, Dict]:
+    return {"claims": claims_cache.stats(), "principals": principal_cache.stats()}
+
+
+async def authenticate_user(db, email: str, password: str) -> models.User:
+    user: models.User = await run_in_threadpool(crud.get_user_by_email, db, email)
+    if user is None:
+        return None
+
+    try:
+        valid = await security.check_password_async(password, user.password)
+    except security.ExecutorSaturated:
+        logging.error("Password executor saturated, rejecting login")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    if valid:
         return user
 
 
+def user_scopes(email: str) -> List[str]:
+    admins = {e.lower() for e in settings().admin_emails}
+    return ["admin"] if email.lower() in admins else []
+
+
 def create_access_token(sub: str, scopes: List[str] = None) -> str:
     return _create_token(
         token_type="access_token",
@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache(object):
+    """
+    Bounded, thread-safe LRU cache where every entry carries its own deadline.
+
+    ``ttl`` is the upper bound for an entry's lifetime; ``set`` may pass a shorter
+    one (e.g. the remaining lifetime of a JWT) but never a longer one. With
+    ``maxbytes`` the cache also evicts until the summed ``sizeof`` of its values
+    fits the budget.
+
+    ``generation`` advances on every invalidation. Read-through callers take it
+    before loading a value and hand it back to ``set``, which then drops the value
+    if an invalidation happened in between, so a slow reader cannot re-cache data
+    a writer just invalidated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        maxbytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (expires_at, value, size)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value, size = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        size = self._sizeof(value) if self._sizeof else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._put(key, (self._clock() + ttl, value, size))
+
+    def update(self, key: Hashable, func: Callable[[Any], Any]) -> bool:
+        """
+        Replaces a live entry with ``func(value)`` without extending its deadline.
+        Returns False if there was no live entry to update.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return False
+            value = func(entry[1])
+            size = self._sizeof(value) if self._sizeof else 0
+            self._put(key, (entry[0], value, size))
+            return True
+
+    def _put(self, key: Hashable, entry: Tuple[float, Any, int]):
+        previous = self._data.get(key)
+        if previous is not None:
+            self.bytes -= previous[2]
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        self.bytes += entry[2]
+
+        while len(self._data) > self.maxsize or (
+            self.maxbytes is not None and self.bytes > self.maxbytes
+        ):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        with self._lock:
+            self.generation += 1
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return None
+            self.bytes -= entry[2]
+            self.invalidations += 1
+            return entry[1]
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        with self._lock:
+            self.generation += 1
+            keys = [k for k, (_, v, _) in self._data.items() if predicate(k, v)]
+            for key in keys:
+                self.bytes -= self._data.pop(key)[2]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.bytes,
+            "maxbytes": self.maxbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseSettings, Field
 from functools import lru_cache
@@ -14,15 +14,90 @@ class Database(BaseSettings):
     db: str = Field(..., env="DB_DB")
     host: Optional[str] = Field("localhost", env="DB_HOST")
 
+    # connection pool, applied to both the sync and the async engine
+    pool_size: int = Field(5, env="DB_POOL_SIZE")
+    max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
+    pool_timeout: float = Field(30, env="DB_POOL_TIMEOUT")
+    pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")
+    pool_pre_ping: bool = Field(False, env="DB_POOL_PRE_PING")
+    pool_use_lifo: bool = Field(False, env="DB_POOL_USE_LIFO")
+    # connections each worker opens on startup, at most pool_size
+    pool_prewarm: int = Field(0, env="DB_POOL_PREWARM")
+
 
 class Settings(BaseSettings):
     app_name: str = "Petal"
     app_description: str = "Petal API"
     environment: str = Field(..., env="ENVIRONMENT")
     openapi_url: str = "/openapi.json"
+    # tracebacks in error responses and per-request query summaries in the headers
+    debug: bool = Field(False, env="DEBUG")
+    # a request running the same SQL this many times is counted as a likely N+1
+    query_repeat_threshold: int = Field(2, env="QUERY_REPEAT_THRESHOLD")
+    # statements taking this long are logged and kept for /internal/slow-queries
+    slow_query_seconds: float = Field(0.5, env="SLOW_QUERY_SECONDS")
+    slow_query_history: int = Field(100, env="SLOW_QUERY_HISTORY")
+
+    # sampling profiles of single requests, taken for an admin sending
+    # `X-Profile: 1` and for this fraction of all requests
+    profile_sample_rate: float = Field(0.0, env="PROFILE_SAMPLE_RATE")
+    profile_interval: float = Field(0.005, env="PROFILE_INTERVAL")
+    profile_history: int = Field(20, env="PROFILE_HISTORY")
+
+    # cache of verified JWT claims and resolved users, keyed by bearer token
+    token_cache_size: int = Field(1024, env="TOKEN_CACHE_SIZE")
+    token_cache_ttl: float = Field(60, env="TOKEN_CACHE_TTL")
+
+    # dedicated pool for bcrypt so logins never run on the event loop
+    password_hash_workers: int = Field(4, env="PASSWORD_HASH_WORKERS")
+    password_hash_queue: int = Field(64, env="PASSWORD_HASH_QUEUE")
+
+    # upper bound on how stale a list total (includeTotal=true) may be
+    count_cache_ttl: float = Field(30, env="COUNT_CACHE_TTL")
+
+    # read-through cache in front of single pokemon reads
+    pokemon_cache_size: int = Field(10000, env="POKEMON_CACHE_SIZE")
+    pokemon_cache_ttl: float = Field(300, env="POKEMON_CACHE_TTL")
+    pokemon_cache_max_bytes: int = Field(
+        32 * 1024 * 1024, env="POKEMON_CACHE_MAX_BYTES"
+    )
+    # Postgres NOTIFY channel used to invalidate caches across workers, off if unset
+    cache_notify_channel: Optional[str] = Field(None, env="CACHE_NOTIFY_CHANNEL")
+
+    # largest accepted batch of the /pokemon/bulk endpoints
+    bulk_max_items: int = Field(10000, env="BULK_MAX_ITEMS")
+
+    # rows fetched per round trip from the server-side cursor of /pokemon/export
+    export_batch_size: int = Field(2000, env="EXPORT_BATCH_SIZE")
+
+    # /pokemon/stats keeps a per-worker copy of the stat columns, patched on writes;
+    # it is reloaded at least this often in case notifications are disabled
+    stats_max_age: float = Field(300, env="STATS_MAX_AGE")
+    # same for the stat vectors behind the /pokemon similarity search
+    similar_max_age: float = Field(300, env="SIMILAR_MAX_AGE")
+
+    # answer pokemon list requests from a per-worker NumPy copy of the table; it is
+    # rebuilt after writes and at least every max_age seconds, SQL serves meanwhile
+    pokemon_snapshot: bool = Field(False, env="POKEMON_SNAPSHOT")
+    pokemon_snapshot_max_age: float = Field(60, env="POKEMON_SNAPSHOT_MAX_AGE")
+
+    # rows sent per COPY round trip by the bulk importer
+    import_chunk_size: int = Field(10000, env="IMPORT_CHUNK_SIZE")
+
+    # users whose tokens carry the "admin" scope, as a JSON list
+    admin_emails: List[str] = Field([], env="ADMIN_EMAILS")
 
+    # Cache-Control per route, responses are revalidated with their ETag by default
+    cache_control: Dict[str, str] = Field(
+        {
+            "pokemon_detail": "private, no-cache",
+            "pokemon_list": "private, no-cache",
+        },
+        env="CACHE_CONTROL",
+    )
 
-    database: Database = Database()
+    # read when the settings are, not when this module is imported
+    database: Database = Field(default_factory=Database)
 
 
 @lru_cache()
@@ -1 +1 @@
-from .config import SessionLocal
+from .config import SessionLocal, AsyncSessionLocal
@@ -0,0 +1,119 @@
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db import schema
+from src.core.db.crud import (
+    StaleVersion,
+    change_notification,
+    pokemon_cache,
+    pokemon_changed,
+    update_statement,
+)
+from src.core.db.models import *
+
+# asyncio counterparts of src.core.db.crud, for use with session.get_async_db
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> User:
+    result = await db.execute(
+        select(User).filter(func.lower(User.email) == email.lower())
+    )
+    return result.scalars().first()
+
+
+async def create_pokemon(db: AsyncSession, new_pokemon: schema.NewPokemon) -> Pokemon:
+    pokemon = Pokemon(**new_pokemon.dict())
+
+    db.add(pokemon)
+    await db.flush()
+    await _publish_change(db, "create", pokemon.id)
+    await db.commit()
+    pokemon_changed("create", pokemon.id)
+
+    return pokemon
+
+
+async def get_pokemon_by_id(db: AsyncSession, id: int) -> Pokemon:
+    result = await db.execute(select(Pokemon).filter(Pokemon.id == id))
+    return result.scalars().first()
+
+
+async def get_pokemon_snapshot(
+    db: AsyncSession, id: int, version: Optional[int] = None
+) -> Optional[schema.Pokemon]:
+    """
+    With ``version``, a cached copy at any other version is read again.
+    """
+    pokemon = pokemon_cache.get(id)
+    if pokemon is not None and version is not None and pokemon.version != version:
+        pokemon = None
+    if pokemon is None:
+        generation = pokemon_cache.generation
+        row = await get_pokemon_by_id(db, id)
+        if row is None:
+            return None
+        pokemon = schema.Pokemon.from_orm(row)
+        pokemon_cache.set(id, pokemon, generation=generation)
+    return pokemon
+
+
+async def delete_pokemon(db: AsyncSession, id: int) -> Optional[schema.Pokemon]:
+    table = Pokemon.__table__
+    result = await db.execute(
+        delete(table).where(table.c.id == id).returning(*table.c)
+    )
+    row = result.first()
+    if row is None:
+        await db.rollback()
+        return None
+
+    await _publish_change(db, "delete", id)
+    await db.commit()
+    pokemon_changed("delete", id)
+    return schema.Pokemon(**row._mapping)
+
+
+async def update_pokemon(
+    db: AsyncSession,
+    id: int,
+    updated_pokemon: schema.UpdatePokemon,
+    expected_version: Optional[int] = None,
+) -> Optional[schema.Pokemon]:
+    return await patch_pokemon(db, id, updated_pokemon.dict(), expected_version)
+
+
+async def patch_pokemon(
+    db: AsyncSession, id: int, values: dict, expected_version: Optional[int] = None
+) -> Optional[schema.Pokemon]:
+    result = await db.execute(update_statement(id, values, expected_version))
+    row = result.first()
+    if row is None:
+        current_version = None
+        if expected_version is not None:
+            result = await db.execute(
+                select(Pokemon.version).filter(Pokemon.id == id)
+            )
+            current_version = result.scalar()
+        await db.rollback()
+        if current_version is not None:
+            raise StaleVersion(f"pokemon {id} is at version {current_version}")
+        return None
+
+    await _publish_change(db, "update", id)
+    await db.commit()
+    pokemon_changed("update", id)
+    return schema.Pokemon(**row._mapping)
+
+
+async def get_pokemon_version(db: AsyncSession, id: int) -> Optional[int]:
+    # read from the table, the cache misses other workers' writes without NOTIFY
+    result = await db.execute(select(Pokemon.version).filter(Pokemon.id == id))
+    return result.scalar()
+
+
+async def _publish_change(db: AsyncSession, change: str, id: int):
+    statement = change_notification(change, id)
+    if statement is not None:
+        await db.execute(statement)
@@ -0,0 +1,181 @@
+"""
+Bulk import of pokemon through ``COPY FROM STDIN``.
+
+Rows are validated with ``schema.NewPokemon``, copied in chunks into a temporary
+staging table and merged into ``pokemon`` with two set-based statements: rows
+carrying an ``id`` are upserted on it (the last row wins when an id repeats), rows
+without one are inserted. Everything runs in the caller's transaction, so a
+rejected row leaves the table untouched.
+
+    PYTHONPATH=app python -m src.core.db.bulk_import pokemon.csv
+    PYTHONPATH=app python -m src.core.db.bulk_import pokemon.parquet --format parquet
+"""
+import argparse
+import csv
+import io
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from src.core.config import settings
+from src.core.db import crud, models, schema
+from src.core.db.config import get_engine
+
+table = models.Pokemon.__table__
+
+FIELDS = list(schema.NewPokemon.__fields__)
+STAGING = "pokemon_import"
+
+
+class InvalidRow(ValueError):
+    def __init__(self, row: int, detail: str):
+        super(InvalidRow, self).__init__(f"Row {row}: {detail}")
+        self.row = row
+        self.detail = detail
+
+
+def read_csv(file: IO[str]) -> Iterator[dict]:
+    for row in csv.DictReader(file):
+        yield {k: (v if v != "" else None) for k, v in row.items()}
+
+
+def read_parquet(file) -> Iterator[dict]:
+    # pandas reads the whole file; the COPY side still streams in chunks
+    import pandas
+
+    frame = pandas.read_parquet(file)
+    frame = frame.astype(object).where(frame.notna(), None)
+    yield from frame.to_dict("records")
+
+
+READERS = {"csv": read_csv, "parquet": read_parquet}
+
+
+def validate(rows: Iterable[dict]) -> Iterator[Tuple]:
+    """
+    Yields ``(seq, id, *FIELDS)`` tuples in staging table order, raising
+    ``InvalidRow`` for the first row ``NewPokemon`` rejects.
+    """
+    for number, row in enumerate(rows, start=1):
+        try:
+            pokemon = schema.NewPokemon(**row)
+            id = row.get("id")
+            id = int(id) if id is not None else None
+        except ValidationError as e:
+            raise InvalidRow(number, str(e))
+        except (TypeError, ValueError):
+            raise InvalidRow(number, "id must be a number")
+        yield (number, id, *[getattr(pokemon, field) for field in FIELDS])
+
+
+def _create_staging(connection):
+    dialect = postgresql.dialect()
+    columns = ", ".join(
+        f"{name} {table.c[name].type.compile(dialect=dialect)}"
+        for name in ["id"] + FIELDS
+    )
+    connection.exec_driver_sql(
+        f"CREATE TEMPORARY TABLE {STAGING} (seq bigint, {columns}) ON COMMIT DROP"
+    )
+
+
+def _copy(connection, rows: Iterable[Tuple], chunk_size: int):
+    cursor = connection.connection.cursor()
+    statement = (
+        f"COPY {STAGING} (seq, id, {', '.join(FIELDS)}) FROM STDIN WITH (FORMAT csv)"
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == chunk_size:
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+
+
+def _merge(connection) -> schema.ImportResult:
+    columns = ", ".join(FIELDS)
+    assignments = [f"{field} = EXCLUDED.{field}" for field in FIELDS]
+    assignments.append("version = pokemon.version + 1")
+
+    # xmax is 0 for freshly inserted rows and set for rows the upsert updated
+    inserted, updated = connection.exec_driver_sql(
+        f"""
+        WITH source AS (
+            SELECT DISTINCT ON (id) * FROM {STAGING}
+            WHERE id IS NOT NULL ORDER BY id, seq DESC
+        ), upserted AS (
+            INSERT INTO pokemon (id, {columns})
+            SELECT id, {columns} FROM source
+            ON CONFLICT (id) DO UPDATE SET {", ".join(assignments)}
+            RETURNING xmax = 0 AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted)
+        FROM upserted
+        """
+    ).one()
+
+    if inserted:
+        # explicit ids bypass the sequence, move it past them before using it
+        connection.exec_driver_sql(
+            "SELECT setval(pg_get_serial_sequence('pokemon', 'id'), max(id)) "
+            "FROM pokemon"
+        )
+
+    generated = connection.exec_driver_sql(
+        f"INSERT INTO pokemon ({columns}) "
+        f"SELECT {columns} FROM {STAGING} WHERE id IS NULL ORDER BY seq"
+    ).rowcount
+
+    return schema.ImportResult(inserted=inserted + generated, updated=updated)
+
+
+def copy_pokemon(
+    connection, rows: Iterable[dict], chunk_size: Optional[int] = None
+) -> schema.ImportResult:
+    """
+    Imports ``rows`` on ``connection`` inside its current transaction. Does not
+    touch the caches, see ``import_pokemon``.
+    """
+    _create_staging(connection)
+    _copy(connection, validate(rows), chunk_size or settings().import_chunk_size)
+    result = _merge(connection)
+    connection.exec_driver_sql(f"DROP TABLE {STAGING}")
+    return result
+
+
+def import_pokemon(
+    rows: Iterable[dict], chunk_size: Optional[int] = None
+) -> schema.ImportResult:
+    with get_engine().begin() as connection:
+        result = copy_pokemon(connection, rows, chunk_size)
+        statement = crud.change_notification("import", "*")
+        if statement is not None:
+            connection.execute(statement)
+
+    crud.pokemon_table_changed("import")
+    return result
+
+
+def main(args):
+    mode = "rb" if args.format == "parquet" else "r"
+    with open(args.path, mode, newline=None if mode == "rb" else "") as file:
+        result = import_pokemon(READERS[args.format](file), args.chunk_size)
+    print(f"inserted {result.inserted}, updated {result.updated}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import pokemon from a file.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=sorted(READERS), default="csv")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    main(parser.parse_args())
@@ -1,17 +1,210 @@
-from src.core.config import settings
-from sqlalchemy import create_engine
+"""
+Engines and session factories.
+
+Nothing connects, or even creates an engine, at import time: ``get_engine`` and
+``get_async_engine`` build their engine on first use and the session factories
+bind to it when a session is made. The app factory creates both engines on
+startup, i.e. in every worker after a fork.
+
+Should an engine exist before a fork anyway (e.g. gunicorn --preload with code
+that touched the database), the child starts over with a fresh pool and never
+uses a connection opened by another process, see ``_guard_fork``.
+"""
+import os
+import threading
+from typing import Dict, Optional
 
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import Pool
+
+from src.core.config import settings
+from src.core.metrics import registry
+
+from . import queries
+from .pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_metrics
+
+
+def database_url(drivername: str = "postgresql") -> URL:
+    database = settings().database
+    return URL.create(
+        drivername,
+        username=database.user,
+        password=database.password,
+        host=database.host,
+        port=int(database.port) if database.port else None,
+        database=database.db,
+    )
+
+
+def _pool_options() -> dict:
+    database = settings().database
+    return {
+        "pool_size": database.pool_size,
+        "max_overflow": database.max_overflow,
+        "pool_timeout": database.pool_timeout,
+        "pool_recycle": database.pool_recycle,
+        "pool_pre_ping": database.pool_pre_ping,
+        "pool_use_lifo": database.pool_use_lifo,
+    }
+
+
+def _guard_fork(engine: Engine):
+    # Connections remember the process that opened them; one checked out in any
+    # other process is discarded rather than shared with the parent.
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            connection_record.dbapi_connection = None
+            connection_proxy.dbapi_connection = None
+            raise exc.DisconnectionError(
+                f"Connection opened by process {connection_record.info['pid']}, "
+                f"attempting to check out in process {pid}"
+            )
+
+
+def init_engine() -> Engine:
+    engine = create_engine(
+        database_url(), poolclass=InstrumentedQueuePool, **_pool_options()
+    )
+    _guard_fork(engine)
+    queries.instrument(engine)
+    return engine
+
+
+def init_async_engine() -> AsyncEngine:
+    engine = create_async_engine(
+        database_url("postgresql+asyncpg"),
+        poolclass=InstrumentedAsyncQueuePool,
+        **_pool_options(),
+    )
+    _guard_fork(engine.sync_engine)
+    queries.instrument(engine.sync_engine)
+    return engine
+
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = init_engine()
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        with _lock:
+            if _async_engine is None:
+                _async_engine = init_async_engine()
+    return _async_engine
+
+
+def pools() -> Dict[str, Pool]:
+    """
+    The pools of the engines created so far.
+    """
+    found = {}
+    if _engine is not None:
+        found["sync"] = _engine.pool
+    if _async_engine is not None:
+        found["async"] = _async_engine.sync_engine.pool
+    return found
+
+
+def prewarm(count: int):
+    """
+    Opens up to ``count`` connections of the sync pool and returns them to it, so
+    the first requests do not pay for connecting.
+    """
+    engine = get_engine()
+    count = min(count, settings().database.pool_size)
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+async def prewarm_async(count: int):
+    engine = get_async_engine()
+    count = min(count, settings().database.pool_size)
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
+async def dispose():
+    global _engine, _async_engine
+    with _lock:
+        engine, async_engine = _engine, _async_engine
+        _engine = _async_engine = None
+    if engine is not None:
+        engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def _after_fork_in_child():
+    # Start over with empty pools without closing the inherited connections,
+    # closing them would end the parent's sessions on the server.
+    for engine in (_engine, _async_engine and _async_engine.sync_engine):
+        if engine is not None:
+            engine.pool = engine.pool.recreate()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+registry.collector(pool_metrics(pools))
+
 
+class LazySessionmaker(sessionmaker):
+    """
+    A sessionmaker that binds every new session to ``get_bind()``, so creating the
+    factory does not create the engine.
+    """
 
-if settings().environment == "local":
-    SQLALCHEMY_DATABASE_URL = f"postgresql://{settings().database.user}:{settings().database.password}@{settings().database.host}:{settings().database.port}/{settings().database.db}"
+    def __init__(self, get_bind, **kw):
+        super(LazySessionmaker, self).__init__(**kw)
+        self._get_bind = get_bind
 
+    def __call__(self, **local_kw):
+        local_kw.setdefault("bind", self._get_bind())
+        return super(LazySessionmaker, self).__call__(**local_kw)
 
-def init_engine():
-    return create_engine(SQLALCHEMY_DATABASE_URL)
 
+SessionLocal = LazySessionmaker(get_engine, autocommit=False, autoflush=False)
+# objects outlive the commit in async handlers, where lazy refreshes are not allowed
+AsyncSessionLocal = LazySessionmaker(
+    get_async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
 
-engine = init_engine()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name: str):
+    # `engine` and `async_engine` used to be module attributes created on import
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,42 @@
+import sys
+import threading
+from typing import Callable, Hashable, List, Optional, Sequence
+
+from sqlalchemy import column, delete, func, insert, update, values
 from sqlalchemy.orm import Session
 
-from src.core.db import schema
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.db import notify, schema
 from src.core.db.models import *
 
+# Cached pokemon row counts, keyed by filter ("*" for the whole table). Writes made
+# by this worker are applied to the cached total right away and drop the filtered
+# counts; writes from other workers show up within `count_cache_ttl`.
+pokemon_counts = TTLCache(maxsize=256, ttl=settings().count_cache_ttl)
+
+
+class StaleVersion(Exception):
+    pass
+
+
+def _snapshot_size(pokemon: schema.Pokemon) -> int:
+    values = pokemon.__dict__
+    return sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values.values())
+
+
+# Read-through cache for single pokemon reads. It holds schema.Pokemon snapshots
+# rather than ORM instances, which belong to the session that loaded them.
+pokemon_cache = TTLCache(
+    maxsize=settings().pokemon_cache_size,
+    ttl=settings().pokemon_cache_ttl,
+    maxbytes=settings().pokemon_cache_max_bytes,
+    sizeof=_snapshot_size,
+)
+
 
 def get_user_by_email(db: Session, email: str) -> User:
-    return db.query(User).filter(User.email == email.lower()).first()
+    return db.query(User).filter(func.lower(User.email) == email.lower()).first()
 
 
 def create_pokemon(db: Session, new_pokemon: schema.NewPokemon) -> Pokemon:
@@ -20,9 +51,14 @@ def create_pokemon(db: Session, new_pokemon: schema.NewPokemon) -> Pokemon:
     pokemon.sp_def = new_pokemon.sp_def
     pokemon.defense = new_pokemon.defense
     pokemon.speed = new_pokemon.speed
+    pokemon.total = new_pokemon.total
+    pokemon.legendary = new_pokemon.legendary
 
     db.add(pokemon)
+    db.flush()
+    _publish_change(db, "create", pokemon.id)
     db.commit()
+    pokemon_changed("create", pokemon.id)
 
     return pokemon
 
@@ -31,26 +67,251 @@ def get_pokemon_by_id(db: Session, id: int) -> Pokemon:
     return db.query(Pokemon).filter(Pokemon.id == id).first()
 
 
-def delete_pokemon(db: Session, id: int):
-    pokemon = get_pokemon_by_id(db, id)
-    if pokemon:
-        db.delete(pokemon)
-        db.commit()
+def get_pokemon_snapshot(db: Session, id: int) -> Optional[schema.Pokemon]:
+    pokemon = pokemon_cache.get(id)
+    if pokemon is None:
+        generation = pokemon_cache.generation
+        row = get_pokemon_by_id(db, id)
+        if row is None:
+            return None
+        pokemon = schema.Pokemon.from_orm(row)
+        pokemon_cache.set(id, pokemon, generation=generation)
     return pokemon
 
 
-def update_pokemon(db: Session, id: int, updated_pokemon: schema.UpdatePokemon):
-    pokemon = get_pokemon_by_id(db, id)
-    if pokemon is not None:
-        pokemon.type_1 = updated_pokemon.type_1
-        pokemon.type_2 = updated_pokemon.type_2
-        pokemon.name = updated_pokemon.name
-        pokemon.hp = updated_pokemon.hp
-        pokemon.attack = updated_pokemon.attack
-        pokemon.generation = updated_pokemon.generation
-        pokemon.sp_atk = updated_pokemon.sp_atk
-        pokemon.sp_def = updated_pokemon.sp_def
-        pokemon.defense = updated_pokemon.defense
-        pokemon.speed = updated_pokemon.speed
-        db.commit()
-    return pokemon
+def delete_pokemon(db: Session, id: int) -> Optional[schema.Pokemon]:
+    table = Pokemon.__table__
+    row = db.execute(
+        delete(table).where(table.c.id == id).returning(*table.c)
+    ).first()
+    if row is None:
+        db.rollback()
+        return None
+
+    _publish_change(db, "delete", id)
+    db.commit()
+    pokemon_changed("delete", id)
+    return schema.Pokemon(**row._mapping)
+
+
+def update_statement(id: int, values: dict, expected_version: Optional[int] = None):
+    """
+    One UPDATE ... RETURNING writing ``values`` and bumping the version. With
+    ``expected_version`` it only matches the row at that version; the row lock
+    the UPDATE takes keeps concurrent writers from handing out the same version.
+    """
+    table = Pokemon.__table__
+    statement = update(table).where(table.c.id == id)
+    if expected_version is not None:
+        statement = statement.where(table.c.version == expected_version)
+    return statement.values({**values, "version": table.c.version + 1}).returning(
+        *table.c
+    )
+
+
+def update_pokemon(
+    db: Session,
+    id: int,
+    updated_pokemon: schema.UpdatePokemon,
+    expected_version: Optional[int] = None,
+) -> Optional[schema.Pokemon]:
+    return patch_pokemon(db, id, updated_pokemon.dict(), expected_version)
+
+
+def patch_pokemon(
+    db: Session, id: int, values: dict, expected_version: Optional[int] = None
+) -> Optional[schema.Pokemon]:
+    """
+    Writes only the given columns. Returns None if the pokemon does not exist and
+    raises StaleVersion if it is not at ``expected_version``.
+    """
+    row = db.execute(update_statement(id, values, expected_version)).first()
+    if row is None:
+        current_version = None
+        if expected_version is not None:
+            # only a failed conditional write pays for telling 404 and 412 apart
+            current_version = (
+                db.query(Pokemon.version).filter(Pokemon.id == id).scalar()
+            )
+        db.rollback()
+        if current_version is not None:
+            raise StaleVersion(f"pokemon {id} is at version {current_version}")
+        return None
+
+    _publish_change(db, "update", id)
+    db.commit()
+    pokemon_changed("update", id)
+    return schema.Pokemon(**row._mapping)
+
+
+# rows per multi-row statement, keeps single statements and their parameter lists small
+BULK_CHUNK_SIZE = 1000
+
+
+def create_pokemon_bulk(db: Session, new_pokemon: List[schema.NewPokemon]) -> list:
+    table = Pokemon.__table__
+    rows = []
+    for start in range(0, len(new_pokemon), BULK_CHUNK_SIZE):
+        chunk = new_pokemon[start : start + BULK_CHUNK_SIZE]
+        statement = (
+            insert(table).values([p.dict() for p in chunk]).returning(*table.c)
+        )
+        rows.extend(db.execute(statement).all())
+
+    _publish_change(db, "create", "*")
+    db.commit()
+    for row in rows:
+        pokemon_changed("create", row.id)
+    return rows
+
+
+def update_pokemon_bulk(
+    db: Session, updated_pokemon: List[schema.BulkUpdatePokemon]
+) -> list:
+    """
+    Applies all updates with one ``UPDATE ... FROM (VALUES ...)`` per chunk and
+    returns the updated rows; ids that do not exist are simply absent.
+    """
+    table = Pokemon.__table__
+    fields = list(schema.UpdatePokemon.__fields__)
+    data = values(
+        *[column(f, table.c[f].type) for f in ["id"] + fields],
+        name="data",
+    )
+
+    rows = []
+    for start in range(0, len(updated_pokemon), BULK_CHUNK_SIZE):
+        chunk = updated_pokemon[start : start + BULK_CHUNK_SIZE]
+        source = data.data([(p.id, *[getattr(p, f) for f in fields]) for p in chunk])
+        statement = (
+            update(table)
+            .where(table.c.id == source.c.id)
+            .values(
+                {
+                    **{f: source.c[f] for f in fields},
+                    "version": table.c.version + 1,
+                }
+            )
+            .returning(*table.c)
+        )
+        rows.extend(db.execute(statement).all())
+
+    _publish_change(db, "update", "*")
+    db.commit()
+    for row in rows:
+        pokemon_changed("update", row.id)
+    return rows
+
+
+def delete_pokemon_bulk(db: Session, ids: List[int]) -> List[int]:
+    table = Pokemon.__table__
+    deleted = []
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        statement = (
+            delete(table)
+            .where(table.c.id.in_(ids[start : start + BULK_CHUNK_SIZE]))
+            .returning(table.c.id)
+        )
+        deleted.extend(db.execute(statement).scalars().all())
+
+    _publish_change(db, "delete", "*")
+    db.commit()
+    for id in deleted:
+        pokemon_changed("delete", id)
+    return deleted
+
+
+def get_pokemon_version(db: Session, id: int) -> Optional[int]:
+    # read from the table, the cache misses other workers' writes without NOTIFY
+    return db.query(Pokemon.version).filter(Pokemon.id == id).scalar()
+
+
+def count_pokemon(db: Session, clauses: Sequence = (), key: Hashable = "*") -> int:
+    total = pokemon_counts.get(key)
+    if total is None:
+        total = db.query(func.count(Pokemon.id)).filter(*clauses).scalar()
+        pokemon_counts.set(key, total)
+    return total
+
+
+def adjust_pokemon_count(delta: int):
+    pokemon_counts.update("*", lambda total: total + delta)
+    pokemon_counts.invalidate_where(lambda key, total: key != "*")
+
+
+# Derived in-memory state (summaries, indexes) registers here to hear about pokemon
+# writes: committed writes of this worker as well as notifications from the others.
+# Listeners get the change and the pokemon id, or None when any row may have changed.
+_change_listeners: List[Callable[[str, Optional[int]], None]] = []
+
+
+# Bumped with every pokemon write this worker hears about, see `_notify_listeners`.
+# In-memory copies of the table compare it with the version they were built at.
+pokemon_table_version = 0
+_table_version_lock = threading.Lock()
+
+
+def on_pokemon_change(listener: Callable[[str, Optional[int]], None]):
+    _change_listeners.append(listener)
+
+
+def _notify_listeners(change: str, id: Optional[int]):
+    global pokemon_table_version
+    with _table_version_lock:
+        pokemon_table_version += 1
+    for listener in _change_listeners:
+        listener(change, id)
+
+
+def pokemon_changed(change: str, id: int):
+    """
+    Local cache bookkeeping after a committed pokemon write.
+    """
+    pokemon_cache.pop(id)
+    if change == "create":
+        adjust_pokemon_count(1)
+    elif change == "delete":
+        adjust_pokemon_count(-1)
+    _notify_listeners(change, id)
+
+
+def pokemon_table_changed(change: str):
+    """
+    Local bookkeeping after a write that may have touched any row, e.g. an import.
+    """
+    pokemon_cache.clear()
+    pokemon_counts.clear()
+    _notify_listeners(change, None)
+
+
+def change_notification(change: str, id):
+    # "*" stands for a batch of rows, the other workers then drop all entries
+    return notify.notification(f"pokemon:{change}:{id}")
+
+
+def _publish_change(db: Session, change: str, id):
+    statement = change_notification(change, id)
+    if statement is not None:
+        db.execute(statement)
+
+
+def _on_notification(payload: str):
+    table, change, id = payload.split(":")
+    if table != "pokemon":
+        return
+    if id == "*":
+        pokemon_table_changed(change)
+        return
+
+    pokemon_cache.pop(int(id))
+    # the cached totals may or may not include the other worker's write already
+    if change != "update":
+        pokemon_counts.clear()
+    _notify_listeners(change, int(id))
+
+
+def _reset_caches():
+    pokemon_table_changed("reset")
+
+
+notify.subscribe(_on_notification, reset=_reset_caches)
@@ -1,9 +1,12 @@
 from sqlalchemy import (
     Boolean,
     Column,
+    Index,
     Integer,
     String,
     MetaData,
+    func,
+    text,
 )
 from sqlalchemy.orm import declarative_base
 
@@ -28,6 +31,10 @@ class User(Base):
     last_name = Column(String)
     password = Column(String)
 
+    __table_args__ = (
+        Index("uq_users_email_lower", func.lower(email), unique=True),
+    )
+
 
 class Pokemon(Base):
     __tablename__ = "pokemon"
@@ -44,3 +51,34 @@ class Pokemon(Base):
     speed = Column(Integer)
     generation = Column(Integer)
     legendary = Column(Boolean)
+    # bumped by every write, source of the ETags and of If-Match checks
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+
+    # (column, id) pairs serve both ORDER BY column and the keyset tiebreaker
+    __table_args__ = tuple(
+        Index(f"ix_pokemon_{column}", column, "id")
+        for column in (
+            "name",
+            "type_1",
+            "type_2",
+            "total",
+            "hp",
+            "attack",
+            "defense",
+            "sp_atk",
+            "sp_def",
+            "speed",
+            "generation",
+        )
+    ) + (
+        # equality filters combined with the default sort on name
+        Index("ix_pokemon_type_1_name", "type_1", "name", "id"),
+        Index("ix_pokemon_type_2_name", "type_2", "name", "id"),
+        Index("ix_pokemon_generation_name", "generation", "name", "id"),
+        Index(
+            "ix_pokemon_legendary_name",
+            "name",
+            "id",
+            postgresql_where=text("legendary"),
+        ),
+    )
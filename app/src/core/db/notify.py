@@ -0,0 +1,117 @@
+import logging
+import re
+import select
+import threading
+from typing import Callable, List, Optional
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import func
+from sqlalchemy import select as sql_select
+
+from src.core.config import settings
+
+# Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+#
+# Writers publish a payload inside their transaction, so it is only delivered once
+# the transaction commits. Every worker runs one listener thread on a dedicated
+# connection (outside the pool) and hands each payload to the subscribed handlers.
+# When the listener (re)connects it calls the reset handlers, because notifications
+# sent while it was disconnected are lost.
+
+logger = logging.getLogger(__name__)
+
+_handlers: List[Callable[[str], None]] = []
+_reset_handlers: List[Callable[[], None]] = []
+_listener: Optional["NotificationListener"] = None
+
+
+def channel() -> Optional[str]:
+    name = settings().cache_notify_channel
+    if name and not re.fullmatch(r"[a-z_][a-z0-9_]*", name):
+        raise ValueError(f"Invalid notification channel name: {name!r}")
+    return name
+
+
+def subscribe(handler: Callable[[str], None], reset: Callable[[], None]):
+    _handlers.append(handler)
+    _reset_handlers.append(reset)
+
+
+def notification(payload: str):
+    """
+    Statement publishing ``payload`` to the other workers, or None when
+    cross-worker invalidation is disabled. Execute it in the writing transaction.
+    """
+    name = channel()
+    if name is None:
+        return None
+    return sql_select(func.pg_notify(name, payload))
+
+
+def dispatch(payload: str):
+    for handler in _handlers:
+        try:
+            handler(payload)
+        except Exception:
+            logger.exception(f"Notification handler failed for {payload!r}")
+
+
+class NotificationListener(threading.Thread):
+    def __init__(self, connect_args: dict, channel: str, poll_interval: float = 1.0):
+        super(NotificationListener, self).__init__(
+            name="pg-notify-listener", daemon=True
+        )
+        self._connect_args = connect_args
+        self._channel = channel
+        self._poll_interval = poll_interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = psycopg2.connect(**self._connect_args)
+                connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                connection.cursor().execute(f"LISTEN {self._channel}")
+                for reset in _reset_handlers:
+                    reset()
+                self._listen(connection)
+            except psycopg2.Error:
+                logger.exception("Notification listener lost its connection")
+                self._stopped.wait(5)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _listen(self, connection):
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([connection], [], [], self._poll_interval)
+            if not readable:
+                continue
+            connection.poll()
+            while connection.notifies:
+                dispatch(connection.notifies.pop(0).payload)
+
+
+def start(engine):
+    global _listener
+    name = channel()
+    if name is None or _listener is not None:
+        return
+
+    connect_args = engine.url.translate_connect_args(
+        username="user", database="dbname"
+    )
+    _listener = NotificationListener(connect_args, name)
+    _listener.start()
+
+
+def stop():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
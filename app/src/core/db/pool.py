@@ -0,0 +1,122 @@
+import threading
+import time
+from typing import Callable, Dict, Iterator, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from src.core.metrics import Histogram
+
+
+class CheckoutStats(object):
+    def __init__(self):
+        self.wait_seconds = Histogram()
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def record(self, elapsed: float, timed_out: bool):
+        self.wait_seconds.observe(elapsed)
+        with self._lock:
+            self.checkouts += 1
+            if timed_out:
+                self.timeouts += 1
+
+
+class _InstrumentedPoolMixin(object):
+    """
+    Times every checkout, including waits for a free connection and the connect
+    of new overflow connections, and counts checkout timeouts.
+
+    ``__init__`` is deliberately not overridden: ``create_engine`` inspects the
+    pool class signature to decide which ``pool_*`` arguments to forward.
+    """
+
+    @property
+    def checkout_stats(self) -> CheckoutStats:
+        stats = self.__dict__.get("_checkout_stats")
+        if stats is None:
+            stats = self.__dict__.setdefault("_checkout_stats", CheckoutStats())
+        return stats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super(_InstrumentedPoolMixin, self)._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.checkout_stats.record(time.perf_counter() - start, timed_out)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool: Pool) -> Dict:
+    stats = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                # QueuePool counts overflow from -pool_size upwards
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            }
+        )
+    if isinstance(pool, _InstrumentedPoolMixin):
+        checkout = pool.checkout_stats
+        stats.update(
+            {
+                "checkouts": checkout.checkouts,
+                "timeouts": checkout.timeouts,
+                "checkout_wait_seconds": checkout.wait_seconds.snapshot(),
+            }
+        )
+    return stats
+
+
+POOL_GAUGES = {
+    "size": "Connections the pool keeps open.",
+    "checked_out": "Connections in use.",
+    "overflow": "Connections open beyond the pool size.",
+}
+
+
+def pool_metrics(
+    pools: Callable[[], Dict[str, Pool]]
+) -> Callable[[], Iterator[Tuple]]:
+    """
+    A metrics collector (see ``Registry.collector``) for the named pools returned
+    by ``pools``.
+    """
+
+    def collect():
+        current = pools()
+        stats = {name: pool_stats(pool) for name, pool in current.items()}
+        for key, help in POOL_GAUGES.items():
+            samples = [([("pool", n)], s[key]) for n, s in stats.items() if key in s]
+            yield f"db_pool_{key}", "gauge", help, samples
+
+        checkouts = [
+            ([("pool", name)], pool.checkout_stats)
+            for name, pool in current.items()
+            if isinstance(pool, _InstrumentedPoolMixin)
+        ]
+        yield "db_pool_checkout_timeouts_total", "counter", "Checkout timeouts.", [
+            (labels, checkout.timeouts) for labels, checkout in checkouts
+        ]
+        yield "db_pool_checkout_wait_seconds", "histogram", "Checkout wait time.", [
+            (labels, checkout.wait_seconds) for labels, checkout in checkouts
+        ]
+
+    return collect
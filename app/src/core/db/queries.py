@@ -0,0 +1,134 @@
+"""
+Attributes the SQL run by an engine to the request that ran it.
+
+``instrument(engine)`` times every cursor execution; while a request is being
+served (see ``track``) the queries are added to its ``QueryStats``. The stats
+live in a context variable, which Starlette copies into the threadpool of sync
+routes and SQLAlchemy into the greenlets of the async engine.
+"""
+import collections
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+
+
+class QueryStats(object):
+    def __init__(self, route: Optional[str] = None):
+        self.route = route
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = collections.Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.seconds += elapsed
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements run at least ``threshold`` times, most frequent first. The
+        same SQL over and over within one request is the signature of an N+1.
+        """
+        return [(s, n) for s, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def track(route: Optional[str] = None) -> Tuple[QueryStats, object]:
+    """
+    Starts collecting the queries of the current context. Returns the stats and
+    the token to pass to ``untrack``.
+    """
+    stats = QueryStats(route)
+    return stats, _current.set(stats)
+
+
+def untrack(token):
+    _current.reset(token)
+
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def parameters_shape(parameters, many: bool):
+    """
+    The names and types of the bound parameters, never their values.
+    """
+    if many:
+        rows = list(parameters)
+        first = parameters_shape(rows[0], False) if rows else None
+        return {"rows": len(rows), "row": first}
+    if isinstance(parameters, dict):
+        return {k: type(v).__name__ for k, v in parameters.items()}
+    return [type(v).__name__ for v in parameters or ()]
+
+
+class SlowQueryLog(object):
+    """
+    The most recent statements that took at least ``threshold`` seconds. They
+    are logged as warnings as well.
+    """
+
+    def __init__(self, threshold: float, size: int):
+        self.threshold = threshold
+        self._entries: Deque[Dict] = collections.deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, statement: str, parameters, many: bool, elapsed: float):
+        stats = _current.get()
+        entry = {
+            "at": time.time(),
+            "duration": elapsed,
+            "route": stats.route if stats is not None else None,
+            "statement": statement,
+            "parameters": parameters_shape(parameters, many),
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.count += 1
+        logging.warning(
+            "Slow query (%.3fs) in %s: %s", elapsed, entry["route"], statement
+        )
+
+    def entries(self) -> List[Dict]:
+        """
+        Newest first.
+        """
+        with self._lock:
+            return list(reversed(self._entries))
+
+
+slow_queries = SlowQueryLog(
+    threshold=settings().slow_query_seconds, size=settings().slow_query_history
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    # on the execution context rather than conn.info, so a failed statement
+    # leaves nothing behind
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    elapsed = time.perf_counter() - context._query_start
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed >= slow_queries.threshold:
+        slow_queries.record(statement, parameters, many, elapsed)
+
+
+def instrument(engine: Engine):
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
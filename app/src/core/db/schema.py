@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
 
 class AccessToken(BaseModel):
@@ -51,6 +51,7 @@ class Pokemon(BaseModel):
     speed: int
     generation: int
     legendary: bool = False
+    version: int = 1
 
     class Config:
         orm_mode = True
@@ -78,3 +79,92 @@ class NewPokemon(BaseModel):
 class UpdatePokemon(NewPokemon):
     class Config:
         allow_population_by_field_name = True
+
+
+class PatchPokemon(BaseModel):
+    """
+    Partial update of a pokemon, only the fields present in the body are written.
+    """
+
+    name: Optional[str] = None
+    type_1: Optional[str] = None
+    type_2: Optional[str] = None
+    total: Optional[int] = None
+    hp: Optional[int] = None
+    attack: Optional[int] = None
+    defense: Optional[int] = None
+    sp_atk: Optional[int] = None
+    sp_def: Optional[int] = None
+    speed: Optional[int] = None
+    generation: Optional[int] = None
+    legendary: Optional[bool] = None
+
+    @validator(
+        "name",
+        "total",
+        "hp",
+        "attack",
+        "defense",
+        "sp_atk",
+        "sp_def",
+        "speed",
+        "generation",
+        "legendary",
+        pre=True,
+    )
+    def not_null(cls, value, field):
+        # absent means unchanged, only the types may be cleared with null
+        if value is None:
+            raise ValueError(f"{field.name} may not be null")
+        return value
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class BulkUpdatePokemon(UpdatePokemon):
+    id: int
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+
+class BulkResult(BaseModel):
+    items: List[Pokemon] = []
+    errors: List[BulkItemError] = []
+
+
+class BulkDeleteResult(BaseModel):
+    ids: List[int] = []
+    errors: List[BulkItemError] = []
+
+
+class ImportResult(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+
+
+class PokemonStatsGroup(BaseModel):
+    group: Dict[str, Any] = {}
+    count: int
+    stats: Dict[str, Dict[str, Optional[float]]] = {}
+
+
+class StatVector(BaseModel):
+    hp: float
+    attack: float
+    defense: float
+    sp_atk: float
+    sp_def: float
+    speed: float
+
+
+class SimilarPokemon(BaseModel):
+    similarity: float
+    pokemon: Dict[str, Any]
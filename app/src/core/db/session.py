@@ -1,5 +1,5 @@
-from typing import Generator
-from .config import SessionLocal
+from typing import AsyncGenerator, Generator
+from .config import AsyncSessionLocal, SessionLocal
 
 # Dependency
 
@@ -10,3 +10,8 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        yield db
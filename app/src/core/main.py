@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 from starlette.middleware.cors import CORSMiddleware
 
 from .api.auth.routes import auth_router
@@ -7,16 +10,29 @@ from .config import *
 # include routes
 from src.core.api.users.routes import user_router
 from src.core.api.pokemon.routes import pokemon_route
-from fastapi import FastAPI, APIRouter
+from src.core.api.internal.routes import internal_router
+from src.core.db import notify
+from src.core.db.config import (
+    dispose,
+    get_async_engine,
+    get_engine,
+    prewarm,
+    prewarm_async,
+)
+from src.core.metrics import registry
+from src.core.middleware import MetricsMiddleware, ProfilingMiddleware
+from src.core.profiling import profiler
+from fastapi import FastAPI, APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.openapi.utils import get_openapi
 
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
-app = FastAPI(docs_url=None, redoc_url=None, debug=False)
+# DOCS
+docs_router = APIRouter(include_in_schema=False)
 
 
-# DOCS
-@app.get("/docs", include_in_schema=False)
+@docs_router.get("/docs")
 def overridden_swagger():
     return get_swagger_ui_html(
         openapi_url=settings().openapi_url,
@@ -24,7 +40,7 @@ def overridden_swagger():
     )
 
 
-@app.get("/redoc", include_in_schema=False)
+@docs_router.get("/redoc")
 def overridden_redoc():
     return get_redoc_html(
         openapi_url=settings().openapi_url,
@@ -32,20 +48,23 @@ def overridden_redoc():
     )
 
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
+def custom_openapi(app: FastAPI):
+    def openapi():
+        if app.openapi_schema:
+            return app.openapi_schema
 
-    openapi_schema = get_openapi(
-        title=settings().app_name,
-        version="0.0.0",
-        openapi_version="3.0.3",
-        description=settings().app_description,
-        routes=app.routes,
-    )
+        openapi_schema = get_openapi(
+            title=settings().app_name,
+            version="0.0.0",
+            openapi_version="3.0.3",
+            description=settings().app_description,
+            routes=app.routes,
+        )
 
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+        app.openapi_schema = openapi_schema
+        return app.openapi_schema
+
+    return openapi
 
 
 ping_router = APIRouter(prefix="/ping", include_in_schema=False)
@@ -59,28 +78,96 @@ def main_router_get():
     return "pong"
 
 
-# include routes
-app.include_router(user_router)
-app.include_router(pokemon_route)
-app.include_router(auth_router)
-# set custom api
-app.openapi = custom_openapi
+metrics_router = APIRouter(prefix="/metrics", include_in_schema=False)
 
 
-# CORS
-# origins = [
-#     "http://localhost:4005",
-# ]
+@metrics_router.get("", status_code=200)
+def metrics():
+    """
+    Metrics of this worker in the Prometheus text format.
+    """
+    return Response(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
-origins = [
-    "*",
-]
+
+def create_app() -> FastAPI:
+    """
+    Builds the application. Nothing touches the database before startup, which
+    runs in every worker, so a preloading server can fork safely; see
+    `src.core.db.config`.
+    """
+    app = FastAPI(docs_url=None, redoc_url=None, debug=settings().debug)
+
+    @app.on_event("startup")
+    async def start_database():
+        count = settings().database.pool_prewarm
+        get_async_engine()
+        # connecting blocks, so the sync pool fills in a thread while the async
+        # pool fills on the loop
+        await asyncio.gather(run_in_threadpool(prewarm, count), prewarm_async(count))
+        notify.start(get_engine())
+
+    @app.on_event("startup")
+    def build_openapi():
+        # the schema walks every route; build it before the first /docs visit
+        threading.Thread(target=app.openapi, name="openapi", daemon=True).start()
+
+    @app.on_event("shutdown")
+    async def stop_database():
+        notify.stop()
+        await dispose()
+
+    # include routes
+    app.include_router(docs_router)
+    app.include_router(user_router)
+    app.include_router(pokemon_route)
+    app.include_router(auth_router)
+    app.include_router(internal_router)
+    app.include_router(metrics_router)
+    # set custom api
+    app.openapi = custom_openapi(app)
+
+    # CORS
+    # origins = [
+    #     "http://localhost:4005",
+    # ]
+
+    origins = [
+        "*",
+    ]
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[
+            "X-Next-Cursor",
+            "X-Prev-Cursor",
+            "X-Has-Next",
+            "X-Total-Count",
+            "X-Total-Pages",
+            "ETag",
+            "Server-Timing",
+            "X-Repeated-Query",
+            "X-Profile-Id",
+        ],
+    )
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiler=profiler,
+        sample_rate=settings().profile_sample_rate,
+    )
+    # outermost, so the timings include the other middleware
+    app.add_middleware(
+        MetricsMiddleware,
+        debug=settings().debug,
+        repeat_threshold=settings().query_repeat_threshold,
+    )
+    return app
 
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# for `uvicorn src.core.main:app`; `--factory src.core.main:create_app` works too
+app = create_app()
@@ -0,0 +1,176 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+class Histogram(object):
+    """
+    Fixed-bucket histogram with cumulative (Prometheus style ``le``) buckets.
+    """
+
+    DEFAULT_BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self.sum, self.count
+
+        cumulative = {}
+        running = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            running += bucket_count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = count
+
+        return {"buckets": cumulative, "sum": total, "count": count}
+
+
+class Counter(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+
+class Gauge(Counter):
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+
+class Family(object):
+    """
+    One metric per combination of label values, created on first use.
+    """
+
+    def __init__(self, kind: str, help: str, labels: Sequence[str], factory):
+        self.kind = kind
+        self.help = help
+        self.labels = tuple(labels)
+        self._factory = factory
+        self._children: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def child(self, *values):
+        metric = self._children.get(values)
+        if metric is None:
+            with self._lock:
+                metric = self._children.setdefault(values, self._factory())
+        return metric
+
+    def items(self) -> List[Tuple[Tuple, object]]:
+        with self._lock:
+            return sorted(self._children.items(), key=lambda item: item[0])
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(pairs: Sequence[Tuple[str, object]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class Registry(object):
+    """
+    Metrics of this worker, rendered in the Prometheus text format.
+
+    Besides the families created here, collectors can be registered for values
+    that live elsewhere (e.g. the connection pools); a collector returns
+    ``(name, kind, help, [(labels, metric or value), ...])`` tuples.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, Family] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple]]] = []
+
+    def _family(self, name: str, kind: str, help: str, labels, factory) -> Family:
+        family = self._families.setdefault(name, Family(kind, help, labels, factory))
+        if family.kind != kind or family.labels != tuple(labels):
+            raise ValueError(f"Metric {name} is already registered differently")
+        return family
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Family:
+        return self._family(name, "counter", help, labels, Counter)
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Family:
+        return self._family(name, "gauge", help, labels, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS,
+    ) -> Family:
+        return self._family(
+            name, "histogram", help, labels, lambda: Histogram(buckets)
+        )
+
+    def collector(self, collect: Callable[[], Iterable[Tuple]]):
+        self._collectors.append(collect)
+
+    def _collect(self) -> Iterator[Tuple]:
+        for name, family in sorted(self._families.items()):
+            samples = [
+                (list(zip(family.labels, values)), metric)
+                for values, metric in family.items()
+            ]
+            yield name, family.kind, family.help, samples
+        for collect in self._collectors:
+            yield from collect()
+
+    def render(self) -> str:
+        lines = []
+        for name, kind, help, samples in self._collect():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in samples:
+                labels = list(labels)
+                if isinstance(metric, Histogram):
+                    snapshot = metric.snapshot()
+                    for bound, count in snapshot["buckets"].items():
+                        bucket = _labels(labels + [("le", bound)])
+                        lines.append(f"{name}_bucket{bucket} {count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {snapshot['sum']!r}")
+                    lines.append(f"{name}_count{_labels(labels)} {snapshot['count']}")
+                else:
+                    value = metric.value if isinstance(metric, Counter) else metric
+                    lines.append(f"{name}{_labels(labels)} {float(value)!r}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
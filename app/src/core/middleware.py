@@ -0,0 +1,176 @@
+import random
+import re
+import time
+from typing import List, Optional, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core import auth
+from src.core.db import queries
+from src.core.metrics import registry
+from src.core.profiling import Profiler
+
+# requests matching no route share one label, raw paths would be unbounded
+UNMATCHED = "<unmatched>"
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Time until the response is complete.",
+    ["method", "route"],
+)
+requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "Requests being served.", ["method", "route"]
+)
+responses = registry.counter(
+    "http_responses_total", "Responses by status code.", ["method", "route", "status"]
+)
+request_queries = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    ["method", "route"],
+    buckets=QUERY_BUCKETS,
+)
+request_db_seconds = registry.histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request.",
+    ["method", "route"],
+)
+repeated_queries = registry.counter(
+    "http_requests_repeated_queries_total",
+    "Requests that ran the same statement repeatedly, likely N+1 patterns.",
+    ["method", "route"],
+)
+
+
+def route_path(scope: Scope) -> str:
+    """
+    The path template of the route serving ``scope``, e.g. `/pokemon/{id}`.
+    """
+    partial = UNMATCHED
+    for route in scope["app"].routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial == UNMATCHED:
+            # wrong method, the router answers 405 for it
+            partial = route.path
+    return partial
+
+
+def _header_value(statement: str, limit: int = 200) -> str:
+    statement = re.sub(r"\s+", " ", statement).strip()
+    if len(statement) > limit:
+        statement = statement[: limit - 3] + "..."
+    return statement
+
+
+def summary_headers(
+    stats: queries.QueryStats, threshold: int
+) -> List[Tuple[bytes, bytes]]:
+    headers = [
+        (
+            b"server-timing",
+            f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"'.encode(),
+        )
+    ]
+    for statement, count in stats.repeated(threshold):
+        value = f"{count}x {_header_value(statement)}"
+        headers.append((b"x-repeated-query", value.encode("latin-1", "replace")))
+    return headers
+
+
+class MetricsMiddleware(object):
+    """
+    Records latency, status codes, requests in flight and the SQL run per
+    request, labelled by route template. With ``debug`` the response carries a
+    `Server-Timing` header with the request's DB time and one `X-Repeated-Query`
+    header per statement run at least ``repeat_threshold`` times.
+    """
+
+    def __init__(self, app: ASGIApp, debug: bool = False, repeat_threshold: int = 2):
+        self.app = app
+        self.debug = debug
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        labels = (scope["method"], route_path(scope))
+        in_progress = requests_in_progress.child(*labels)
+        status = 500
+        stats, token = queries.track(" ".join(labels))
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.debug:
+                    headers = summary_headers(stats, self.repeat_threshold)
+                    message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_seconds.child(*labels).observe(time.perf_counter() - start)
+            in_progress.dec()
+            queries.untrack(token)
+            responses.child(*labels, str(status)).inc()
+            request_queries.child(*labels).observe(stats.count)
+            request_db_seconds.child(*labels).observe(stats.seconds)
+            if stats.repeated(self.repeat_threshold):
+                repeated_queries.child(*labels).inc()
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware(object):
+    """
+    Takes a sampling profile of requests of an admin sending `X-Profile: 1` and
+    of a random ``sample_rate`` fraction of all requests. The response carries
+    the id to fetch the profile with from /internal/profiles.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: Profiler, sample_rate: float = 0.0):
+        self.app = app
+        self.profiler = profiler
+        self.sample_rate = sample_rate
+
+    def _reason(self, scope: Scope) -> Optional[str]:
+        if _header(scope, b"x-profile") == "1":
+            if "admin" in auth.header_scopes(_header(scope, b"authorization")):
+                return "requested"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        reason = self._reason(scope) if scope["type"] == "http" else None
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = self.profiler.start(f"{scope['method']} {route_path(scope)}", reason)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                header = (b"x-profile-id", str(profile.id).encode())
+                message["headers"] = list(message.get("headers", [])) + [header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.profiler.stop(profile)
@@ -0,0 +1,173 @@
+"""
+Sampling profiler for single requests.
+
+While at least one profile is active a background thread takes the stacks of
+the threads serving requests (the event loop and the threadpool workers) from
+``sys._current_frames`` every ``interval`` seconds. Idle threads, i.e. a worker
+waiting for work or the loop waiting in ``select``, are skipped.
+
+Profiles are kept as folded stacks, one ``frame;frame;frame count`` line per
+distinct stack, which flamegraph.pl, speedscope and most other flame graph tools
+read directly. Python cannot tell which request a thread works for, so samples
+of other requests served concurrently by this worker end up in the profile too.
+"""
+import collections
+import itertools
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+
+_ids = itertools.count(1)
+
+
+@lru_cache(maxsize=4096)
+def _location(filename: str) -> str:
+    # relative to the longest sys.path entry, e.g. sqlalchemy/engine/base.py
+    for prefix in sorted((p for p in sys.path if p), key=len, reverse=True):
+        if filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1 :]
+    return filename
+
+
+def _stack(frame) -> List[Tuple[str, str, int]]:
+    """
+    ``(filename, function, first line)`` of every frame, outermost first.
+    """
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_name, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _is(frame: Tuple[str, str, int], suffix: str, function: str) -> bool:
+    return frame[1] == function and frame[0].endswith(suffix)
+
+
+WORKER = ("anyio/_backends/_asyncio.py", "run")
+
+
+def _serving(stack: List[Tuple[str, str, int]], loop: bool) -> bool:
+    """
+    True if the thread works on a request rather than waiting for one.
+    """
+    if loop:
+        # the loop polls for I/O when no callback is ready
+        return not _is(stack[-1], "selectors.py", "select")
+    for outer, inner in zip(stack, stack[1:]):
+        if _is(outer, *WORKER):
+            return not _is(inner, "queue.py", "get")
+    return False
+
+
+def fold(stack: List[Tuple[str, str, int]]) -> str:
+    return ";".join(f"{name} ({_location(file)}:{line})" for file, name, line in stack)
+
+
+class Profile(object):
+    def __init__(self, route: str, reason: str, loop: int):
+        self.id = next(_ids)
+        # the thread of the event loop serving the request
+        self.loop = loop
+        self.route = route
+        self.reason = reason
+        self.started = time.time()
+        self.duration: Optional[float] = None
+        self.samples = 0
+        self.stacks: Dict[str, int] = collections.Counter()
+
+    def add(self, stack: str):
+        self.samples += 1
+        self.stacks[stack] += 1
+
+    def folded(self) -> str:
+        return "".join(f"{s} {n}\n" for s, n in self.stacks.most_common())
+
+    def info(self) -> Dict:
+        return {
+            "id": self.id,
+            "route": self.route,
+            "reason": self.reason,
+            "started": self.started,
+            "duration": self.duration,
+            "samples": self.samples,
+        }
+
+
+class Profiler(object):
+    def __init__(self, interval: float, history: int):
+        self.interval = interval
+        self._active: Dict[int, Profile] = {}
+        self._loops: Dict[int, int] = {}
+        self._history: Deque[Profile] = collections.deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, route: str, reason: str) -> Profile:
+        """
+        Starts profiling a request served on the calling thread's event loop.
+        """
+        profile = Profile(route, reason, threading.get_ident())
+        with self._lock:
+            self._active[profile.id] = profile
+            self._loops[profile.loop] = self._loops.get(profile.loop, 0) + 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="profiler", daemon=True
+                )
+                self._thread.start()
+        return profile
+
+    def stop(self, profile: Profile):
+        with self._lock:
+            if self._active.pop(profile.id, None) is None:
+                return
+            self._loops[profile.loop] -= 1
+            if not self._loops[profile.loop]:
+                del self._loops[profile.loop]
+            profile.duration = time.time() - profile.started
+            self._history.append(profile)
+
+    def _sample(self):
+        own = threading.get_ident()
+        with self._lock:
+            loops = set(self._loops)
+        stacks = []
+        for thread, frame in sys._current_frames().items():
+            stack = _stack(frame)
+            if thread != own and stack and _serving(stack, thread in loops):
+                stacks.append(fold(stack))
+        # under the lock, a stopped profile does not change anymore
+        with self._lock:
+            for profile in self._active.values():
+                for stack in stacks:
+                    profile.add(stack)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+            self._sample()
+            time.sleep(self.interval)
+
+    def profiles(self) -> List[Dict]:
+        with self._lock:
+            return [profile.info() for profile in reversed(self._history)]
+
+    def get(self, id: int) -> Optional[Profile]:
+        with self._lock:
+            return next((p for p in self._history if p.id == id), None)
+
+
+profiler = Profiler(
+    interval=settings().profile_interval, history=settings().profile_history
+)
@@ -1,9 +1,120 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
 from fastapi.security import OAuth2PasswordBearer
 import bcrypt
 
+from src.core.config import settings
+from src.core.metrics import registry
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+class ExecutorSaturated(RuntimeError):
+    pass
+
+
+class BoundedExecutor(object):
+    """
+    Thread pool running at most ``max_workers`` jobs at once and queueing at most
+    ``max_pending`` more. Submissions beyond that raise ``ExecutorSaturated``
+    instead of piling up behind a login storm.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, name: str):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+
+    async def run(self, func: Callable, *args) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ExecutorSaturated(
+                    f"{self.pending} jobs already waiting for a worker"
+                )
+            self.pending += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.pending)
+
+        try:
+            future = self._executor.submit(self._call, func, args)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        # A job cancelled while still queued (the request went away) never reaches
+        # `_call`, so it leaves the queue here instead.
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def _done(self, future: Future):
+        if future.cancelled():
+            with self._lock:
+                self.pending -= 1
+                self.cancelled += 1
+
+    def _call(self, func: Callable, args) -> Any:
+        with self._lock:
+            self.pending -= 1
+            self.running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queue_depth": self.pending,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+        }
+
+
+# bcrypt releases the GIL while hashing, so a small thread pool gives real parallelism
+password_executor = BoundedExecutor(
+    max_workers=settings().password_hash_workers,
+    max_pending=settings().password_hash_queue,
+    name="password-hash",
+)
+
+EXECUTOR_METRICS = {
+    "queue_depth": ("gauge", "Jobs waiting for a worker."),
+    "running": ("gauge", "Jobs being run."),
+    "completed": ("counter", "Jobs run to completion."),
+    "rejected": ("counter", "Jobs rejected because the queue was full."),
+    "cancelled": ("counter", "Jobs cancelled while queued."),
+}
+
+
+def _password_executor_metrics():
+    # a metrics collector, see ``Registry.collector``
+    stats = password_executor.stats()
+    for key, (kind, help) in EXECUTOR_METRICS.items():
+        name = f"password_hash_{key}" + ("_total" if kind == "counter" else "")
+        yield name, kind, help, [([], stats[key])]
+
+
+registry.collector(_password_executor_metrics)
+
+
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
@@ -12,3 +123,7 @@ def hash_password(password: str) -> str:
 
 def check_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+async def check_password_async(password: str, hashed_password: str) -> bool:
+    return await password_executor.run(check_password, password, hashed_password)
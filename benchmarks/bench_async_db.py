@@ -0,0 +1,92 @@
+"""
+Throughput of the sync Session + threadpool path versus the native asyncio path
+for `get_pokemon_by_id` at high concurrency.
+
+The sync path mirrors what FastAPI does for a `def` route: every lookup hops to
+Starlette's threadpool and uses a blocking psycopg2 session. The async path awaits
+`async_crud` on an asyncpg session without leaving the event loop.
+
+    PYTHONPATH=app python benchmarks/bench_async_db.py --concurrency 200 --requests 20000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import func, select
+from starlette.concurrency import run_in_threadpool
+
+from src.core.db import async_crud, crud, models
+from src.core.db.config import AsyncSessionLocal, SessionLocal, async_engine, engine
+
+
+def _sync_lookup(id: int):
+    db = SessionLocal()
+    try:
+        return crud.get_pokemon_by_id(db, id)
+    finally:
+        db.close()
+
+
+async def sync_path(id: int):
+    return await run_in_threadpool(_sync_lookup, id)
+
+
+async def async_path(id: int):
+    async with AsyncSessionLocal() as db:
+        return await async_crud.get_pokemon_by_id(db, id)
+
+
+async def drive(lookup, ids, concurrency: int):
+    queue = list(ids)
+    latencies = []
+
+    async def worker():
+        while queue:
+            id = queue.pop()
+            start = time.perf_counter()
+            await lookup(id)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies)
+
+
+def report(name: str, elapsed: float, latencies):
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(
+        f"{name:<10} {len(latencies) / elapsed:>10.0f} req/s  "
+        f"p50 {pct(0.50):7.2f} ms  p99 {pct(0.99):7.2f} ms  "
+        f"mean {statistics.mean(latencies) * 1000:7.2f} ms"
+    )
+
+
+async def main(args):
+    db = SessionLocal()
+    max_id = db.execute(select(func.max(models.Pokemon.id))).scalar()
+    db.close()
+
+    ids = [random.randint(1, max_id) for _ in range(args.requests)]
+
+    # warm both pools so connection setup is not part of the measurement
+    await drive(sync_path, ids[:100], 10)
+    await drive(async_path, ids[:100], 10)
+
+    print(f"{args.requests} lookups at concurrency {args.concurrency}")
+    report("sync", *await drive(sync_path, ids, args.concurrency))
+    report("async", *await drive(async_path, ids, args.concurrency))
+
+    engine.dispose()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
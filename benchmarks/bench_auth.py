@@ -0,0 +1,227 @@
+"""
+Cost of every stage of per-request authentication and of login.
+
+Each stage is timed in isolation. The results are the median of --rounds
+rounds, in microseconds per call:
+
+- token: `create_access_token`, raw `jwt.decode`, `JWTBearer.verify_token`
+  cold (claims cache cleared) and warm
+- bcrypt: hash and check at several cost factors (the app uses gensalt's
+  default of 12)
+- lookup: `crud.get_user_by_email` among --users generated users, with and
+  without the `uq_users_email_lower` index
+- dependencies: `OAuth2PasswordBearer` parsing and the full `get_current_user`
+  resolution through FastAPI, with cold and warm caches
+
+The users are generated, and the index is dropped, inside a transaction that is
+rolled back at the end; it holds a lock on the users table meanwhile, so point
+the benchmark at a development database. The full resolution reads the benchmark
+user through the app's own sessions, so that user is committed; it is the one the
+tests use.
+
+    PYTHONPATH=app python benchmarks/bench_auth.py --users 100000 --json auth.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from contextlib import AsyncExitStack
+from typing import Callable, Dict
+
+import bcrypt
+import jwt
+from fastapi import Depends
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from src.core import auth, security
+from src.core.db import crud, models
+from src.core.db.config import SessionLocal, engine
+
+EMAIL = "john.doe@petal.com"
+
+SEED_USERS = """
+INSERT INTO users (email, password)
+SELECT 'bench-' || g || '@petal.com', 'x' FROM generate_series(1, :users) AS g
+"""
+
+
+def timed(func: Callable, number: int, rounds: int) -> float:
+    """
+    Microseconds per call, median of ``rounds``.
+    """
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples) * 1e6
+
+
+def timed_async(func: Callable, number: int, rounds: int) -> float:
+    async def run():
+        for _ in range(number):
+            await func()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return timed(lambda: loop.run_until_complete(run()), 1, rounds) / number
+    finally:
+        loop.close()
+
+
+def request(token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/pokemon/1",
+            "query_string": b"",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def current_user_dependant() -> Dependant:
+    def endpoint(user: models.User = Depends(auth.get_current_user)):
+        return user
+
+    return get_dependant(path="/pokemon/{id}", call=endpoint)
+
+
+async def resolve(dependant: Dependant, token: str):
+    # what FastAPI runs for every request before the endpoint itself
+    async with AsyncExitStack() as stack:
+        req = request(token)
+        req.scope["fastapi_astack"] = stack
+        values, errors, *_ = await solve_dependencies(request=req, dependant=dependant)
+        assert not errors and values["user"].email == EMAIL
+
+
+def ensure_user():
+    db = SessionLocal()
+    try:
+        if crud.get_user_by_email(db, EMAIL) is None:
+            user = models.User(email=EMAIL, password=security.hash_password("12345"))
+            db.add(user)
+            db.commit()
+    finally:
+        db.close()
+
+
+def token_stages(args) -> Dict[str, float]:
+    token = auth.create_access_token(sub=EMAIL)
+
+    def verify_cold():
+        auth.claims_cache.clear()
+        auth.JWTBearer.verify_token(token)
+
+    n = args.number
+    return {
+        "create_access_token": timed(
+            lambda: auth.create_access_token(sub=EMAIL), n, args.rounds
+        ),
+        "jwt.decode": timed(
+            lambda: jwt.decode(token, auth.SECRET_KEY, algorithms=[auth.ALGORITHM]),
+            n,
+            args.rounds,
+        ),
+        "verify_token (cold)": timed(verify_cold, n, args.rounds),
+        "verify_token (warm)": timed(
+            lambda: auth.JWTBearer.verify_token(token), n, args.rounds
+        ),
+    }
+
+
+def bcrypt_stages(args) -> Dict[str, float]:
+    results = {}
+    password = b"correct horse battery staple"
+    for cost in args.costs:
+        salt = bcrypt.gensalt(rounds=cost)
+        hashed = bcrypt.hashpw(password, salt)
+        # every cost step doubles the work, keep the slow ones short
+        number = max(1, 2 ** (10 - cost))
+        results[f"bcrypt hash (cost {cost})"] = timed(
+            lambda: bcrypt.hashpw(password, salt), number, args.rounds
+        )
+        results[f"bcrypt check (cost {cost})"] = timed(
+            lambda: bcrypt.checkpw(password, hashed), number, args.rounds
+        )
+    return results
+
+
+def lookup_stages(args) -> Dict[str, float]:
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection)
+    email = f"bench-{args.users // 2}@petal.com"
+    try:
+        connection.execute(text(SEED_USERS), {"users": args.users})
+        connection.execute(text("ANALYZE users"))
+
+        def lookup():
+            crud.get_user_by_email(db, email)
+            db.expunge_all()
+
+        results = {"get_user_by_email (indexed)": timed(lookup, 20, args.rounds)}
+        connection.execute(text("DROP INDEX uq_users_email_lower"))
+        results["get_user_by_email (no index)"] = timed(lookup, 20, args.rounds)
+        return results
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+def dependency_stages(args) -> Dict[str, float]:
+    token = auth.create_access_token(sub=EMAIL)
+    dependant = current_user_dependant()
+
+    async def parse():
+        await security.oauth2_scheme(request(token))
+
+    async def cold():
+        auth.claims_cache.clear()
+        auth.principal_cache.clear()
+        await resolve(dependant, token)
+
+    async def warm():
+        await resolve(dependant, token)
+
+    n = args.number // 10
+    return {
+        "OAuth2PasswordBearer": timed_async(parse, args.number, args.rounds),
+        "get_current_user (cold)": timed_async(cold, n, args.rounds),
+        "get_current_user (warm)": timed_async(warm, n, args.rounds),
+    }
+
+
+def main(args):
+    ensure_user()
+    results = {}
+    for stages in (token_stages, bcrypt_stages, lookup_stages, dependency_stages):
+        results.update(stages(args))
+
+    for name, micros in results.items():
+        print(f"{name:32} {micros:12.1f} us  {1e6 / micros:12.0f} /s")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"us_per_call": results, "users": args.users}, file, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--costs", type=int, nargs="+", default=[4, 8, 10, 12])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    main(parser.parse_args())
@@ -0,0 +1,71 @@
+"""
+Rows per second of POST /pokemon/bulk against one POST /pokemon/ per row.
+
+Runs in-process through the TestClient against the configured database; every
+created row is deleted again at the end.
+
+    PYTHONPATH=app python benchmarks/bench_bulk.py --rows 5000 --batch 1000
+"""
+import argparse
+import time
+
+from fastapi.testclient import TestClient
+
+from src.core import auth
+from src.core.main import app
+
+
+def payload(i: int) -> dict:
+    return {
+        "name": f"bench-{i}",
+        "type_1": "Normal",
+        "total": 400,
+        "hp": 60,
+        "attack": 70,
+        "defense": 60,
+        "sp_atk": 70,
+        "sp_def": 60,
+        "speed": 80,
+        "generation": 1,
+        "legendary": False,
+    }
+
+
+def main(args):
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {auth.create_access_token(sub=args.user)}"}
+    created = []
+
+    try:
+        start = time.perf_counter()
+        for i in range(args.rows):
+            response = client.post("/pokemon/", json=payload(i), headers=headers)
+            created.append(response.json()["id"])
+        single = args.rows / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for offset in range(0, args.rows, args.batch):
+            end = min(offset + args.batch, args.rows)
+            batch = [payload(i) for i in range(offset, end)]
+            response = client.post("/pokemon/bulk", json=batch, headers=headers)
+            created.extend(item["id"] for item in response.json()["items"])
+        bulk = args.rows / (time.perf_counter() - start)
+    finally:
+        for offset in range(0, len(created), args.batch):
+            client.request(
+                "DELETE",
+                "/pokemon/bulk",
+                json=created[offset : offset + args.batch],
+                headers=headers,
+            )
+
+    print(f"single-item: {single:10.0f} rows/s")
+    print(f"bulk ({args.batch}):  {bulk:10.0f} rows/s  ({bulk / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--user", default="john.doe@petal.com")
+    main(parser.parse_args())
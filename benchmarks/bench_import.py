@@ -0,0 +1,51 @@
+"""
+Rows per second of the COPY-based importer.
+
+Imports generated rows inside a transaction that is rolled back afterwards, so
+the configured database is left as it was.
+
+    PYTHONPATH=app python benchmarks/bench_import.py --rows 1000000
+"""
+import argparse
+import time
+
+from src.core.db import bulk_import
+from src.core.db.config import engine
+
+
+def rows(count: int):
+    for i in range(count):
+        yield {
+            "name": f"import-{i}",
+            "type_1": "Normal",
+            "type_2": None,
+            "total": 400,
+            "hp": 60,
+            "attack": 70,
+            "defense": 60,
+            "sp_atk": 70,
+            "sp_def": 60,
+            "speed": 80,
+            "generation": 1 + i % 8,
+            "legendary": False,
+        }
+
+
+def main(args):
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            start = time.perf_counter()
+            result = bulk_import.copy_pokemon(connection, rows(args.rows), args.chunk)
+            elapsed = time.perf_counter() - start
+        finally:
+            transaction.rollback()
+
+    print(f"{result.inserted} rows in {elapsed:.2f}s: {args.rows / elapsed:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk", type=int, default=10_000)
+    main(parser.parse_args())
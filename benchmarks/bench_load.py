@@ -0,0 +1,367 @@
+"""
+End-to-end load test of the API: latency percentiles and throughput per route
+under a mixed workload at fixed concurrency.
+
+Seeds the configured database with generated pokemon (named `load-...`, removed
+again at the end unless --keep), starts the app with uvicorn and drives it with
+--concurrency virtual users for --duration seconds. Every user picks operations
+by the weights of WORKLOAD; writes only touch pokemon created by the run.
+
+    PYTHONPATH=app python benchmarks/bench_load.py --rows 100000 --concurrency 32 \\
+        --duration 60 --output load.json
+
+Results are written as JSON. With --baseline the run is compared to an earlier
+result and the exit status is 1 if any route's p95 latency grew, or its
+throughput dropped, by more than --threshold.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import text
+
+from src.core import security
+from src.core.db.config import engine
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+EMAIL = "load-test@petal.com"
+PASSWORD = "load-test"
+
+SEED = """
+INSERT INTO pokemon (name, type_1, type_2, total, hp, attack, defense, sp_atk,
+                     sp_def, speed, generation, legendary)
+SELECT 'load-' || g || '-' || md5(g::text),
+       (ARRAY['Grass','Fire','Water','Bug','Normal','Poison'])[1 + g % 6],
+       CASE WHEN g % 3 = 0 THEN NULL ELSE 'Flying' END,
+       200 + g % 500, 1 + g % 255, 1 + g % 190, 1 + g % 230,
+       1 + g % 194, 1 + g % 230, 1 + g % 180, 1 + g % 8, g % 50 = 0
+FROM generate_series(1, :rows) AS g
+"""
+
+SORTS = [None, "name:asc", "total:desc", "attack:desc,name:asc", "generation:asc"]
+
+# relative frequency of every operation
+WORKLOAD = {
+    "login": 1,
+    "refresh": 2,
+    "get": 40,
+    "list": 30,
+    "create": 9,
+    "update": 9,
+    "delete": 9,
+}
+
+
+def payload(i: int) -> dict:
+    return {
+        "name": f"load-new-{i}",
+        "type_1": "Normal",
+        "total": 400,
+        "hp": 60,
+        "attack": 70,
+        "defense": 60,
+        "sp_atk": 70,
+        "sp_def": 60,
+        "speed": 80,
+        "generation": 1,
+        "legendary": False,
+    }
+
+
+def remove_rows():
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM pokemon WHERE name LIKE 'load-%'"))
+
+
+def seed(rows: int) -> range:
+    """
+    Returns the id range of the seeded rows.
+    """
+    remove_rows()
+    with engine.begin() as connection:
+        connection.execute(text(SEED), {"rows": rows})
+        connection.execute(text("ANALYZE pokemon"))
+        low, high = connection.execute(
+            text("SELECT min(id), max(id) FROM pokemon WHERE name LIKE 'load-%'")
+        ).one()
+        exists = connection.execute(
+            text("SELECT 1 FROM users WHERE lower(email) = :email"), {"email": EMAIL}
+        ).first()
+        if exists is None:
+            connection.execute(
+                text("INSERT INTO users (email, password) VALUES (:email, :password)"),
+                {"email": EMAIL, "password": security.hash_password(PASSWORD)},
+            )
+    return range(low, high + 1)
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, PYTHONPATH=APP_DIR)
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.core.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=APP_DIR,
+        env=env,
+    )
+
+
+async def wait_until_ready(url: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while True:
+            try:
+                if (await client.get("/metrics")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout}s")
+            await asyncio.sleep(0.2)
+
+
+class VirtualUser(object):
+    def __init__(self, client: httpx.AsyncClient, ids: range, created: List[int]):
+        self.client = client
+        self.ids = ids
+        # shared by all users, the pokemon the run may update and delete
+        self.created = created
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    async def login(self):
+        response = await self.client.post(
+            "/auth/login", data={"username": EMAIL, "password": PASSWORD}
+        )
+        if response.status_code == 200:
+            body = response.json()
+            self.access_token = body["access_token"]
+            self.refresh_token = body["refresh_token"]
+        return "POST /auth/login", response
+
+    async def refresh(self):
+        response = await self.client.post(
+            "/auth/refresh", json={"access_token": self.refresh_token}
+        )
+        return "POST /auth/refresh", response
+
+    async def get(self):
+        id = random.choice(self.ids)
+        response = await self.client.get(f"/pokemon/{id}", headers=self.headers)
+        return "GET /pokemon/{id}", response
+
+    async def list(self):
+        params = {"page": random.randint(1, 50), "pageSize": 20}
+        sort = random.choice(SORTS)
+        if sort is not None:
+            params["sort"] = sort
+        response = await self.client.get(
+            "/pokemon/", params=params, headers=self.headers
+        )
+        return "GET /pokemon/", response
+
+    async def create(self):
+        response = await self.client.post(
+            "/pokemon/", json=payload(random.getrandbits(32)), headers=self.headers
+        )
+        if response.status_code == 200:
+            self.created.append(response.json()["id"])
+        return "POST /pokemon/", response
+
+    async def update(self):
+        if not self.created:
+            return await self.create()
+        id = random.choice(self.created)
+        response = await self.client.patch(
+            f"/pokemon/{id}", json={"hp": random.randint(1, 255)}, headers=self.headers
+        )
+        return "PATCH /pokemon/{id}", response
+
+    async def delete(self):
+        if not self.created:
+            return await self.create()
+        id = self.created.pop(random.randrange(len(self.created)))
+        response = await self.client.delete(f"/pokemon/{id}", headers=self.headers)
+        return "DELETE /pokemon/{id}", response
+
+
+async def run_user(user: VirtualUser, until: float, warmup_until: float, samples):
+    await user.login()
+    operations = list(WORKLOAD)
+    weights = [WORKLOAD[name] for name in operations]
+    while time.monotonic() < until:
+        operation = random.choices(operations, weights)[0]
+        start = time.monotonic()
+        try:
+            route, response = await getattr(user, operation)()
+            error = response.status_code >= 400
+        except httpx.HTTPError:
+            route, error = operation, True
+        end = time.monotonic()
+        if start >= warmup_until:
+            samples.append((route, end - start, error))
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    # nearest rank
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list, seconds: float) -> Dict[str, Dict]:
+    by_route: Dict[str, list] = {}
+    for route, elapsed, error in samples:
+        by_route.setdefault(route, []).append((elapsed, error))
+    by_route["total"] = [(elapsed, error) for _, elapsed, error in samples]
+
+    report = {}
+    for route, results in sorted(by_route.items()):
+        latencies = sorted(elapsed * 1000 for elapsed, _ in results)
+        report[route] = {
+            "requests": len(results),
+            "errors": sum(error for _, error in results),
+            "rps": len(results) / seconds,
+            "mean_ms": sum(latencies) / len(latencies),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+        }
+    return report
+
+
+def print_report(report: Dict[str, Dict]):
+    print(
+        f"{'route':24} {'requests':>9} {'errors':>7} {'rps':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for route, r in report.items():
+        print(
+            f"{route:24} {r['requests']:>9} {r['errors']:>7} {r['rps']:>9.1f} "
+            f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+        )
+
+
+def regressions(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    found = []
+    for route, before in baseline.items():
+        after = report.get(route)
+        if after is None:
+            continue
+        if after["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            found.append(
+                f"{route}: p95 {before['p95_ms']:.2f} -> {after['p95_ms']:.2f} ms"
+            )
+        if after["rps"] < before["rps"] * (1 - threshold):
+            found.append(f"{route}: {before['rps']:.1f} -> {after['rps']:.1f} rps")
+    return found
+
+
+def commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def drive(args, ids: range) -> Dict[str, Dict]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits) as client:
+        created: List[int] = []
+        samples: list = []
+        warmup_until = time.monotonic() + args.warmup
+        until = warmup_until + args.duration
+        users = [VirtualUser(client, ids, created) for _ in range(args.concurrency)]
+        await asyncio.gather(
+            *[run_user(user, until, warmup_until, samples) for user in users]
+        )
+        for id in created:
+            await client.delete(f"/pokemon/{id}", headers=users[0].headers)
+    return summarize(samples, args.duration)
+
+
+def main(args) -> int:
+    print(f"seeding {args.rows} rows ...")
+    ids = seed(args.rows)
+
+    server = None
+    if args.url is None:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args.port, args.workers)
+    try:
+        asyncio.run(wait_until_ready(args.url))
+        print(f"{args.concurrency} users for {args.duration}s against {args.url} ...")
+        report = asyncio.run(drive(args, ids))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if not args.keep:
+            remove_rows()
+
+    print_report(report)
+    result = {
+        "meta": {
+            "started": datetime.now(tz=timezone.utc).isoformat(),
+            "commit": commit(),
+            "rows": args.rows,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers,
+            "workload": WORKLOAD,
+        },
+        "routes": report,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["routes"]
+        found = regressions(report, baseline, args.threshold)
+        for line in found:
+            print(f"REGRESSION {line}")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="Drive an already running server instead.")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded rows.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare with this earlier result.")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,97 @@
+"""
+Latency of page 1 versus page N for offset and cursor (keyset) pagination of the
+pokemon list query.
+
+Rows are generated inside a transaction that is rolled back at the end, so the
+benchmark can be pointed at a development database.
+
+    PYTHONPATH=app python benchmarks/bench_pagination.py --rows 2000000 --sort name:asc
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.api.pokemon.pagination import (
+    encode_cursor,
+    keyset_paginate,
+    paginate,
+    with_tiebreaker,
+)
+from src.core.api.pokemon.sorting import compile_sort
+from src.core.db import models
+from src.core.db.config import engine
+
+SEED = """
+INSERT INTO pokemon (name, type_1, type_2, total, hp, attack, defense, sp_atk,
+                     sp_def, speed, generation, legendary)
+SELECT 'Pokemon ' || md5(g::text),
+       (ARRAY['Grass','Fire','Water','Bug','Normal','Poison'])[1 + g % 6],
+       CASE WHEN g % 3 = 0 THEN NULL ELSE 'Flying' END,
+       200 + g % 500, 1 + g % 255, 1 + g % 190, 1 + g % 230,
+       1 + g % 194, 1 + g % 230, 1 + g % 180, 1 + g % 8, g % 50 = 0
+FROM generate_series(1, :rows) AS g
+"""
+
+
+def timed(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main(args):
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection)
+    try:
+        print(f"seeding {args.rows} rows ...")
+        connection.execute(text(SEED), {"rows": args.rows})
+        connection.execute(text("ANALYZE pokemon"))
+
+        keys = compile_sort(args.sort).keys
+        order = [c.desc() if d else c.asc() for c, d in with_tiebreaker(keys)]
+        last_page = args.rows // args.page_size
+
+        print(f"{'page':>10} {'offset ms':>12} {'cursor ms':>12}")
+        for page in (1, 10, 1000, last_page // 2, last_page):
+            query = db.query(models.Pokemon)
+            # paginate() counts pages from 0
+            offset_ms = timed(
+                lambda: paginate(query.order_by(*order), page - 1, args.page_size),
+                args.repeat,
+            )
+
+            # position the cursor on the row just before page N, outside the timing
+            cursor = None
+            if page > 1:
+                anchor = (
+                    query.order_by(*order)
+                    .offset((page - 1) * args.page_size - 1)
+                    .first()
+                )
+                cursor = encode_cursor(with_tiebreaker(keys), anchor, backwards=False)
+            cursor_ms = timed(
+                lambda: keyset_paginate(query, keys, cursor, args.page_size),
+                args.repeat,
+            )
+
+            print(f"{page:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--sort", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
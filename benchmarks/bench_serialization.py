@@ -0,0 +1,61 @@
+"""
+Per-request CPU of serializing a page of pokemon, for the ORM path the list route
+used to take (entities, schema.Pokemon validation, stdlib json) against the current
+one (column rows, dicts, orjson).
+
+Reads from the configured database. Page sizes above the number of stored pokemon
+are capped by what the table holds.
+
+    PYTHONPATH=app python benchmarks/bench_serialization.py --repeat 200
+"""
+import argparse
+import json
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from src.core.api.pokemon import serialize
+from src.core.db import models, schema
+from src.core.db.config import SessionLocal
+
+
+def orm_page(db, page_size: int) -> bytes:
+    items = db.query(models.Pokemon).order_by(models.Pokemon.id).limit(page_size)
+    content = jsonable_encoder([schema.Pokemon.from_orm(item) for item in items])
+    db.expunge_all()
+    return json.dumps(content).encode()
+
+
+def row_page(db, page_size: int) -> bytes:
+    rows = db.query(*serialize.COLUMNS).order_by(models.Pokemon.id).limit(page_size)
+    return orjson.dumps(serialize.ALL_FIELDS.dicts(rows))
+
+
+def cpu_per_call(func, db, page_size: int, repeat: int) -> float:
+    func(db, page_size)
+    start = time.process_time()
+    for _ in range(repeat):
+        func(db, page_size)
+    return (time.process_time() - start) / repeat
+
+
+def main(args):
+    db = SessionLocal()
+    try:
+        for page_size in args.page_sizes:
+            orm = cpu_per_call(orm_page, db, page_size, args.repeat)
+            rows = cpu_per_call(row_page, db, page_size, args.repeat)
+            print(
+                f"pageSize={page_size:5d}  orm: {orm * 1000:7.2f} ms  "
+                f"rows: {rows * 1000:7.2f} ms  ({orm / rows:.1f}x)"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args())
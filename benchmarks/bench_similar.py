@@ -0,0 +1,73 @@
+"""
+Latency of the similar-pokemon search over synthetic stat vectors, without a
+database: index build time, per-query time with and without filters, and the
+cost of incremental updates.
+
+    PYTHONPATH=app python benchmarks/bench_similar.py --rows 1000000
+"""
+import argparse
+import time
+
+import numpy
+
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.similar import StatVectors, normalize
+
+TYPES = ["Grass", "Fire", "Water", "Bug", "Normal", "Poison", "Electric", "Ground"]
+
+
+def rows(count: int, seed: int = 0) -> list:
+    rng = numpy.random.default_rng(seed)
+    stats = rng.integers(1, 256, size=(count, 6))
+    types = rng.integers(0, len(TYPES), size=(count, 2))
+    generations = rng.integers(1, 9, size=count)
+    return [
+        (i + 1, *map(int, stats[i]), TYPES[types[i, 0]], TYPES[types[i, 1]], int(g))
+        for i, g in enumerate(generations)
+    ]
+
+
+def per_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(args):
+    data = rows(args.rows)
+
+    start = time.perf_counter()
+    vectors = StatVectors(data)
+    elapsed = time.perf_counter() - start
+    print(f"build {args.rows} rows: {elapsed:.2f}s, {vectors.nbytes / 2**20:.1f} MiB")
+
+    queries = {
+        "by id": lambda: vectors.similar_to(args.rows // 2, args.k),
+        "by vector": lambda: vectors.search([80, 120, 70, 60, 70, 110], args.k),
+        "type1=Fire": lambda: vectors.search(
+            [80, 120, 70, 60, 70, 110], args.k, PokemonFilter(type_1=["Fire"])
+        ),
+        "generation=1,2": lambda: vectors.search(
+            [80, 120, 70, 60, 70, 110], args.k, PokemonFilter(generation=[1, 2])
+        ),
+    }
+    unit, _ = normalize([80, 120, 70, 60, 70, 110])
+    # what argpartition saves: ordering every row to keep the first k
+    queries["full argsort"] = lambda: numpy.argsort(-(vectors.vectors @ unit[0]))[
+        : args.k
+    ]
+    for name, query in queries.items():
+        print(f"{name:15s} {per_call(query, args.repeat) * 1000:8.2f} ms/query")
+
+    updates = rows(1000, seed=1)
+    elapsed = per_call(lambda: [vectors.upsert(row) for row in updates], 1)
+    print(f"upsert 1000 rows: {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
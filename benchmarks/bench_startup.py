@@ -0,0 +1,126 @@
+"""
+Import time of the application module and time to the first answered request.
+
+Every round runs in fresh processes: one that only imports `src.core.main`, and
+a uvicorn server that is polled with an authenticated GET /pokemon/1 until the
+first 200. Time to first request counts from spawning the server; the latency of
+that first request and of the one after it show what startup left for the first
+user to pay (connecting, building caches).
+
+Run it on two revisions to compare them, e.g. before and after a change to the
+startup path:
+
+    PYTHONPATH=app python benchmarks/bench_startup.py --rounds 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from src.core import auth
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import src.core.main
+print(time.perf_counter() - start)
+"""
+
+
+def environment() -> dict:
+    return dict(os.environ, PYTHONPATH=APP_DIR)
+
+
+def import_seconds() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT],
+        cwd=APP_DIR,
+        env=environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def target(args) -> list:
+    if args.factory:
+        return ["--factory", "src.core.main:create_app"]
+    return ["src.core.main:app"]
+
+
+def first_request(args, headers: dict):
+    """
+    Seconds from spawning the server to the first answered request, and the
+    latency of the first and the second request.
+    """
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", *target(args), "--port", str(args.port)],
+        cwd=APP_DIR,
+        env=environment(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{args.port}") as client:
+            while True:
+                sent = time.perf_counter()
+                try:
+                    response = client.get("/pokemon/1", headers=headers)
+                except httpx.TransportError:
+                    if time.perf_counter() - start > args.timeout:
+                        raise RuntimeError("The server did not come up")
+                    time.sleep(0.01)
+                    continue
+                answered = time.perf_counter()
+                response.raise_for_status()
+                break
+
+            second = time.perf_counter()
+            client.get("/pokemon/1", headers=headers).raise_for_status()
+            return answered - start, answered - sent, time.perf_counter() - second
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(args):
+    token = auth.create_access_token(sub=args.user)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    imports, ttfr, firsts, seconds = [], [], [], []
+    for _ in range(args.rounds):
+        imports.append(import_seconds())
+        until_first, first, second = first_request(args, headers)
+        ttfr.append(until_first)
+        firsts.append(first)
+        seconds.append(second)
+
+    for name, samples in (
+        ("import src.core.main", imports),
+        ("time to first request", ttfr),
+        ("first request", firsts),
+        ("second request", seconds),
+    ):
+        print(f"{name:24} {statistics.median(samples) * 1000:10.1f} ms (median)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--user", default="john.doe@petal.com")
+    parser.add_argument(
+        "--factory", action="store_true", help="Serve create_app() instead of app."
+    )
+    main(parser.parse_args())
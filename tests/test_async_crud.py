@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core import security
+from src.core.db import async_crud, crud, models, schema
+from src.core.db.config import AsyncSessionLocal, database_url
+from src.core.db.session import get_db
+from src.core.main import app
+
+NEW_POKEMON = schema.NewPokemon(
+    name="async-test",
+    type_1="Water",
+    total=300,
+    hp=50,
+    attack=50,
+    defense=50,
+    sp_atk=50,
+    sp_def=50,
+    speed=50,
+    generation=1,
+)
+
+
+def run(test):
+    """
+    Runs ``test(db)`` on its own loop and engine, asyncpg connections cannot be
+    shared between event loops.
+    """
+
+    async def scenario():
+        engine = create_async_engine(
+            database_url("postgresql+asyncpg"), poolclass=NullPool
+        )
+        try:
+            async with AsyncSessionLocal(bind=engine) as db:
+                return await test(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def get_or_create_user(email: str) -> models.User:
+    db = next(get_db())
+    user = crud.get_user_by_email(db, email)
+    if user is None:
+        user = models.User(email=email, password=security.hash_password("12345"))
+        db.add(user)
+        db.commit()
+    return user
+
+
+def test_async_crud_round_trip():
+    async def test(db):
+        created = await async_crud.create_pokemon(db, NEW_POKEMON)
+        # expire_on_commit=False: attributes stay readable after the commit,
+        # a lazy refresh would fail outside of the greenlet
+        assert created.id is not None
+        assert created.name == "async-test"
+
+        found = await async_crud.get_pokemon_by_id(db, created.id)
+        assert found.version == created.version
+        assert await async_crud.get_pokemon_version(db, created.id) == found.version
+
+        patched = await async_crud.patch_pokemon(
+            db, created.id, {"hp": 99}, expected_version=found.version
+        )
+        assert patched.hp == 99
+        assert patched.version == found.version + 1
+
+        with pytest.raises(crud.StaleVersion):
+            await async_crud.patch_pokemon(
+                db, created.id, {"hp": 1}, expected_version=found.version
+            )
+
+        deleted = await async_crud.delete_pokemon(db, created.id)
+        assert deleted.id == created.id
+        assert await async_crud.delete_pokemon(db, created.id) is None
+        assert await async_crud.patch_pokemon(db, created.id, {"hp": 1}) is None
+        assert await async_crud.get_pokemon_by_id(db, created.id) is None
+
+    run(test)
+
+
+def test_async_get_user_by_email_ignores_case():
+    get_or_create_user("john.doe@petal.com")
+
+    async def test(db):
+        user = await async_crud.get_user_by_email(db, "John.Doe@Petal.com")
+        assert user.email == "john.doe@petal.com"
+        assert await async_crud.get_user_by_email(db, "nobody@petal.com") is None
+
+    run(test)
+
+
+def test_user_by_email_route():
+    get_or_create_user("john.doe@petal.com")
+
+    # one loop for all requests, so pooled async connections stay usable
+    with TestClient(app) as client:
+        found = client.get("/users/email/john.doe@petal.com")
+        missing = client.get("/users/email/nobody@petal.com")
+
+    assert found.status_code == 200
+    assert found.json()["email"] == "john.doe@petal.com"
+    assert missing.status_code == 404
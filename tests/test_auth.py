@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from src.core import auth
+from src.core.cache import TTLCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+    assert cache.get("a") == 1
+
+    clock.now = 2
+    assert cache.get("b") is None
+
+    cache.set("c", 3)
+    cache.set("d", 4)
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["expirations"] == 1
+
+
+def test_verify_token_is_cached():
+    token = auth.create_access_token(sub="cache.test@petal.com")
+    hits = auth.claims_cache.hits
+
+    first = auth.JWTBearer.verify_token(token)
+    second = auth.JWTBearer.verify_token(token)
+
+    assert first == second
+    assert auth.claims_cache.hits == hits + 1
+
+
+def test_token_ttl_is_bounded_by_exp():
+    token = auth._create_token(
+        token_type="access_token",
+        lifetime=timedelta(seconds=5),
+        sub="cache.test@petal.com",
+    )
+    payload = auth.JWTBearer.verify_token(token)
+
+    assert auth._token_ttl(payload) <= 5
@@ -0,0 +1,23 @@
+from src.core.cache import TTLCache
+
+
+def test_ttl_cache_respects_byte_budget():
+    cache = TTLCache(maxsize=10, ttl=10, maxbytes=10, sizeof=len)
+
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("c", "xxxx")
+
+    assert cache.get("a") is None
+    assert cache.bytes == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_drops_reads_older_than_an_invalidation():
+    cache = TTLCache(maxsize=10, ttl=10)
+
+    generation = cache.generation
+    cache.pop(1)  # a writer invalidates while the reader is loading
+    cache.set(1, "stale", generation=generation)
+
+    assert cache.get(1) is None
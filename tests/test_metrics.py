@@ -0,0 +1,45 @@
+from src.core.db.queries import QueryStats, parameters_shape
+from src.core.metrics import Registry
+from src.core.middleware import summary_headers
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    latency = registry.histogram("latency_seconds", "Latency.", ["route"], [0.1, 1])
+    hits = registry.counter("hits_total", "Hits.", ["route"])
+
+    latency.child("/pokemon/{id}").observe(0.05)
+    latency.child("/pokemon/{id}").observe(0.5)
+    hits.child('say "hi"').inc(2)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/pokemon/{id}",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/pokemon/{id}",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/pokemon/{id}"} 2' in lines
+    assert 'hits_total{route="say \\"hi\\""} 2.0' in lines
+
+
+def test_query_stats_flag_repeated_statements():
+    stats = QueryStats()
+    stats.record("SELECT users WHERE email = %(email)s", 0.001)
+    for _ in range(3):
+        stats.record("SELECT pokemon\n WHERE id = %(id)s", 0.002)
+
+    assert stats.count == 4
+    assert stats.repeated(2) == [("SELECT pokemon\n WHERE id = %(id)s", 3)]
+
+    headers = dict(summary_headers(stats, threshold=2))
+    assert headers[b"server-timing"] == b'db;dur=7.00;desc="4 queries"'
+    assert headers[b"x-repeated-query"] == b"3x SELECT pokemon WHERE id = %(id)s"
+
+
+def test_parameters_shape_hides_values():
+    assert parameters_shape({"id": 1, "name": "x"}, many=False) == {
+        "id": "int",
+        "name": "str",
+    }
+    assert parameters_shape([(1, None), (2, None)], many=True) == {
+        "rows": 2,
+        "row": ["int", "NoneType"],
+    }
@@ -1,6 +1,12 @@
+import io
+import json
+
+import pandas
 from fastapi.testclient import TestClient
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src.core.db import crud
 from src.core.db.session import get_db
 from src.core.main import app
 from src.core import security, auth
@@ -10,16 +16,21 @@ from src.core.db.models import User
 client = TestClient(app)
 
 
+def get_or_create_user(email: str) -> User:
+    # emails are unique (case-insensitively), so reuse the user across tests
+    db: Session = next(get_db())
+    user = crud.get_user_by_email(db, email)
+    if user is None:
+        user = User(email=email, password=security.hash_password("12345"))
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    return user
+
+
 def test_get_pokemon_id_with_auth():
     # Create a test user
-    user = User(
-        email="john.doe@petal.com",
-        password=security.hash_password("12345"),
-    )
-    db: Session = next(get_db())
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = get_or_create_user("john.doe@petal.com")
 
     # Get an access token for the user
     access_token = auth.create_access_token(sub=user.email)
@@ -36,14 +47,7 @@ def test_get_pokemon_id_with_auth():
 
 def test_create_pokemon_with_auth():
     # Create a test user
-    user = User(
-        email="john.doe@petal.com",
-        password=security.hash_password("12345"),
-    )
-    db: Session = next(get_db())
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = get_or_create_user("john.doe@petal.com")
 
     # Get an access token for the user
     access_token = auth.create_access_token(sub=user.email)
@@ -95,3 +99,501 @@ def test_create_pokemon_unauthorized():
     response = client.post("/pokemon/", json=new_pokemon)
 
     assert response.status_code == 401
+
+
+def test_get_pokemon_cursor_pages():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    first = client.get("/pokemon/?pageSize=5&sort=attack:desc", headers=headers)
+    assert first.status_code == 200
+    assert len(first.json()) == 5
+    assert "X-Prev-Cursor" not in first.headers
+
+    second = client.get(
+        "/pokemon/",
+        params={
+            "pageSize": 5,
+            "sort": "attack:desc",
+            "cursor": first.headers["X-Next-Cursor"],
+        },
+        headers=headers,
+    )
+    assert second.status_code == 200
+    assert not {p["id"] for p in first.json()} & {p["id"] for p in second.json()}
+
+    back = client.get(
+        "/pokemon/",
+        params={
+            "pageSize": 5,
+            "sort": "attack:desc",
+            "cursor": second.headers["X-Prev-Cursor"],
+        },
+        headers=headers,
+    )
+    assert back.json() == first.json()
+
+
+def test_get_pokemon_cursor_rejects_other_sort():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    first = client.get("/pokemon/?pageSize=5&sort=attack:desc", headers=headers)
+    response = client.get(
+        "/pokemon/",
+        params={"sort": "name:asc", "cursor": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_pokemon_rejects_unknown_sort_field():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+
+    response = client.get(
+        "/pokemon/",
+        params={"page": 0, "sort": "__class__:asc"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_pokemon_filtered():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+
+    response = client.get(
+        "/pokemon/",
+        params={"page": 0, "type1": "Fire,Water", "speedMin": 100, "pageSize": 50},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()
+    for pokemon in response.json():
+        assert pokemon["type_1"] in ("Fire", "Water")
+        assert pokemon["speed"] >= 100
+
+
+def test_get_pokemon_id_not_modified():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    first = client.get("/pokemon/1", headers=headers)
+    assert first.status_code == 200
+
+    second = client.get(
+        "/pokemon/1", headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_get_pokemon_id_revalidates_against_the_table():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    first = client.get("/pokemon/1", headers=headers)
+
+    # a write of another worker, which does not reach this worker's cache
+    db: Session = next(get_db())
+    db.execute(text("UPDATE pokemon SET version = version + 1 WHERE id = 1"))
+    db.commit()
+
+    second = client.get(
+        "/pokemon/1", headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json()["version"] == first.json()["version"] + 1
+
+
+def test_update_pokemon_if_match_conflict():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    pokemon = client.get("/pokemon/1", headers=headers).json()
+
+    response = client.put(
+        "/pokemon/1",
+        json=pokemon,
+        headers={**headers, "If-Match": f'"1.{pokemon["version"] - 1}"'},
+    )
+
+    assert response.status_code == 412
+
+
+def paging_pokemon(type_1: str) -> dict:
+    return {
+        "name": "paging_pokemon",
+        "type_1": type_1,
+        "total": 300,
+        "hp": 50,
+        "attack": 50,
+        "defense": 50,
+        "sp_atk": 50,
+        "sp_def": 50,
+        "speed": 50,
+        "generation": 1,
+        "legendary": False,
+    }
+
+
+def test_get_pokemon_pages_and_totals():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    created = client.post(
+        "/pokemon/bulk", json=[paging_pokemon("Paging")] * 3, headers=headers
+    )
+    ids = [p["id"] for p in created.json()["items"]]
+
+    def page(number, **params):
+        return client.get(
+            "/pokemon/",
+            params={"type1": "Paging", "pageSize": 2, "page": number, **params},
+            headers=headers,
+        )
+
+    try:
+        first, last = page(0), page(1)
+        assert [len(first.json()), len(last.json())] == [2, 1]
+        assert first.headers["X-Has-Next"] == "true"
+        assert last.headers["X-Has-Next"] == "false"
+        # counting is opt-in
+        assert "X-Total-Count" not in first.headers
+        assert "X-Total-Pages" not in first.headers
+
+        counted = page(0, includeTotal="true")
+        assert counted.headers["X-Total-Count"] == "3"
+        assert counted.headers["X-Total-Pages"] == "2"
+    finally:
+        client.request("DELETE", "/pokemon/bulk", json=ids, headers=headers)
+
+
+def test_get_pokemon_totals_follow_writes():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    def total(**filters) -> int:
+        response = client.get(
+            "/pokemon/",
+            params={"pageSize": 1, "includeTotal": "true", **filters},
+            headers=headers,
+        )
+        return int(response.headers["X-Total-Count"])
+
+    # both totals are cached now
+    everything, filtered = total(), total(type1="Counted")
+
+    created = client.post("/pokemon/", json=paging_pokemon("Counted"), headers=headers)
+    id = created.json()["id"]
+    try:
+        assert total() == everything + 1
+        assert total(type1="Counted") == filtered + 1
+    finally:
+        client.delete(f"/pokemon/{id}", headers=headers)
+
+    assert total() == everything
+    assert total(type1="Counted") == filtered
+
+
+def test_bulk_create_update_delete():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    new_pokemon = {
+        "name": "bulk_pokemon",
+        "type_1": "normal",
+        "total": 500,
+        "hp": 80,
+        "attack": 90,
+        "defense": 80,
+        "sp_atk": 70,
+        "sp_def": 80,
+        "speed": 110,
+        "generation": 1,
+        "legendary": False,
+    }
+
+    created = client.post("/pokemon/bulk", json=[new_pokemon] * 3, headers=headers)
+    assert created.status_code == 200
+    ids = [p["id"] for p in created.json()["items"]]
+    assert len(ids) == 3
+
+    updated = client.put(
+        "/pokemon/bulk",
+        json=[{**new_pokemon, "id": id, "hp": 1} for id in ids + [-1]],
+        headers=headers,
+    )
+    assert updated.status_code == 200
+    assert [p["hp"] for p in updated.json()["items"]] == [1, 1, 1]
+    assert updated.json()["errors"][0]["index"] == 3
+
+    deleted = client.request("DELETE", "/pokemon/bulk", json=ids, headers=headers)
+    assert deleted.status_code == 200
+    assert deleted.json()["ids"] == sorted(ids)
+
+
+def test_export_pokemon():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    ndjson = client.get(
+        "/pokemon/export", params={"type1": "Grass", "sort": "id:asc"}, headers=headers
+    )
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert rows and all(row["type_1"] == "Grass" for row in rows)
+    assert rows[0]["name"] == "Bulbasaur"
+
+    csv = client.get(
+        "/pokemon/export",
+        params={"type1": "Grass", "sort": "id:asc", "format": "csv"},
+        headers=headers,
+    )
+    assert csv.status_code == 200
+    lines = csv.text.splitlines()
+    assert lines[0].startswith("id,name,")
+    assert len(lines) == len(rows) + 1
+
+
+def test_import_pokemon_requires_admin():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+
+    response = client.post(
+        "/pokemon/import",
+        files={"file": ("pokemon.csv", b"name\n", "text/csv")},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 401
+
+
+def test_import_pokemon_upserts_by_id():
+    access_token = auth.create_access_token(
+        sub="john.doe@petal.com", scopes=["admin"]
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    header = "id,name,type_1,total,hp,attack,defense,sp_atk,sp_def,speed,generation\n"
+    row = "{id},Imported,Normal,300,{hp},50,50,50,50,50,1\n"
+
+    def upload(*rows):
+        content = (header + "".join(rows)).encode()
+        return client.post(
+            "/pokemon/import",
+            files={"file": ("pokemon.csv", content, "text/csv")},
+            headers=headers,
+        )
+
+    try:
+        created = upload(row.format(id=900001, hp=10))
+        assert created.status_code == 200
+        assert created.json() == {"inserted": 1, "updated": 0}
+
+        updated = upload(row.format(id=900001, hp=20), row.format(id=900001, hp=30))
+        assert updated.json() == {"inserted": 0, "updated": 1}
+        response = client.get("/pokemon/900001", headers=headers)
+        assert response.json()["hp"] == 30
+
+        invalid = upload(row.format(id=900001, hp="lots"))
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"].startswith("Row 1:")
+    finally:
+        client.request("DELETE", "/pokemon/bulk", json=[900001], headers=headers)
+
+
+def test_import_pokemon_reads_parquet():
+    access_token = auth.create_access_token(
+        sub="john.doe@petal.com", scopes=["admin"]
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    frame = pandas.DataFrame(
+        [
+            {
+                "id": 900002,
+                "name": "Parquet",
+                "type_1": "Water",
+                "type_2": None,
+                "total": 300,
+                "hp": 50,
+                "attack": 50,
+                "defense": 50,
+                "sp_atk": 50,
+                "sp_def": 50,
+                "speed": 50,
+                "generation": 1,
+            }
+        ]
+    )
+    content = io.BytesIO()
+    frame.to_parquet(content)
+
+    try:
+        response = client.post(
+            "/pokemon/import",
+            params={"format": "parquet"},
+            files={"file": ("pokemon.parquet", content.getvalue())},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json() == {"inserted": 1, "updated": 0}
+
+        pokemon = client.get("/pokemon/900002", headers=headers).json()
+        assert pokemon["name"] == "Parquet"
+        assert pokemon["type_2"] is None
+    finally:
+        client.request("DELETE", "/pokemon/bulk", json=[900002], headers=headers)
+
+
+def test_patch_pokemon_writes_only_sent_fields():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    created = client.post(
+        "/pokemon/bulk",
+        json=[
+            {
+                "name": "patched_pokemon",
+                "type_1": "normal",
+                "total": 500,
+                "hp": 80,
+                "attack": 90,
+                "defense": 80,
+                "sp_atk": 70,
+                "sp_def": 80,
+                "speed": 110,
+                "generation": 1,
+            }
+        ],
+        headers=headers,
+    ).json()["items"][0]
+
+    try:
+        response = client.patch(
+            f"/pokemon/{created['id']}", json={"speed": 120}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json()["speed"] == 120
+        assert response.json()["attack"] == 90
+        assert response.json()["version"] == created["version"] + 1
+        assert response.headers["ETag"] == (
+            f'"{created["id"]}.{created["version"] + 1}"'
+        )
+
+        assert (
+            client.patch(
+                f"/pokemon/{created['id']}", json={"hp": None}, headers=headers
+            ).status_code
+            == 422
+        )
+    finally:
+        client.delete(f"/pokemon/{created['id']}", headers=headers)
+
+    assert (
+        client.patch(
+            f"/pokemon/{created['id']}", json={"speed": 1}, headers=headers
+        ).status_code
+        == 404
+    )
+
+
+def test_get_pokemon_sparse_fields():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    page = client.get(
+        "/pokemon/",
+        params={"fields": "id,name,type1", "sort": "attack:desc", "pageSize": 5},
+        headers=headers,
+    )
+    assert page.status_code == 200
+    assert [set(p) for p in page.json()] == [{"id", "name", "type_1"}] * 5
+    assert "X-Next-Cursor" in page.headers
+
+    detail = client.get("/pokemon/1", params={"fields": "name"}, headers=headers)
+    assert detail.json() == {"name": "Bulbasaur"}
+
+    unknown = client.get("/pokemon/1", params={"fields": "password"}, headers=headers)
+    assert unknown.status_code == 400
+
+
+def test_pokemon_stats_follow_writes():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    def grass_count():
+        response = client.get(
+            "/pokemon/stats", params={"groupBy": "type1"}, headers=headers
+        )
+        assert response.status_code == 200
+        groups = {g["group"]["type_1"]: g for g in response.json()}
+        return groups["Grass"]["count"]
+
+    before = grass_count()
+    created = client.post(
+        "/pokemon/",
+        json={
+            "name": "stats_pokemon",
+            "type_1": "Grass",
+            "total": 300,
+            "hp": 50,
+            "attack": 50,
+            "defense": 50,
+            "sp_atk": 50,
+            "sp_def": 50,
+            "speed": 50,
+            "generation": 1,
+        },
+        headers=headers,
+    ).json()
+    try:
+        assert grass_count() == before + 1
+    finally:
+        client.delete(f"/pokemon/{created['id']}", headers=headers)
+
+    assert grass_count() == before
+
+
+def test_similar_pokemon():
+    access_token = auth.create_access_token(sub="john.doe@petal.com")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    similar = client.get(
+        "/pokemon/1/similar", params={"k": 3, "fields": "id,name"}, headers=headers
+    )
+    assert similar.status_code == 200
+    assert len(similar.json()) == 3
+    assert all(item["pokemon"]["id"] != 1 for item in similar.json())
+    scores = [item["similarity"] for item in similar.json()]
+    assert scores == sorted(scores, reverse=True)
+
+    by_vector = client.post(
+        "/pokemon/similar",
+        params={"k": 1, "type1": "Grass"},
+        json={
+            "hp": 45,
+            "attack": 49,
+            "defense": 49,
+            "sp_atk": 65,
+            "sp_def": 65,
+            "speed": 45,
+        },
+        headers=headers,
+    )
+    assert by_vector.json()[0]["pokemon"]["name"] == "Bulbasaur"
+    assert client.get("/pokemon/0/similar", headers=headers).status_code == 404
+
+
+def test_metrics_are_labelled_by_route():
+    user = get_or_create_user("john.doe@petal.com")
+    access_token = auth.create_access_token(sub=user.email)
+    client.get("/pokemon/1", headers={"Authorization": f"Bearer {access_token}"})
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert (
+        'http_responses_total{method="GET",route="/pokemon/{id}",status="200"}'
+        in response.text
+    )
+    assert 'http_request_db_queries_count{method="GET",route="/pokemon/{id}"}' in (
+        response.text
+    )
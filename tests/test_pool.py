@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core import auth
+from src.core.db.config import database_url
+from src.core.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_stats,
+)
+from src.core.main import app
+
+# a single connection, so the second checkout has to wait and times out
+TINY_POOL = {"pool_size": 1, "max_overflow": 0, "pool_timeout": 0.2}
+
+
+def assert_one_wait_and_one_timeout(stats: dict):
+    assert stats["size"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    wait = stats["checkout_wait_seconds"]
+    assert wait["count"] == 2
+    assert wait["sum"] >= TINY_POOL["pool_timeout"]
+    assert wait["buckets"]["+Inf"] == 2
+
+
+def test_sync_pool_records_waits_and_timeouts():
+    engine = create_engine(
+        database_url(), poolclass=InstrumentedQueuePool, **TINY_POOL
+    )
+    try:
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            assert pool_stats(engine.pool)["checked_out"] == 1
+        assert_one_wait_and_one_timeout(pool_stats(engine.pool))
+    finally:
+        engine.dispose()
+
+
+def test_async_pool_records_waits_and_timeouts():
+    async def scenario():
+        engine = create_async_engine(
+            database_url("postgresql+asyncpg"),
+            poolclass=InstrumentedAsyncQueuePool,
+            **TINY_POOL,
+        )
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    await engine.connect()
+            return pool_stats(engine.sync_engine.pool)
+        finally:
+            await engine.dispose()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["class"] == "InstrumentedAsyncQueuePool"
+    assert_one_wait_and_one_timeout(stats)
+
+
+def test_db_pool_endpoint():
+    client = TestClient(app)
+    token = auth.create_access_token(sub="john.doe@petal.com", scopes=["admin"])
+
+    response = client.get(
+        "/internal/db/pool", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"sync", "async"}
+    for stats in body.values():
+        assert {
+            "class",
+            "size",
+            "checked_out",
+            "checked_in",
+            "overflow",
+            "max_overflow",
+            "timeout",
+            "checkouts",
+            "timeouts",
+        } <= set(stats)
+        assert set(stats["checkout_wait_seconds"]) == {"buckets", "sum", "count"}
+
+
+@pytest.mark.parametrize(
+    "path", ["/internal/db/pool", "/internal/cache", "/internal/slow-queries"]
+)
+def test_internal_routes_require_admin(path):
+    client = TestClient(app)
+    token = auth.create_access_token(sub="john.doe@petal.com")
+
+    response = client.get(path, headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 401
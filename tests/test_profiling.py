@@ -0,0 +1,35 @@
+import time
+
+from src.core.profiling import Profiler, _serving
+
+
+def spin(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profile_samples_the_serving_thread():
+    profiler = Profiler(interval=0.001, history=2)
+
+    profile = profiler.start("GET /pokemon", "requested")
+    spin(0.1)
+    profiler.stop(profile)
+
+    assert profile.samples > 0
+    assert "spin (" in profile.folded()
+    assert profiler.get(profile.id) is profile
+    assert profiler.profiles()[0]["route"] == "GET /pokemon"
+
+
+def test_idle_threads_are_not_sampled():
+    worker = ("/site-packages/anyio/_backends/_asyncio.py", "run", 1)
+    waiting = [worker, ("/usr/lib/python3.9/queue.py", "get", 1)]
+    working = [worker, ("/app/src/core/db/crud.py", "get_pokemon_by_id", 1)]
+    polling = [("/usr/lib/python3.9/selectors.py", "select", 1)]
+
+    assert not _serving(waiting, loop=False)
+    assert _serving(working, loop=False)
+    assert not _serving(polling, loop=True)
+    # threads that are neither the loop nor a threadpool worker
+    assert not _serving(working[1:], loop=False)
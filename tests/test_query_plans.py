@@ -0,0 +1,142 @@
+"""
+Query-plan regression suite.
+
+Seeds the local database with ``QUERY_PLAN_SCALE`` pokemon (and a tenth as many
+users) inside a transaction that is rolled back afterwards, captures the SQL the
+application generates and fails when Postgres plans a sequential scan for it.
+"""
+import os
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.pagination import keyset_paginate, paginate
+from src.core.api.pokemon.sorting import compile_sort
+from src.core.db import crud, models
+from src.core.db.config import engine
+
+SCALE = int(os.environ.get("QUERY_PLAN_SCALE", 200_000))
+
+SEED_POKEMON = """
+INSERT INTO pokemon (name, type_1, type_2, total, hp, attack, defense, sp_atk,
+                     sp_def, speed, generation, legendary)
+SELECT 'Pokemon ' || md5(g::text),
+       (ARRAY['Grass','Fire','Water','Bug','Normal','Poison'])[1 + g % 6],
+       CASE WHEN g % 3 = 0 THEN NULL ELSE 'Flying' END,
+       200 + g % 500, 1 + g % 255, 1 + g % 190, 1 + g % 230,
+       1 + g % 194, 1 + g % 230, 1 + g % 180, 1 + g % 8, g % 50 = 0
+FROM generate_series(1, :rows) AS g
+"""
+
+SEED_USERS = """
+INSERT INTO users (email, first_name, last_name, password)
+SELECT 'plan.user.' || g || '@petal.com', 'Plan', 'User', 'x'
+FROM generate_series(1, :rows) AS g
+"""
+
+
+@pytest.fixture(scope="module")
+def db():
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+
+    connection.execute(text(SEED_POKEMON), {"rows": SCALE})
+    connection.execute(text(SEED_USERS), {"rows": max(SCALE // 10, 1)})
+    connection.execute(text("ANALYZE pokemon"))
+    connection.execute(text("ANALYZE users"))
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@contextmanager
+def captured_statements(db: Session):
+    statements = []
+    connection = db.connection()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def assert_no_seq_scan(db: Session, statements):
+    assert statements, "no SQL was captured"
+    for statement, parameters in statements:
+        plan = (
+            db.connection()
+            .exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            .scalar()
+        )
+        for node in plan_nodes(plan[0]["Plan"]):
+            assert node["Node Type"] != "Seq Scan", (
+                f"sequential scan on {node.get('Relation Name')} for:\n{statement}"
+            )
+
+
+def test_user_lookup_by_email(db):
+    with captured_statements(db) as statements:
+        crud.get_user_by_email(db, "Plan.User.42@Petal.com")
+
+    assert_no_seq_scan(db, statements)
+
+
+def test_pokemon_by_id(db):
+    with captured_statements(db) as statements:
+        crud.get_pokemon_by_id(db, 42)
+
+    assert_no_seq_scan(db, statements)
+
+
+@pytest.mark.parametrize(
+    "sort",
+    [None, "name:desc", "attack:desc", "speed:asc", "total:desc", "type1:asc"],
+)
+def test_pokemon_list_pages(db, sort):
+    sort_spec = compile_sort(sort)
+    query = db.query(models.Pokemon)
+
+    with captured_statements(db) as statements:
+        paginate(query.order_by(*sort_spec.order_by), 0, 10)
+        page = keyset_paginate(query, sort_spec.keys, None, 10)
+        keyset_paginate(query, sort_spec.keys, page.next_cursor, 10)
+
+    assert_no_seq_scan(db, statements)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        PokemonFilter(type_1=["Fire"]),
+        PokemonFilter(type_2=["Flying", "Poison"]),
+        PokemonFilter(generation=[3]),
+        PokemonFilter(legendary=True),
+        PokemonFilter(type_1=["Water"], ranges={"speed": (170, None)}),
+    ],
+)
+def test_pokemon_filtered_pages(db, filters):
+    sort_spec = compile_sort(None)
+    query = filters.apply(db.query(models.Pokemon))
+
+    with captured_statements(db) as statements:
+        page = keyset_paginate(query, sort_spec.keys, None, 10)
+        keyset_paginate(query, sort_spec.keys, page.next_cursor, 10)
+
+    assert_no_seq_scan(db, statements)
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.core import auth, security
+from src.core.db import crud, models
+from src.core.db.session import get_db
+from src.core.main import app
+from src.core.security import BoundedExecutor, ExecutorSaturated
+
+client = TestClient(app)
+
+
+def blocked_executor(max_pending: int):
+    """
+    An executor with one worker and room for ``max_pending`` queued jobs; keep the
+    worker busy with ``occupy``.
+    """
+    return BoundedExecutor(max_workers=1, max_pending=max_pending, name="test")
+
+
+async def occupy(executor: BoundedExecutor, release: threading.Event):
+    blocker = asyncio.ensure_future(executor.run(release.wait))
+    while not executor.running:
+        await asyncio.sleep(0.001)
+    return blocker
+
+
+def test_bounded_executor_counts_success_and_failure():
+    executor = BoundedExecutor(max_workers=2, max_pending=4, name="test")
+
+    def fail():
+        raise ValueError("boom")
+
+    async def scenario():
+        assert await executor.run(pow, 2, 10) == 1024
+        with pytest.raises(ValueError):
+            await executor.run(fail)
+
+    asyncio.run(scenario())
+
+    stats = executor.stats()
+    assert stats["completed"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["running"] == 0
+
+
+def test_bounded_executor_rejects_beyond_the_queue():
+    executor = blocked_executor(max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocker = await occupy(executor, release)
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturated):
+            await executor.run(lambda: "rejected")
+        release.set()
+        assert await queued == "queued"
+        await blocker
+
+    asyncio.run(scenario())
+
+    stats = executor.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["max_queue_depth"] == 1
+    assert stats["queue_depth"] == 0
+
+
+def test_cancelled_jobs_leave_the_queue():
+    executor = blocked_executor(max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocker = await occupy(executor, release)
+        queued = asyncio.ensure_future(executor.run(lambda: "never"))
+        await asyncio.sleep(0)
+        assert executor.pending == 1
+
+        # e.g. the client disconnected while its login waited for a worker
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert executor.pending == 0
+        # the slot is free again
+        second = asyncio.ensure_future(executor.run(lambda: "second"))
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == "second"
+        await blocker
+
+    asyncio.run(scenario())
+
+    stats = executor.stats()
+    assert stats["cancelled"] == 1
+    assert stats["rejected"] == 0
+    assert stats["completed"] == 2
+    assert stats["queue_depth"] == 0
+
+
+def test_saturated_executor_answers_503(monkeypatch):
+    user = models.User(email="busy@petal.com", password=security.hash_password("x"))
+    monkeypatch.setattr(crud, "get_user_by_email", lambda db, email: user)
+    monkeypatch.setattr(security, "password_executor", blocked_executor(0))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(auth.authenticate_user(None, user.email, "x"))
+
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == "1"
+
+
+def test_login_checks_the_password_on_the_executor():
+    db = next(get_db())
+    email = "executor.login@petal.com"
+    if crud.get_user_by_email(db, email) is None:
+        db.add(models.User(email=email, password=security.hash_password("12345")))
+        db.commit()
+    completed = security.password_executor.completed
+
+    response = client.post("/auth/login", data={"username": email, "password": "12345"})
+    wrong = client.post("/auth/login", data={"username": email, "password": "nope"})
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert wrong.status_code == 401
+    assert security.password_executor.completed == completed + 2
+    assert security.password_executor.stats()["queue_depth"] == 0
@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.similar import SimilarityIndex, StatVectors
+
+# id, hp, attack, defense, sp_atk, sp_def, speed, type_1, type_2, generation
+ROWS = [
+    (1, 50, 50, 50, 50, 50, 50, "Normal", None, 1),
+    (2, 100, 100, 100, 100, 100, 100, "Fire", "Flying", 1),
+    (3, 10, 90, 10, 10, 10, 90, "Fire", None, 2),
+    (4, 20, 170, 20, 20, 20, 180, "Water", None, 2),
+    (5, None, 50, 50, 50, 50, 50, "Water", None, 3),
+]
+
+
+def test_similar_to_ranks_by_cosine_and_excludes_itself():
+    vectors = StatVectors(ROWS)
+
+    results = vectors.similar_to(1, k=2)
+
+    assert [id for id, _ in results] == [2, 4]
+    assert results[0][1] == pytest.approx(1.0)
+    assert [id for id, _ in vectors.similar_to(3, k=1)] == [4]
+    assert vectors.similar_to(42, k=1) is None
+    # NULL stats are never compared
+    assert vectors.similar_to(5, k=1) == []
+
+
+def test_search_with_filters():
+    vectors = StatVectors(ROWS)
+
+    fire = vectors.search([1] * 6, k=5, filters=PokemonFilter(type_1=["Fire"]))
+    assert [id for id, _ in fire] == [2, 3]
+
+    later = vectors.search([1, 9, 1, 1, 1, 9], 5, PokemonFilter(generation=[2]))
+    assert [id for id, _ in later] == [3, 4]
+
+    with pytest.raises(ValueError):
+        vectors.search([0] * 6, k=1)
+
+
+def test_upsert_and_remove_are_incremental():
+    vectors = StatVectors(ROWS[:2])
+
+    vectors.upsert((6, 10, 90, 10, 10, 10, 90, "Bug", None, 4))
+    vectors.upsert((1, 10, 90, 10, 10, 10, 91, "Normal", None, 1))
+    vectors.remove(2)
+
+    assert [id for id, _ in vectors.similar_to(6, k=5)] == [1]
+    bugs = vectors.search([1] * 6, k=5, filters=PokemonFilter(type_1=["Bug"]))
+    assert [id for id, _ in bugs] == [6]
+
+
+class BlockingIndex(SimilarityIndex):
+    """
+    Loads ROWS; once ``block`` is set, loads wait for ``release``.
+    """
+
+    def __init__(self):
+        super(BlockingIndex, self).__init__(max_age=300)
+        self.block = False
+        self.loading = threading.Event()
+        self.release = threading.Event()
+
+    def _load(self, db, ids=None):
+        if self.block:
+            self.loading.set()
+            assert self.release.wait(5)
+        return [row for row in ROWS if ids is None or row[0] in ids]
+
+
+def test_searches_do_not_wait_for_a_reload():
+    index = BlockingIndex()
+    assert [id for id, _ in index.similar_to(None, 1, k=1)] == [2]
+
+    index.block = True
+    index.changed("import", None)
+    reload = threading.Thread(target=index.similar_to, args=(None, 1, 1))
+    reload.start()
+    try:
+        assert index.loading.wait(5)
+        # answered from the loaded rows while the reload reads the table
+        assert [id for id, _ in index.similar_to(None, 1, k=1)] == [2]
+    finally:
+        index.release.set()
+        reload.join()
+    assert index.reloads == 2
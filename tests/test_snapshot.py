@@ -0,0 +1,88 @@
+import pytest
+
+from src.core.api.pokemon import snapshot
+from src.core.api.pokemon.filters import PokemonFilter
+from src.core.api.pokemon.pagination import keyset_paginate, paginate, with_tiebreaker
+from src.core.api.pokemon.serialize import COLUMNS
+from src.core.api.pokemon.sorting import compile_sort
+from src.core.db.session import get_db
+
+
+@pytest.fixture(scope="module")
+def db():
+    session = next(get_db())
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def pokemon_snapshot(db):
+    return snapshot.load(db.connection())
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+@pytest.mark.parametrize(
+    "sort", [None, "name:desc", "type2:asc,speed:desc", "legendary:desc", "hp:asc"]
+)
+@pytest.mark.parametrize(
+    "filters",
+    [
+        PokemonFilter(),
+        PokemonFilter(type_1=["Fire", "Water"]),
+        PokemonFilter(type_2=["Flying"], ranges={"speed": (90, None)}),
+        PokemonFilter(generation=[1, 3], legendary=False),
+    ],
+)
+def test_snapshot_pages_match_sql(db, pokemon_snapshot, sort, filters):
+    sort_spec = compile_sort(sort)
+    query = filters.apply(db.query(*COLUMNS))
+
+    cursor = None
+    for _ in range(3):
+        expected = keyset_paginate(query, sort_spec.keys, cursor, 7)
+        actual = pokemon_snapshot.keyset_paginate(filters, sort_spec, cursor, 7)
+        assert ids(actual.items) == ids(expected.items)
+        assert actual.next_cursor == expected.next_cursor
+        assert actual.prev_cursor == expected.prev_cursor
+        cursor = expected.next_cursor
+        if cursor is None:
+            break
+
+    if expected.prev_cursor:
+        previous = keyset_paginate(query, sort_spec.keys, expected.prev_cursor, 7)
+        actual = pokemon_snapshot.keyset_paginate(
+            filters, sort_spec, expected.prev_cursor, 7
+        )
+        assert ids(actual.items) == ids(previous.items)
+
+    assert pokemon_snapshot.count(filters) == query.count()
+
+
+def test_snapshot_offset_pages_match_sql(db, pokemon_snapshot):
+    # offset pages are only deterministic in SQL with a unique ordering
+    sort_spec = compile_sort("id:desc")
+    query = db.query(*COLUMNS).order_by(*sort_spec.order_by)
+
+    expected = paginate(query, 2, 10)
+    actual = pokemon_snapshot.paginate(PokemonFilter(), sort_spec, 2, 10)
+
+    assert ids(actual.items) == ids(expected.items)
+    assert actual.has_next == expected.has_next
+    assert [dict(i) for i in actual.items] == [dict(i._mapping) for i in expected.items]
+
+
+def test_snapshot_keeps_a_bounded_number_of_orders(pokemon_snapshot):
+    stats = ["hp", "attack", "defense", "speed", "total"]
+    sorts = [f"{a}:asc,{b}:desc" for a in stats for b in stats if a != b]
+    assert len(sorts) > snapshot.ORDER_CACHE_SIZE
+
+    for sort in sorts:
+        keys = with_tiebreaker(compile_sort(sort).keys)
+        order = pokemon_snapshot.order(keys)
+        assert len(order) == pokemon_snapshot.size
+        assert pokemon_snapshot.order(keys) is order
+
+    assert len(pokemon_snapshot._orders) == snapshot.ORDER_CACHE_SIZE
@@ -0,0 +1,19 @@
+from src.core.db import config
+from src.core.main import create_app
+
+
+def test_database_url_is_built_for_every_environment():
+    url = config.database_url("postgresql+asyncpg")
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.database == config.settings().database.db
+
+
+def test_create_app_builds_independent_apps():
+    first, second = create_app(), create_app()
+
+    assert first is not second
+    paths = {route.path for route in first.routes}
+    assert {"/pokemon/{id}", "/metrics", "/docs"} <= paths
+    assert first.openapi()["info"]["title"] == config.settings().app_name
+    assert second.openapi_schema is None
@@ -0,0 +1,116 @@
+import pandas
+import pytest
+
+from src.core.api.pokemon import stats
+
+
+def frame():
+    return pandas.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "type_1": ["Fire", "Fire", "Water", "Water"],
+            "type_2": ["Flying", None, None, None],
+            "generation": [1, 1, 1, 2],
+            "legendary": [False, False, False, True],
+            "total": [300, 500, 400, 600],
+            "hp": [10, 30, 20, 40],
+            "attack": [1, 2, 3, 4],
+            "defense": [1, 2, 3, 4],
+            "sp_atk": [1, 2, 3, 4],
+            "sp_def": [1, 2, 3, 4],
+            "speed": [1, 2, 3, 4],
+        }
+    ).set_index("id")
+
+
+def test_summarize_per_group():
+    groups = stats.summarize(frame(), ("type_1",), ("hp",), ("mean", "max", "p50"))
+
+    assert groups == [
+        {
+            "group": {"type_1": "Fire"},
+            "count": 2,
+            "stats": {"hp": {"mean": 20.0, "max": 30, "p50": 20.0}},
+        },
+        {
+            "group": {"type_1": "Water"},
+            "count": 2,
+            "stats": {"hp": {"mean": 30.0, "max": 40, "p50": 30.0}},
+        },
+    ]
+
+
+def test_summarize_keeps_null_groups_and_whole_table():
+    by_type_2 = stats.summarize(frame(), ("type_2",), ("total",), ("min",))
+    assert {g["group"]["type_2"]: g["count"] for g in by_type_2} == {
+        "Flying": 1,
+        None: 3,
+    }
+
+    (everything,) = stats.summarize(frame(), (), ("total",), ("min", "max"))
+    assert everything["count"] == 4
+    assert everything["stats"] == {"total": {"min": 300, "max": 600}}
+
+
+def test_parse_query_rejects_unknown_names():
+    assert stats.parse_query("type1", "spAtk", "p95") == (
+        ("type_1",),
+        ("sp_atk",),
+        ("p95",),
+    )
+    for query in [("name", None, None), (None, "type_1", None), (None, None, "p0")]:
+        with pytest.raises(stats.InvalidStats):
+            stats.parse_query(*query)
+
+
+class TableSummary(stats.PokemonSummary):
+    """
+    Reads ``table``, a frame like ``frame()``, instead of the database and records
+    the ids of every load (None for a full reload).
+    """
+
+    def __init__(self, table: pandas.DataFrame):
+        super(TableSummary, self).__init__(max_age=300)
+        self.table = table
+        self.loads = []
+
+    def _load(self, db, ids=None):
+        self.loads.append(None if ids is None else sorted(ids))
+        if ids is None:
+            return self.table.copy()
+        return self.table[self.table.index.isin(ids)].copy()
+
+
+def test_frame_applies_writes_without_reloading():
+    summary = TableSummary(frame())
+    assert len(summary.frame(None)) == 4
+
+    # an update, a create and a delete, as crud reports them
+    summary.table.loc[2, "hp"] = 90
+    summary.table.loc[5] = ["Grass", None, 3, False, 350, 50, 5, 5, 5, 5, 5]
+    summary.table = summary.table.drop(index=3)
+    for change, id in (("update", 2), ("create", 5), ("delete", 3)):
+        summary.changed(change, id)
+
+    refreshed = summary.frame(None)
+
+    assert summary.loads == [None, [2, 3, 5]]
+    assert (summary.reloads, summary.refreshes) == (1, 1)
+    assert sorted(refreshed.index) == [1, 2, 4, 5]
+    assert refreshed.loc[2, "hp"] == 90
+    assert refreshed.loc[5, "type_1"] == "Grass"
+
+
+def test_stats_after_a_refresh():
+    summary = TableSummary(frame())
+    (before,) = summary.stats(None, (), ("hp",), ("p50", "p90", "max"))
+    assert before["stats"]["hp"] == pytest.approx({"p50": 25.0, "p90": 37.0, "max": 40})
+
+    summary.table.loc[2, "hp"] = 100
+    summary.changed("update", 2)
+    (after,) = summary.stats(None, (), ("hp",), ("p50", "p90", "max"))
+
+    # hp is now 10, 100, 20, 40
+    assert after["count"] == 4
+    assert after["stats"]["hp"] == pytest.approx({"p50": 30.0, "p90": 82.0, "max": 100})
+    assert summary.loads == [None, [2]]